@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """
 Quick script to inspect the contents of a VAR file
-Usage: python inspect_var.py <path_to_run_directory> [var_number]
+Usage: python inspect_var.py <path_to_run_directory> [var_number] [--fast]
 Example: python inspect_var.py g:/proj/oikotie/shocktube_phase1/run_name 0
+
+--fast reads the VAR file, params, grid and dimensions with the native readers
+(src/analysis/var_reader.py) instead of pencil.read; it does not need Pencil Code.
 """
 
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add Pencil Code Python library to path
 # Adjust this path to match your setup
@@ -15,10 +19,19 @@ PENCIL_CODE_PYTHON_PATH = PLATFORM_ROOT.parent / "pencil-code" / "python"
 if str(PENCIL_CODE_PYTHON_PATH) not in sys.path:
     sys.path.insert(0, str(PENCIL_CODE_PYTHON_PATH))
 
-import pencil.read as read
 import numpy as np
 
-def inspect_var(run_path: str, var_num: int = 0):
+from src.analysis.var_reader import NativeVarReader, read_param_file
+
+
+def _native_dim(reader: NativeVarReader) -> SimpleNamespace:
+    """Dimensions of a single-processor run in the attribute names of pencil.read.dim."""
+    d = reader.dim
+    nx, ny, nz = (d[f'm{axis}'] - 2 * d[f'nghost{axis}'] for axis in 'xyz')
+    return SimpleNamespace(nx=nx, ny=ny, nz=nz, nxgrid=nx, nygrid=ny, nzgrid=nz)
+
+
+def inspect_var(run_path: str, var_num: int = 0, fast: bool = False):
     """Inspect a VAR file and show all available data."""
     run_path = Path(run_path)
     data_dir = run_path / "data"
@@ -34,21 +47,37 @@ def inspect_var(run_path: str, var_num: int = 0):
     print(f"Data directory: {proc_dir}")
     print("=" * 80)
     
-    # Read VAR file
-    print(f"\n📂 Loading {var_file}...")
-    var = read.var(var_file, datadir=str(data_dir), quiet=True, trimall=True)
-    
-    # Read params
-    print(f"📂 Loading params...")
-    params = read.param(datadir=str(data_dir), quiet=True, conflicts_quiet=True)
-    
-    # Read grid
-    print(f"📂 Loading grid...")
-    grid = read.grid(datadir=str(data_dir), quiet=True, trim=True)
-    
-    # Read dim
-    print(f"📂 Loading dim...")
-    dim = read.dim(str(data_dir), proc=-1)
+    if fast:
+        # Native readers only: no Pencil Code needed
+        print(f"\n📂 Loading {var_file} (native memory-mapped reader)...")
+        reader = NativeVarReader(data_dir)
+        var = reader.read(var_file)
+        
+        print(f"📂 Loading params (param.nml)...")
+        params = read_param_file(data_dir)
+        
+        # The VAR file holds the grid of a single-processor run
+        print(f"📂 Loading grid and dim...")
+        grid = var
+        dim = _native_dim(reader)
+    else:
+        import pencil.read as read
+        
+        # Read VAR file
+        print(f"\n📂 Loading {var_file}...")
+        var = read.var(var_file, datadir=str(data_dir), quiet=True, trimall=True)
+        
+        # Read params
+        print(f"📂 Loading params...")
+        params = read.param(datadir=str(data_dir), quiet=True, conflicts_quiet=True)
+        
+        # Read grid
+        print(f"📂 Loading grid...")
+        grid = read.grid(datadir=str(data_dir), quiet=True, trim=True)
+        
+        # Read dim
+        print(f"📂 Loading dim...")
+        dim = read.dim(str(data_dir), proc=-1)
     
     print("\n" + "=" * 80)
     print("VAR OBJECT ATTRIBUTES")
@@ -154,15 +183,18 @@ def inspect_var(run_path: str, var_num: int = 0):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python inspect_var.py <path_to_run_directory> [var_number]")
+    fast = "--fast" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--fast"]
+    
+    if len(args) < 1:
+        print("Usage: python inspect_var.py <path_to_run_directory> [var_number] [--fast]")
         print("\nFor HPC data, provide the full HPC path from your plan file:")
         print("Example: python inspect_var.py /scratch/project/oikotie/shocktube_phase1/run_name 0")
         print("\nOr you can check the path in your config:")
         print("  config/<experiment>/plan/sweep.yaml -> hpc.run_base_dir")
         sys.exit(1)
     
-    run_path = sys.argv[1]
-    var_num = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    run_path = args[0]
+    var_num = int(args[1]) if len(args) > 1 else 0
     
-    inspect_var(run_path, var_num)
+    inspect_var(run_path, var_num, fast=fast)
@@ -7,7 +7,9 @@ from loguru import logger
 
 # Import logic from the src directory
 from src.experiment.generator import run_suite
-from src.workflows.analysis_pipeline import visualize_suite, analyze_suite_videos_only, analyze_suite_with_error_norms
+from src.workflows.analysis_pipeline import visualize_suite, analyze_suite_videos_only, analyze_suite_with_error_norms, analyze_convergence
+from src.workflows.phases import PHASE_NAMES
+from src.analysis.run_cache import parse_memory_size
 from src.experiment.job_manager import submit_suite, check_suite_status, wait_for_completion, monitor_job_progress
 from src.core.constants import DIRS, FILES
 
@@ -54,7 +56,9 @@ def main():
     parser.add_argument("-a", "--analyze", action="store_true", 
                        help="Run video-only analysis: creates individual error evolution videos and overlay comparisons for branches and top performers.")
     parser.add_argument("--error-norms", action="store_true",
-                       help="Run L1/L2 error norm analysis: calculates L1, L2, L∞ metrics with combined scoring to find best parameters. Results saved to 'error_norms' subfolder.")
+                       help="Run L1/L2 error norm analysis: calculates L1, L2, L∞ metrics with combined scoring to find best parameters. Results saved to the 'error/norms' subfolder.")
+    parser.add_argument("--convergence", nargs='*', default=None, metavar="EXPERIMENT",
+                       help="Fit convergence orders vs grid spacing from the cached error norms of this experiment and any further EXPERIMENTs (e.g. the highres variant). Runs differing only in resolution are matched.")
     parser.add_argument("--viz", nargs='*', default=None,
                        help="Visualize experiment results. Usage: --viz (all runs), --viz run1 run2 (specific runs), --viz ? (interactive)")
     parser.add_argument("--var", type=str, default=None,
@@ -67,6 +71,30 @@ def main():
                        help="Monitor detailed progress of running jobs by examining log files. Shows current stage (build/start/run) and iteration counts.")
     parser.add_argument("-w", "--wait", action="store_true",
                        help="Wait for job completion. Can be combined: -mwa = submit + wait + analyze.")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                       help="Number of worker processes used to load VAR files during analysis (default: 1, serial).")
+    parser.add_argument("--run-workers", type=int, default=1, metavar="N",
+                       help="With --analyze, process up to N runs in parallel, one process each (default: 1, serial).")
+    parser.add_argument("--prefetch", type=int, default=0, metavar="N",
+                       help="With --analyze, load up to N runs ahead in the background while the current run renders (default: 0, off).")
+    parser.add_argument("--force", action="store_true",
+                       help="With --analyze or --error-norms, clear previous outputs and re-analyse every run instead of reusing unchanged ones.")
+    parser.add_argument("--phases", nargs='+', choices=PHASE_NAMES, default=None, metavar="PHASE",
+                       help=f"With --analyze, run only these phases plus the ones they depend on ({', '.join(PHASE_NAMES)}).")
+    parser.add_argument("--skip-phases", nargs='+', choices=PHASE_NAMES, default=None, metavar="PHASE",
+                       help="With --analyze, leave out these phases unless a selected phase depends on them.")
+    parser.add_argument("--max-memory", type=parse_memory_size, default=None, metavar="SIZE",
+                       help="With --analyze, keep at most SIZE (e.g. 8G; plain numbers are MB) of per-run error fields in memory; the rest is read back from error/store on demand (default: no limit).")
+    parser.add_argument("--fast-reader", action="store_true",
+                       help="Read VAR files with the native memory-mapped reader instead of pencil.read.var (single-processor runs).")
+    parser.add_argument("--var-stride", type=int, default=None, metavar="K",
+                       help="Analyze only every K-th VAR file (overrides error_analysis.var_stride).")
+    parser.add_argument("--t-min", type=float, default=None, metavar="T",
+                       help="Analyze only snapshots with t >= T (overrides error_analysis.t_min).")
+    parser.add_argument("--t-max", type=float, default=None, metavar="T",
+                       help="Analyze only snapshots with t <= T (overrides error_analysis.t_max).")
+    parser.add_argument("--max-snapshots", type=int, default=None, metavar="N",
+                       help="Analyze at most N snapshots per run, evenly spaced (overrides error_analysis.max_snapshots).")
     
     args = parser.parse_args()
     experiment_name = args.experiment_name
@@ -91,6 +119,26 @@ def main():
         except KeyboardInterrupt:
             logger.info("\nOperation cancelled."); sys.exit(0)
 
+    if args.jobs < 1:
+        logger.error("--jobs must be a positive integer."); sys.exit(1)
+    if args.run_workers < 1:
+        logger.error("--run-workers must be a positive integer."); sys.exit(1)
+    if args.skip_phases and set(args.phases or PHASE_NAMES) <= set(args.skip_phases):
+        logger.error("--skip-phases leaves no analysis phase to run."); sys.exit(1)
+    if args.prefetch < 0:
+        logger.error("--prefetch must be zero or a positive integer."); sys.exit(1)
+    if args.var_stride is not None and args.var_stride < 1:
+        logger.error("--var-stride must be a positive integer."); sys.exit(1)
+    if args.max_snapshots is not None and args.max_snapshots < 1:
+        logger.error("--max-snapshots must be a positive integer."); sys.exit(1)
+    
+    snapshot_selection = {
+        'var_stride': args.var_stride,
+        't_min': args.t_min,
+        't_max': args.t_max,
+        'max_snapshots': args.max_snapshots,
+    }
+
     if experiment_name not in available_experiments:
         logger.error(f"Experiment '{experiment_name}' not found."); sys.exit(1)
         
@@ -116,17 +164,32 @@ def main():
             # Wait + Analyze (for already-submitted job)
             if wait_for_completion(experiment_name):
                 logger.info("Job completed! Starting video-only analysis...")
-                analyze_suite_videos_only(experiment_name)
+                analyze_suite_videos_only(experiment_name, jobs=args.jobs, fast_reader=args.fast_reader,
+                                          prefetch=args.prefetch, snapshot_selection=snapshot_selection,
+                                          run_workers=args.run_workers, force=args.force,
+                                          phases=args.phases, skip_phases=args.skip_phases,
+                                          max_memory=args.max_memory)
             else:
                 logger.error("Job did not complete successfully")
                 sys.exit(1)
+        elif args.convergence is not None:
+            logger.info("--- CONVERGENCE STUDY MODE ---")
+            unknown = [name for name in args.convergence if name not in available_experiments]
+            if unknown:
+                logger.error(f"Experiment(s) not found: {', '.join(unknown)}"); sys.exit(1)
+            analyze_convergence([experiment_name, *args.convergence])
         elif args.error_norms:
             logger.info("--- L1/L2 ERROR NORM ANALYSIS MODE ---")
-            analyze_suite_with_error_norms(experiment_name)
+            analyze_suite_with_error_norms(experiment_name, jobs=args.jobs, fast_reader=args.fast_reader,
+                                           snapshot_selection=snapshot_selection, force=args.force)
         elif args.analyze and not args.wait:
             # Analyze only (standalone)
             logger.info("--- VIDEO-ONLY ANALYSIS MODE ---")
-            analyze_suite_videos_only(experiment_name, combined_video=True)
+            analyze_suite_videos_only(experiment_name, combined_video=True, jobs=args.jobs, fast_reader=args.fast_reader,
+                                      prefetch=args.prefetch, snapshot_selection=snapshot_selection,
+                                      run_workers=args.run_workers, force=args.force,
+                                      phases=args.phases, skip_phases=args.skip_phases,
+                                      max_memory=args.max_memory)
         elif args.viz is not None:
             logger.info("--- VISUALIZATION MODE ---")
             
@@ -175,7 +238,11 @@ def main():
                 # No arguments, visualize all
                 specific_runs = None
             
-            visualize_suite(experiment_name, specific_runs=specific_runs, var_selection=args.var)
+            visualize_suite(experiment_name, specific_runs=specific_runs, var_selection=args.var, jobs=args.jobs, fast_reader=args.fast_reader,
+                            prefetch=args.prefetch, snapshot_selection=snapshot_selection,
+                            run_workers=args.run_workers, force=args.force,
+                            phases=args.phases, skip_phases=args.skip_phases,
+                            max_memory=args.max_memory)
         else:
             logger.info("--- GENERATION & SUBMISSION MODE ---")
             plan_file = DIRS.config / experiment_name / DIRS.plan_subdir / FILES.plan
@@ -207,7 +274,11 @@ def main():
                     if wait_for_completion(experiment_name):
                         if args.analyze:
                             logger.info("Job completed! Starting video-only analysis...")
-                            analyze_suite_videos_only(experiment_name)
+                            analyze_suite_videos_only(experiment_name, jobs=args.jobs, fast_reader=args.fast_reader,
+                                                      prefetch=args.prefetch, snapshot_selection=snapshot_selection,
+                                                      run_workers=args.run_workers, force=args.force,
+                                                      phases=args.phases, skip_phases=args.skip_phases,
+                                                      max_memory=args.max_memory)
                         else:
                             logger.success("Job completed!")
                     else:
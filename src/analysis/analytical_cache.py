@@ -0,0 +1,176 @@
+# src/analysis/analytical_cache.py
+"""
+Suite-wide cache of analytical Sod solutions.
+
+In a parameter sweep usually only the dissipation coefficients change between
+runs; the initial state, gamma, grid and output times, and with them the
+analytical reference, are the same for every run. Solutions are therefore
+addressed by a hash of exactly the inputs they depend on:
+
+    - the left/right states, jump position and gamma derived from ``params``
+      (``src.analysis.riemann.initial_states``)
+    - the x grid
+    - the snapshot times
+
+Each distinct solution is computed once and persisted under
+``analysis/<experiment>/analytical_cache/`` in the snapshot store format; runs
+and later analyses memory-map it instead of solving again. Only the most
+recently used ``max_solutions`` solutions are held open: when the snapshot times
+differ between runs (e.g. a dt set by the swept dissipation) every run has its
+own solution, and holding all of them would grow with the suite.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from src.analysis.riemann import initial_states
+from src.analysis.snapshot_store import STORE_FIELDS, STORE_SUFFIX, read_snapshot_store, write_snapshot_store
+from src.analysis.snapshots import SnapshotSeries
+
+
+# Bump when the analytical solver changes so stale solutions are not reused
+SOLVER_VERSION = 'exact_sod-1'
+
+# Solutions held open by default; older ones are memory-mapped again on reuse
+DEFAULT_MAX_SOLUTIONS = 16
+
+
+def analytical_cache_key(params, x: np.ndarray, t: Sequence[float]) -> str:
+    """
+    Content hash of everything an analytical solution depends on.
+
+    Args:
+        params: Pencil Code params object of the run
+        x: Spatial grid, shape [X]
+        t: Snapshot times, shape [T]
+
+    Returns:
+        Hex digest identifying the solution
+    """
+    digest = hashlib.sha256(SOLVER_VERSION.encode('utf-8'))
+    digest.update(json.dumps(initial_states(params), sort_keys=True, default=float).encode('utf-8'))
+    digest.update(np.ascontiguousarray(x, dtype='<f8').tobytes())
+    digest.update(b'|')
+    digest.update(np.ascontiguousarray(t, dtype='<f8').tobytes())
+    return digest.hexdigest()
+
+
+def _store_signature(key: str, n_t: int) -> list:
+    """Snapshot store signature of a cached solution: one entry per time, tagged with the key."""
+    return [{'name': f't{i}', 'key': key} if i == 0 else {'name': f't{i}'} for i in range(n_t)]
+
+
+class AnalyticalCache:
+    """
+    In-memory and on-disk cache of analytical solutions for one suite.
+
+    Safe to share between the analysis thread and the prefetch thread.
+
+    Example:
+        >>> cache = AnalyticalCache(analysis_dir / "analytical_cache")
+        >>> ana = cache.get_or_compute(params, x, t, lambda: get_analytical_series(params, x, t))
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_solutions: int = DEFAULT_MAX_SOLUTIONS):
+        """
+        Args:
+            cache_dir: Directory for persisted solutions (None keeps them in memory only)
+            max_solutions: Number of solutions held, least recently used first out
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_solutions = max_solutions
+        self._solutions: 'OrderedDict[str, Dict[str, np.ndarray]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{STORE_SUFFIX}"
+
+    def _load(self, key: str, n_t: int) -> Optional[Dict[str, np.ndarray]]:
+        """Memory-map a persisted solution, or None if there is none."""
+        if self.cache_dir is None:
+            return None
+        store = read_snapshot_store(self._path(key), _store_signature(key, n_t))
+        if store is None:
+            return None
+        return store['fields']
+
+    def _save(self, key: str, solution: SnapshotSeries):
+        if self.cache_dir is not None:
+            signature = _store_signature(key, len(solution))
+            # Store rows under the signature names; the VAR file names belong to the run
+            rows = SnapshotSeries(x=solution.x, t=solution.t, fields=solution.fields,
+                                  var_files=[entry['name'] for entry in signature])
+            write_snapshot_store(self._path(key), rows, signature)
+
+    def get_or_compute(self, params, x: np.ndarray, t: Sequence[float],
+                       compute: Callable[[], Optional[SnapshotSeries]],
+                       var_files: Optional[list] = None) -> Optional[SnapshotSeries]:
+        """
+        Return the analytical solution for (params, x, t), computing it only once.
+
+        Args:
+            params: Pencil Code params object of the run
+            x: Spatial grid, shape [X]
+            t: Snapshot times, shape [T]
+            compute: Called on a cache miss; returns the solution as a ``SnapshotSeries``
+                (or None on failure, which is not cached)
+            var_files: VAR file names of the returned series
+
+        Returns:
+            ``SnapshotSeries`` on the grid ``x`` with read-only [T, X] fields, or None
+        """
+        key = analytical_cache_key(params, x, t)
+
+        n_t = len(np.atleast_1d(t))
+        with self._lock:
+            fields = self._solutions.get(key)
+            if fields is not None:
+                self._solutions.move_to_end(key)
+        if fields is None:
+            fields = self._load(key, n_t)
+            if fields is None:
+                solution = compute()
+                if solution is None:
+                    return None
+                self._save(key, solution)
+                # Hold the memory-mapped copy rather than the computed arrays
+                fields = self._load(key, n_t)
+                if fields is None:
+                    fields = {var: solution.fields[var] for var in STORE_FIELDS if var in solution.fields}
+                    for values in fields.values():
+                        values.flags.writeable = False
+                hit = False
+            else:
+                logger.debug(f"Analytical solution {key[:12]} loaded from {self.cache_dir}")
+                hit = True
+            with self._lock:
+                fields = self._solutions.setdefault(key, fields)
+                self._solutions.move_to_end(key)
+                while len(self._solutions) > self.max_solutions:
+                    self._solutions.popitem(last=False)
+        else:
+            hit = True
+
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return SnapshotSeries(x=x, t=t, fields=fields, var_files=var_files)
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def __repr__(self) -> str:
+        return (f"AnalyticalCache(solutions={len(self)}, hits={self.hits}, misses={self.misses}, "
+                f"cache_dir={self.cache_dir})")
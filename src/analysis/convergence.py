@@ -0,0 +1,269 @@
+# src/analysis/convergence.py
+"""
+Convergence study across resolutions, built from cached error norms.
+
+The error-norm summaries written by ``--error-norms`` and ``--analyze``
+(``{experiment}_error_norms_summary.json``) hold the time-averaged norm of every
+variable and metric for each run, together with its grid spacing. Runs whose
+names differ only in the resolution token (``res400`` vs ``res100000``) have
+the same physics parameters; across one or more experiments they form a
+resolution ladder. The convergence order of every ladder, variable and metric
+is fitted in one batched least-squares call (``calculate_convergence_rates``),
+so no VAR file is read again.
+
+Example:
+    >>> records = []
+    >>> for exp in ['shocktube_phase1', 'shocktube_phase1_highres']:
+    ...     records += load_norm_records(find_error_norms_summary(DIRS.root / 'analysis' / exp, exp), exp)
+    >>> study = convergence_study(records)
+    >>> study['rate'][k, v, m]     # order of ladder k, variable v, metric m
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from src.analysis.metrics import calculate_convergence_rates
+
+
+# Resolution token in run names (output_prefix 'res{{ data.nxgrid }}_...')
+RESOLUTION_PATTERN = re.compile(r'res(\d+)')
+
+SUMMARY_SUFFIX = '_error_norms_summary.json'
+
+
+def find_error_norms_summary(analysis_dir: Path, experiment_name: str) -> Optional[Path]:
+    """
+    Locate the newest error-norm summary of an experiment.
+
+    Both ``--analyze`` and ``--error-norms`` write it to ``error/norms/``; older
+    ``--error-norms`` runs wrote it to ``error_norms/``.
+
+    Returns:
+        Path of the summary JSON, or None if the experiment has not been analysed
+    """
+    candidates = [analysis_dir / 'error' / 'norms' / f"{experiment_name}{SUMMARY_SUFFIX}",
+                  analysis_dir / 'error_norms' / f"{experiment_name}{SUMMARY_SUFFIX}"]
+    existing = [path for path in candidates if path.exists()]
+    return max(existing, key=lambda path: path.stat().st_mtime) if existing else None
+
+
+def physics_key(run_name: str) -> str:
+    """Run name with its resolution replaced by '*', shared by runs with the same physics."""
+    return RESOLUTION_PATTERN.sub('res*', run_name, count=1)
+
+
+def load_norm_records(summary_file: Path, experiment_name: str) -> List[Dict]:
+    """
+    Read the per-run error norms of an error-norm summary.
+
+    Summaries written before per-variable norms were recorded only hold the
+    density scores; they are read as norms of 'rho'.
+
+    Args:
+        summary_file: Path from ``find_error_norms_summary``
+        experiment_name: Experiment the summary belongs to
+
+    Returns:
+        List of records with 'experiment', 'run_name', 'branch', 'key'
+        (``physics_key``), 'dx' (None if not recorded), 'nx' (None if unknown)
+        and 'norms' ({var: {metric: time-averaged norm}})
+    """
+    with open(summary_file, 'r') as f:
+        summary = json.load(f)
+
+    records = []
+    for run_name, scores in summary.get('detailed_scores', {}).items():
+        norms = scores.get('variable_norms') or {'rho': scores.get('per_metric_scores', {})}
+        nx = scores.get('nx')
+        if nx is None:
+            match = RESOLUTION_PATTERN.search(run_name)
+            nx = int(match.group(1)) if match else None
+        records.append({
+            'experiment': experiment_name,
+            'run_name': run_name,
+            'branch': scores.get('branch'),
+            'key': physics_key(run_name),
+            'dx': scores.get('dx'),
+            'nx': nx,
+            'norms': norms,
+        })
+
+    logger.debug(f"Read error norms of {len(records)} runs from {summary_file}")
+    return records
+
+
+def _ladder_spacings(ladder: List[Dict]) -> Optional[List[float]]:
+    """Grid spacings of a ladder: recorded dx, else 1/nx (only ratios enter the fitted order)."""
+    if all(record['dx'] is not None for record in ladder):
+        return [float(record['dx']) for record in ladder]
+    if all(record['nx'] for record in ladder):
+        return [1.0 / record['nx'] for record in ladder]
+    return None
+
+
+def build_ladders(records: List[Dict]) -> Dict[str, Dict]:
+    """
+    Group runs with identical physics into resolution ladders.
+
+    Returns:
+        Dictionary mapping physics keys to {'runs': records ordered from coarse to
+        fine, 'dx': grid spacings}; keys with fewer than two resolutions are dropped
+    """
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record['key'], []).append(record)
+
+    ladders = {}
+    for key, group in grouped.items():
+        spacings = _ladder_spacings(group)
+        if spacings is None:
+            logger.warning(f"No grid spacing for the runs of {key}, skipped")
+            continue
+
+        # One run per resolution; a later experiment overrides an earlier one
+        by_dx = {}
+        for dx, record in zip(spacings, group):
+            if dx in by_dx:
+                logger.warning(f"{record['run_name']} ({record['experiment']}) replaces "
+                               f"{by_dx[dx][1]['run_name']} ({by_dx[dx][1]['experiment']}) at dx={dx:.3e}")
+            by_dx[dx] = (dx, record)
+
+        if len(by_dx) < 2:
+            continue
+        ordered = sorted(by_dx.values(), key=lambda item: -item[0])
+        ladders[key] = {'runs': [record for _, record in ordered], 'dx': [dx for dx, _ in ordered]}
+
+    return ladders
+
+
+def _ordered_union(lists) -> List[str]:
+    return list(dict.fromkeys(item for items in lists for item in items))
+
+
+def convergence_study(records: List[Dict], variables: Sequence[str] = None,
+                      metrics: Sequence[str] = None) -> Dict:
+    """
+    Fit convergence orders for all resolution ladders, variables and metrics at once.
+
+    The time-averaged norms are gathered into one [ladder, variable, metric,
+    resolution] array (NaN-padded for shorter ladders or missing norms) and
+    fitted against log(dx) in a single ``calculate_convergence_rates`` call.
+
+    Args:
+        records: Records from ``load_norm_records`` (any number of experiments)
+        variables: Variables to fit (default: all recorded)
+        metrics: Metrics to fit (default: all recorded)
+
+    Returns:
+        Dictionary with 'keys', 'variables', 'metrics', 'ladders' (from
+        ``build_ladders``), 'dx' [K, R], 'errors' [K, V, M, R] and the fit arrays
+        'rate', 'intercept', 'r_squared', 'n_points' of shape [K, V, M]
+    """
+    ladders = build_ladders(records)
+    keys = sorted(ladders)
+    runs = [record for key in keys for record in ladders[key]['runs']]
+    if variables is None:
+        variables = _ordered_union(record['norms'] for record in runs)
+    if metrics is None:
+        metrics = _ordered_union(norms.keys() for record in runs for norms in record['norms'].values())
+    variables, metrics = list(variables), list(metrics)
+
+    n_resolutions = max((len(ladders[key]['dx']) for key in keys), default=0)
+    dx = np.full((len(keys), n_resolutions), np.nan)
+    errors = np.full((len(keys), len(variables), len(metrics), n_resolutions), np.nan)
+
+    for k, key in enumerate(keys):
+        ladder = ladders[key]
+        dx[k, :len(ladder['dx'])] = ladder['dx']
+        for r, record in enumerate(ladder['runs']):
+            for v, var in enumerate(variables):
+                for m, metric in enumerate(metrics):
+                    value = record['norms'].get(var, {}).get(metric)
+                    if value is not None:
+                        errors[k, v, m, r] = value
+
+    fits = calculate_convergence_rates(errors, dx[:, None, None, :])
+
+    logger.info(f"Fitted convergence orders of {len(keys)} ladders x {len(variables)} variables "
+                f"x {len(metrics)} metrics")
+    return {
+        'keys': keys,
+        'variables': variables,
+        'metrics': metrics,
+        'ladders': ladders,
+        'dx': dx,
+        'errors': errors,
+        **fits,
+    }
+
+
+def convergence_table(study: Dict) -> pd.DataFrame:
+    """
+    Flatten a convergence study into one row per ladder, variable and metric.
+
+    Columns: physics, branch, variable, metric, order, r_squared, n_points,
+    dx_coarse, dx_fine, error_coarse, error_fine, runs
+    """
+    rows = []
+    for k, key in enumerate(study['keys']):
+        ladder = study['ladders'][key]
+        n = len(ladder['dx'])
+        for v, var in enumerate(study['variables']):
+            for m, metric in enumerate(study['metrics']):
+                errors = study['errors'][k, v, m, :n]
+                rows.append({
+                    'physics': key,
+                    'branch': ladder['runs'][0]['branch'],
+                    'variable': var,
+                    'metric': metric,
+                    'order': study['rate'][k, v, m],
+                    'r_squared': study['r_squared'][k, v, m],
+                    'n_points': int(study['n_points'][k, v, m]),
+                    'dx_coarse': ladder['dx'][0],
+                    'dx_fine': ladder['dx'][-1],
+                    'error_coarse': errors[0],
+                    'error_fine': errors[-1],
+                    'runs': ' | '.join(f"{record['experiment']}/{record['run_name']}" for record in ladder['runs']),
+                })
+
+    return pd.DataFrame(rows)
+
+
+def save_convergence_table(study: Dict, output_dir: Path, name: str) -> Dict[str, Path]:
+    """
+    Write the convergence table as CSV and Markdown.
+
+    Returns:
+        Dictionary with the 'csv' and 'markdown' paths
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    table = convergence_table(study)
+
+    csv_file = output_dir / f"{name}_convergence.csv"
+    table.to_csv(csv_file, index=False)
+
+    md_file = output_dir / f"{name}_convergence.md"
+    with open(md_file, 'w') as f:
+        f.write(f"# Convergence Study: {name}\n\n")
+        f.write(f"**Resolution ladders**: {len(study['keys'])}\n\n")
+        for metric in study['metrics']:
+            f.write(f"## {metric.upper()}\n\n")
+            f.write("| Physics | " + " | ".join(study['variables']) + " | Resolutions |\n")
+            f.write("|---|" + "---|" * len(study['variables']) + "---|\n")
+            rows = table[table['metric'] == metric]
+            for key in study['keys']:
+                key_rows = rows[rows['physics'] == key].set_index('variable')
+                orders = [f"{key_rows.at[var, 'order']:.2f}" if np.isfinite(key_rows.at[var, 'order']) else "–"
+                          for var in study['variables']]
+                f.write(f"| {key} | " + " | ".join(orders) + f" | {len(study['ladders'][key]['dx'])} |\n")
+            f.write("\n")
+
+    logger.info(f"       ├─ Saved convergence table to {csv_file.name}")
+    logger.info(f"       └─ Saved Markdown report to {md_file.name}")
+    return {'csv': csv_file, 'markdown': md_file}
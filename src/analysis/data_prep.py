@@ -9,9 +9,11 @@ the main pipeline and interactive notebooks for visualization purposes.
 import numpy as np
 from pathlib import Path
 from loguru import logger
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import json
 
+from src.analysis.quantiles import DEFAULT_PERCENTILES, QuantileSketch, exact_statistics
+
 
 def prepare_spacetime_error_data(
     normalized_errors: Dict,
@@ -119,6 +121,23 @@ def prepare_multi_run_spacetime_data(
     return multi_run_data
 
 
+def _json_matrix(matrix: np.ndarray) -> list:
+    """
+    Nested lists of an error matrix for JSON.
+    
+    float32 matrices are written with their shortest float32 representation
+    ('0.1' rather than '0.10000000149011612'), so the file shrinks with them.
+    They are converted one row at a time, since the string array of a whole
+    matrix is 32 times its size.
+    """
+    matrix = np.asarray(matrix)
+    if matrix.dtype == np.float32 and matrix.ndim > 1:
+        return [_json_matrix(row) for row in matrix]
+    if matrix.dtype == np.float32:
+        return matrix.astype(str).astype(np.float64).tolist()
+    return matrix.tolist()
+
+
 def export_spacetime_data_to_json(
     prepared_data: Dict,
     output_path: Path,
@@ -144,7 +163,8 @@ def export_spacetime_data_to_json(
         'unit_length': float(prepared_data['unit_length']),
         'x_coords': prepared_data['x_coords'].tolist(),
         'timesteps': [float(t) for t in prepared_data['timesteps']],
-        'error_matrix': prepared_data['error_matrix'].tolist(),
+        'error_matrix': _json_matrix(prepared_data['error_matrix']),
+        'dtype': str(np.asarray(prepared_data['error_matrix']).dtype),
         'max_error': {
             k: float(v) if isinstance(v, (int, float, np.integer, np.floating)) else v
             for k, v in prepared_data['max_error'].items()
@@ -176,35 +196,39 @@ def load_spacetime_data_from_json(json_path: Path) -> Dict:
     # Convert lists back to numpy arrays
     json_data['x_coords'] = np.array(json_data['x_coords'])
     json_data['timesteps'] = json_data['timesteps']
-    json_data['error_matrix'] = np.array(json_data['error_matrix'])
+    json_data['error_matrix'] = np.array(json_data['error_matrix'], dtype=json_data.get('dtype', 'float64'))
     
     return json_data
 
 
-def get_error_statistics(error_matrix: np.ndarray) -> Dict:
+def get_error_statistics(
+    error_matrix: np.ndarray,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    streaming: bool = False,
+    relative_accuracy: float = 0.01
+) -> Dict:
     """
     Calculate statistics for error matrix.
     
+    The exact statistics take a single percentile pass over the finite errors.
+    With ``streaming=True`` the matrix is read one timestep at a time into a
+    ``QuantileSketch``, which suits memory-mapped matrices that do not fit in
+    memory; min, max, mean and std stay exact, the median and percentiles are
+    within ``relative_accuracy`` of the true values.
+    
     Args:
         error_matrix: 2D error field [time, space]
+        percentiles: Percentiles to report (keys 'p10', 'p25', ...)
+        streaming: Estimate the percentiles with a streaming sketch
+        relative_accuracy: Relative accuracy of the streamed percentiles
         
     Returns:
         Dictionary with statistics
     """
-    valid_errors = error_matrix[np.isfinite(error_matrix)]
+    if not streaming:
+        return exact_statistics(error_matrix, percentiles)
     
-    return {
-        'min': float(np.min(valid_errors)) if len(valid_errors) > 0 else 0.0,
-        'max': float(np.max(valid_errors)) if len(valid_errors) > 0 else 0.0,
-        'mean': float(np.mean(valid_errors)) if len(valid_errors) > 0 else 0.0,
-        'median': float(np.median(valid_errors)) if len(valid_errors) > 0 else 0.0,
-        'std': float(np.std(valid_errors)) if len(valid_errors) > 0 else 0.0,
-        'percentiles': {
-            'p10': float(np.percentile(valid_errors, 10)) if len(valid_errors) > 0 else 0.0,
-            'p25': float(np.percentile(valid_errors, 25)) if len(valid_errors) > 0 else 0.0,
-            'p75': float(np.percentile(valid_errors, 75)) if len(valid_errors) > 0 else 0.0,
-            'p90': float(np.percentile(valid_errors, 90)) if len(valid_errors) > 0 else 0.0,
-            'p95': float(np.percentile(valid_errors, 95)) if len(valid_errors) > 0 else 0.0,
-            'p99': float(np.percentile(valid_errors, 99)) if len(valid_errors) > 0 else 0.0
-        }
-    }
+    sketch = QuantileSketch(relative_accuracy)
+    for row in error_matrix:
+        sketch.update(row)
+    return sketch.statistics(percentiles)
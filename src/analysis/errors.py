@@ -9,23 +9,267 @@ import json
 from typing import Dict, List, Tuple, Optional
 import seaborn as sns
 
-from src.analysis.metrics import METRIC_REGISTRY, calculate_error, calculate_all_errors
+from src.analysis.metrics import METRIC_REGISTRY, calculate_error, calculate_all_errors, calculate_errors_over_time
+from src.analysis.snapshots import SnapshotSeries
+from src.analysis.riemann import wave_positions
+from src.analysis import kernels
+
+
+def _stacked_pair(sim_data, analytical_data, var: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Return the [T, X] arrays of a variable if both inputs are SnapshotSeries holding it.
+    
+    Error functions use this to replace their per-snapshot loop by one array
+    expression; for lists of dicts it returns None and the loop is used.
+    """
+    if not (isinstance(sim_data, SnapshotSeries) and isinstance(analytical_data, SnapshotSeries)):
+        return None
+    if var not in sim_data.fields or var not in analytical_data.fields:
+        return None
+    sim, ana = sim_data.fields[var], analytical_data.fields[var]
+    return (sim, ana) if sim.shape == ana.shape else None
+
+
+def _pointwise_error(sim: np.ndarray, ana: np.ndarray, error_method: str) -> np.ndarray:
+    """Point-by-point error between simulation and analytical arrays of any shape."""
+    if error_method == 'absolute':
+        return np.abs(sim - ana)
+    elif error_method == 'relative':
+        # Avoid division by zero
+        analytical_safe = np.where(np.abs(ana) < 1e-10, 1e-10, ana)
+        return np.abs(sim - ana) / np.abs(analytical_safe)
+    elif error_method == 'difference':
+        return sim - ana
+    elif error_method == 'squared':
+        return (sim - ana)**2
+    else:
+        logger.warning(f"Unknown error method '{error_method}', using 'absolute'")
+        return np.abs(sim - ana)
+
+
+# Waves around which ROI error norms are evaluated, and the default margin in cells
+ROI_WAVES = ('rarefaction', 'contact', 'shock')
+ROI_HALF_WIDTH = 8
+
+
+def roi_windows(x: np.ndarray, t, params, half_width: int = ROI_HALF_WIDTH,
+                waves=ROI_WAVES) -> List[List[slice]]:
+    """
+    Index windows around the analytical waves of each snapshot.
+
+    The wave positions follow in closed form from the Riemann solution
+    (``wave_positions``). Each wave (the whole fan for a rarefaction) plus
+    ``half_width`` cells on either side, clipped to the grid, is covered;
+    overlapping windows (e.g. all waves at t=0) are merged, so no cell is
+    counted twice.
+
+    Args:
+        x: Spatial grid, shape [X]
+        t: Snapshot times, shape [T]
+        params: Pencil Code params object of the run
+        half_width: Margin around each wave in cells
+        waves: Waves to include ('rarefaction', 'contact', 'shock')
+
+    Returns:
+        Per snapshot, a sorted list of disjoint slices into the grid
+    """
+    x = np.asarray(x).ravel()
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+    windows = [[] for _ in range(t.size)]
+
+    for name, (lo, hi) in wave_positions(params, t).items():
+        # 'shock_left' and 'shock_right' are both shocks
+        if name.split('_')[0] not in waves:
+            continue
+        starts = np.clip(np.searchsorted(x, lo, side='left') - half_width, 0, x.size)
+        stops = np.clip(np.searchsorted(x, hi, side='right') + half_width, 0, x.size)
+        for snapshot_windows, start, stop in zip(windows, starts, stops):
+            if stop > start:
+                snapshot_windows.append(slice(int(start), int(stop)))
+
+    return [_merge_windows(snapshot_windows) for snapshot_windows in windows]
+
+
+def _merge_windows(windows: List[slice]) -> List[slice]:
+    """Sorted, disjoint slices covering the union of the given ones."""
+    merged = []
+    for window in sorted(windows, key=lambda window: window.start):
+        if merged and window.start <= merged[-1].stop:
+            merged[-1] = slice(merged[-1].start, max(merged[-1].stop, window.stop))
+        else:
+            merged.append(window)
+    return merged
+
+
+def _roi_params(params):
+    if params is None:
+        raise ValueError("ROI error norms need the params of the run to locate the waves")
+    return params
+
+
+# How the values of a built-in metric on disjoint windows combine into its value
+# on their union: means weighted by the cells of each window, root mean squares
+# through their mean squares, maxima by the maximum
+_ROI_REDUCTIONS = {
+    'l1': 'mean', 'relative_l1': 'mean', 'mape': 'mean',
+    'l2': 'rms', 'relative_l2': 'rms',
+    'linf': 'max',
+}
+
+
+def _roi_norm(sim: np.ndarray, ana: np.ndarray, windows: List[slice], metric: str) -> float:
+    """
+    One metric over the union of the disjoint wave windows of a snapshot.
+
+    Built-in metrics are evaluated on views of each window and combined
+    (``_ROI_REDUCTIONS``); custom metrics on a copy of the cells of the union.
+    """
+    if not windows:
+        return np.nan
+    reduction = _ROI_REDUCTIONS.get(metric)
+    if reduction is None or METRIC_REGISTRY.get(metric) is not _BUILTIN_METRICS.get(metric):
+        cells = np.r_[tuple(windows)]
+        return float(calculate_error(sim[cells], ana[cells], metric=metric))
+
+    values = np.array([calculate_error(sim[window], ana[window], metric=metric) for window in windows],
+                      dtype=np.float64)
+    if reduction == 'max':
+        return float(np.max(values))
+    weights = np.array([window.stop - window.start for window in windows], dtype=np.float64)
+    if reduction == 'rms':
+        return float(np.sqrt(np.sum(weights * values**2) / np.sum(weights)))
+    return float(np.sum(weights * values) / np.sum(weights))
+
+
+def _summarize_norms(errors_per_timestep, timesteps, var_files) -> Dict:
+    """Summary entry of one metric of one variable, as in ``calculate_error_norms``."""
+    valid_errors = [e for e in errors_per_timestep if np.isfinite(e)]
+    
+    return {
+        'per_timestep': list(errors_per_timestep),
+        'mean': np.mean(valid_errors) if valid_errors else np.nan,
+        'max': np.max(valid_errors) if valid_errors else np.nan,
+        'min': np.min(valid_errors) if valid_errors else np.nan,
+        'std': np.std(valid_errors) if valid_errors else np.nan,
+        'timesteps': list(timesteps),
+        'var_files': list(var_files)
+    }
+
+
+class ErrorNormAccumulator:
+    """
+    Online reducer for per-timestep error norms.
+    
+    Snapshots are fed one (simulation, analytical) pair at a time, so error norms
+    can be computed for a whole run while only a single snapshot pair is in memory.
+    Only the scalar per-timestep norms are retained. With ``roi`` set, each norm
+    is only evaluated over the cells of the windows around the analytical waves
+    (see ``roi_windows``).
+    
+    Example:
+        >>> accumulator = ErrorNormAccumulator(metrics=['l1', 'l2', 'linf'])
+        >>> for sim_data, analytical_data in iter_snapshot_pairs(run_path):
+        ...     accumulator.update(sim_data, analytical_data)
+        >>> error_norms = accumulator.result()
+    """
+    
+    def __init__(self, variables: List[str] = ['rho', 'ux', 'pp', 'ee'],
+                 metrics: List[str] = None, roi: Optional[Dict] = None):
+        """
+        Args:
+            variables: List of variable names to analyze
+            metrics: List of metric names to calculate (default: ['l1', 'l2'])
+            roi: Keyword arguments of ``roi_windows`` ('half_width', 'waves') to
+                evaluate the norms around the waves only; None for the whole domain
+        """
+        self.variables = list(variables)
+        self.metrics = list(metrics) if metrics is not None else ['l1', 'l2']
+        self.roi = roi
+        self.n_timesteps = 0
+        
+        # Per variable: per-metric error lists plus the timestep/VAR file of each entry
+        self._errors = {var: {metric: [] for metric in self.metrics} for var in self.variables}
+        self._timesteps = {var: [] for var in self.variables}
+        self._var_files = {var: [] for var in self.variables}
+    
+    def update(self, sim_data: dict, analytical_data: dict):
+        """
+        Add the error norms of one snapshot pair.
+        
+        Args:
+            sim_data: Simulation data dictionary of one VAR file
+            analytical_data: Corresponding analytical solution
+        """
+        idx = self.n_timesteps
+        self.n_timesteps += 1
+        windows = None
+        if self.roi is not None:
+            windows = roi_windows(sim_data['x'], sim_data['t'], _roi_params(sim_data.get('params')), **self.roi)[0]
+        
+        for var in self.variables:
+            if var not in sim_data or var not in analytical_data:
+                continue
+            
+            for metric in self.metrics:
+                try:
+                    if windows is not None:
+                        error_val = _roi_norm(sim_data[var], analytical_data[var], windows, metric)
+                    else:
+                        error_val = calculate_error(sim_data[var], analytical_data[var], metric=metric)
+                except Exception as e:
+                    logger.warning(f"Failed to calculate {metric} for {var}: {e}")
+                    error_val = np.nan
+                self._errors[var][metric].append(error_val)
+            
+            self._timesteps[var].append(sim_data['t'])
+            self._var_files[var].append(sim_data.get('var_file', f'VAR{idx}'))
+    
+    def result(self) -> Dict:
+        """
+        Summarise the accumulated norms.
+        
+        Returns:
+            Dictionary with the same structure as ``calculate_error_norms``
+        """
+        error_norms = {}
+        
+        for var in self.variables:
+            error_norms[var] = {}
+            
+            for metric in self.metrics:
+                errors_per_timestep = self._errors[var][metric]
+                if not errors_per_timestep:
+                    continue
+                
+                error_norms[var][metric] = _summarize_norms(errors_per_timestep, self._timesteps[var],
+                                                            self._var_files[var])
+        
+        return error_norms
 
 
 def calculate_error_norms(sim_data_list: List[dict], analytical_data_list: List[dict],
                          variables: List[str] = ['rho', 'ux', 'pp', 'ee'],
-                         metrics: List[str] = None) -> Dict:
+                         metrics: List[str] = None, roi: Optional[Dict] = None) -> Dict:
     """
     Calculate L1, L2, and other error norms between numerical and analytical solutions.
     
     This function uses the modular error metric system to calculate various error norms
-    as described in Gent et al. (2018) for convergence analysis.
+    as described in Gent et al. (2018) for convergence analysis. If both inputs are
+    ``SnapshotSeries``, each metric is evaluated for all timesteps of a variable in
+    one batched registry call. For runs that are too large to hold in memory, feed
+    snapshots to ``ErrorNormAccumulator`` instead.
+    
+    With ``roi`` set, errors are only evaluated on views of windows around the
+    analytical waves and each norm is taken over the cells of all windows
+    (``roi_windows``).
     
     Args:
         sim_data_list: List of simulation data dictionaries from all VAR files
         analytical_data_list: List of corresponding analytical solutions
         variables: List of variable names to analyze
         metrics: List of metric names to calculate (default: ['l1', 'l2'])
+        roi: Keyword arguments of ``roi_windows`` ('half_width', 'waves'), or None
+            for norms over the whole domain
         
     Returns:
         Dictionary containing error norms for each variable across all timesteps
@@ -56,37 +300,33 @@ def calculate_error_norms(sim_data_list: List[dict], analytical_data_list: List[
     
     logger.debug(f"Calculating error norms ({', '.join(metrics)}) for {len(sim_data_list)} timesteps")
     
-    error_norms = {}
-    
-    for var in variables:
-        error_norms[var] = {}
+    if isinstance(sim_data_list, SnapshotSeries) and isinstance(analytical_data_list, SnapshotSeries):
+        windows = None
+        if roi is not None and len(sim_data_list):
+            windows = roi_windows(sim_data_list.x, sim_data_list.t, _roi_params(sim_data_list.params), **roi)
         
-        for metric in metrics:
-            errors_per_timestep = []
-            
-            for sim_data, analytical_data in zip(sim_data_list, analytical_data_list):
-                if var in sim_data and var in analytical_data:
-                    try:
-                        error_val = calculate_error(sim_data[var], analytical_data[var], metric=metric)
-                        errors_per_timestep.append(error_val)
-                    except Exception as e:
-                        logger.warning(f"Failed to calculate {metric} for {var}: {e}")
-                        errors_per_timestep.append(np.nan)
-            
-            if errors_per_timestep:
-                valid_errors = [e for e in errors_per_timestep if np.isfinite(e)]
-                
-                error_norms[var][metric] = {
-                    'per_timestep': errors_per_timestep,
-                    'mean': np.mean(valid_errors) if valid_errors else np.nan,
-                    'max': np.max(valid_errors) if valid_errors else np.nan,
-                    'min': np.min(valid_errors) if valid_errors else np.nan,
-                    'std': np.std(valid_errors) if valid_errors else np.nan,
-                    'timesteps': [sim_data_list[i]['t'] for i in range(len(errors_per_timestep))],
-                    'var_files': [sim_data_list[i].get('var_file', f'VAR{i}') for i in range(len(errors_per_timestep))]
-                }
+        error_norms = {}
+        for var in variables:
+            error_norms[var] = {}
+            stacked = _stacked_pair(sim_data_list, analytical_data_list, var)
+            if stacked is None or not len(sim_data_list):
+                continue
+            if windows is not None:
+                sim, ana = stacked
+                errors_over_time = {metric: [_roi_norm(sim[i], ana[i], windows[i], metric)
+                                             for i in range(len(windows))] for metric in metrics}
+            else:
+                errors_over_time = calculate_errors_over_time(*stacked, metrics=metrics)
+            for metric in metrics:
+                error_norms[var][metric] = _summarize_norms(errors_over_time[metric], sim_data_list.t,
+                                                            sim_data_list.var_files)
+        return error_norms
+    
+    accumulator = ErrorNormAccumulator(variables=variables, metrics=metrics, roi=roi)
+    for sim_data, analytical_data in zip(sim_data_list, analytical_data_list):
+        accumulator.update(sim_data, analytical_data)
     
-    return error_norms
+    return accumulator.result()
 
 
 def calculate_spatial_errors(sim_data_list: List[dict], analytical_data_list: List[dict],
@@ -95,9 +335,12 @@ def calculate_spatial_errors(sim_data_list: List[dict], analytical_data_list: Li
     """
     Calculate spatial errors (point-by-point) between numerical and analytical solutions.
     
+    If both inputs are ``SnapshotSeries``, each variable is computed in a single
+    [T, X] array expression.
+    
     Args:
-        sim_data_list: List of simulation data dictionaries from all VAR files
-        analytical_data_list: List of corresponding analytical solutions
+        sim_data_list: Simulation data from all VAR files (list of dicts or SnapshotSeries)
+        analytical_data_list: Corresponding analytical solutions (list of dicts or SnapshotSeries)
         variables: List of variable names to analyze
         error_method: Error calculation method:
             - 'absolute': |sim - analytical|
@@ -118,6 +361,18 @@ def calculate_spatial_errors(sim_data_list: List[dict], analytical_data_list: Li
     spatial_errors = {}
     
     for var in variables:
+        stacked = _stacked_pair(sim_data_list, analytical_data_list, var)
+        if stacked is not None:
+            if len(sim_data_list):
+                spatial_errors[var] = {
+                    'x': sim_data_list.x,
+                    'errors_per_timestep': list(_pointwise_error(*stacked, error_method)),
+                    'timesteps': list(sim_data_list.t),
+                    'var_files': list(sim_data_list.var_files),
+                    'error_method': error_method
+                }
+            continue
+        
         errors_per_timestep = []
         x_coords = None
         
@@ -127,21 +382,7 @@ def calculate_spatial_errors(sim_data_list: List[dict], analytical_data_list: Li
                     x_coords = sim_data['x']
                 
                 # Calculate error based on specified method
-                if error_method == 'absolute':
-                    error = np.abs(sim_data[var] - analytical_data[var])
-                elif error_method == 'relative':
-                    # Avoid division by zero
-                    analytical_safe = np.where(np.abs(analytical_data[var]) < 1e-10, 1e-10, analytical_data[var])
-                    error = np.abs(sim_data[var] - analytical_data[var]) / np.abs(analytical_safe)
-                elif error_method == 'difference':
-                    error = sim_data[var] - analytical_data[var]
-                elif error_method == 'squared':
-                    error = (sim_data[var] - analytical_data[var])**2
-                else:
-                    logger.warning(f"Unknown error method '{error_method}', using 'absolute'")
-                    error = np.abs(sim_data[var] - analytical_data[var])
-                
-                errors_per_timestep.append(error)
+                errors_per_timestep.append(_pointwise_error(sim_data[var], analytical_data[var], error_method))
         
         if errors_per_timestep and x_coords is not None:
             spatial_errors[var] = {
@@ -178,11 +419,15 @@ def calculate_std_deviation_across_vars(sim_data_list: List[dict], analytical_da
     std_devs = {}
     
     for var in variables:
-        deviations = []
-        for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
-            if var in sim_data and var in analytical_data:
-                diff = sim_data[var] - analytical_data[var]
-                deviations.append(np.std(diff))
+        stacked = _stacked_pair(sim_data_list, analytical_data_list, var)
+        if stacked is not None:
+            deviations = list(np.std(stacked[0] - stacked[1], axis=1))
+        else:
+            deviations = []
+            for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
+                if var in sim_data and var in analytical_data:
+                    diff = sim_data[var] - analytical_data[var]
+                    deviations.append(np.std(diff))
         
         if deviations:
             std_devs[var] = {
@@ -208,16 +453,28 @@ def calculate_absolute_deviation_per_var(sim_data_list: List[dict], analytical_d
     
     for var in variables:
         var_results = []
-        for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
-            if var in sim_data and var in analytical_data:
-                abs_dev = np.mean(np.abs(sim_data[var] - analytical_data[var]))
-                max_abs_dev = np.max(np.abs(sim_data[var] - analytical_data[var]))
+        stacked = _stacked_pair(sim_data_list, analytical_data_list, var)
+        if stacked is not None:
+            abs_diff = np.abs(stacked[0] - stacked[1])
+            per_var = zip(sim_data_list.t, np.mean(abs_diff, axis=1), np.max(abs_diff, axis=1))
+            for idx, (t, abs_dev, max_abs_dev) in enumerate(per_var):
                 var_results.append({
                     'var_idx': idx,
-                    'timestep': sim_data.get('t', idx),
+                    'timestep': t,
                     'mean_abs_dev': abs_dev,
                     'max_abs_dev': max_abs_dev
                 })
+        else:
+            for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
+                if var in sim_data and var in analytical_data:
+                    abs_dev = np.mean(np.abs(sim_data[var] - analytical_data[var]))
+                    max_abs_dev = np.max(np.abs(sim_data[var] - analytical_data[var]))
+                    var_results.append({
+                        'var_idx': idx,
+                        'timestep': sim_data.get('t', idx),
+                        'mean_abs_dev': abs_dev,
+                        'max_abs_dev': max_abs_dev
+                    })
         
         if var_results:
             # Find worst performing VAR
@@ -238,7 +495,8 @@ def calculate_normalized_spatial_errors(
     analytical_data_list: List[dict],
     variables: List[str],
     normalize_by_space: bool = False,
-    normalize_by_time: bool = False
+    normalize_by_time: bool = False,
+    dtype=np.float64
 ) -> Dict:
     """
     Calculate normalized spatial-temporal errors for point-wise error tracking.
@@ -252,6 +510,8 @@ def calculate_normalized_spatial_errors(
         variables: List of variable names to analyze (from config)
         normalize_by_space: If True, divide errors by spatial resolution (dx)
         normalize_by_time: If True, divide errors by temporal resolution (dt)
+        dtype: Storage dtype of the returned error fields (e.g. np.float32 to halve
+            their size); errors and the maximum are computed in float64
         
     Returns:
         Dictionary containing 2D error fields for each variable:
@@ -287,43 +547,44 @@ def calculate_normalized_spatial_errors(
     normalized_errors = {}
     
     for var in variables:
-        # Collect spatial errors for all timesteps
-        errors_per_timestep = []
-        relative_errors_per_timestep = []
-        x_coords = None
-        timesteps = []
-        
-        for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
-            if var not in sim_data or var not in analytical_data:
-                logger.warning(f"Variable '{var}' not found in data at timestep {idx}")
-                continue
-            
-            # Get spatial coordinates (once)
-            if x_coords is None:
-                x_coords = sim_data['x']
+        stacked = _stacked_pair(sim_data_list, analytical_data_list, var)
+        if stacked is not None:
+            # Whole run at once: the series already holds [timestep, space] arrays
+            x_coords = sim_data_list.x
+            timesteps = list(sim_data_list.t)
+            if kernels.accelerated(*stacked):
+                error_field, relative_error_field = kernels.absolute_relative(*stacked)
+            else:
+                error_field = _pointwise_error(*stacked, 'absolute')
+                relative_error_field = _pointwise_error(*stacked, 'relative')
+        else:
+            # Collect spatial errors for all timesteps
+            errors_per_timestep = []
+            relative_errors_per_timestep = []
+            x_coords = None
+            timesteps = []
             
-            # Calculate absolute error
-            absolute_error = np.abs(sim_data[var] - analytical_data[var])
+            for idx, (sim_data, analytical_data) in enumerate(zip(sim_data_list, analytical_data_list)):
+                if var not in sim_data or var not in analytical_data:
+                    logger.warning(f"Variable '{var}' not found in data at timestep {idx}")
+                    continue
+                
+                # Get spatial coordinates (once)
+                if x_coords is None:
+                    x_coords = sim_data['x']
+                
+                # Absolute and relative error (relative avoids division by zero)
+                errors_per_timestep.append(_pointwise_error(sim_data[var], analytical_data[var], 'absolute'))
+                relative_errors_per_timestep.append(_pointwise_error(sim_data[var], analytical_data[var], 'relative'))
+                timesteps.append(sim_data.get('t', idx))
             
-            # Calculate relative error (avoid division by zero)
-            analytical_safe = np.where(
-                np.abs(analytical_data[var]) < 1e-10,
-                1e-10,
-                analytical_data[var]
-            )
-            relative_error = np.abs(sim_data[var] - analytical_data[var]) / np.abs(analytical_safe)
+            if not errors_per_timestep or x_coords is None:
+                logger.warning(f"No valid data found for variable '{var}'")
+                continue
             
-            errors_per_timestep.append(absolute_error)
-            relative_errors_per_timestep.append(relative_error)
-            timesteps.append(sim_data.get('t', idx))
-        
-        if not errors_per_timestep or x_coords is None:
-            logger.warning(f"No valid data found for variable '{var}'")
-            continue
-        
-        # Convert to 2D arrays [timestep, space]
-        error_field = np.array(errors_per_timestep)
-        relative_error_field = np.array(relative_errors_per_timestep)
+            # Convert to 2D arrays [timestep, space]
+            error_field = np.array(errors_per_timestep)
+            relative_error_field = np.array(relative_errors_per_timestep)
         
         # Calculate spatial and temporal resolutions
         dx = x_coords[1] - x_coords[0] if len(x_coords) > 1 else 1.0
@@ -343,8 +604,8 @@ def calculate_normalized_spatial_errors(
         max_time_idx, max_space_idx = max_idx
         
         normalized_errors[var] = {
-            'error_field': error_field,
-            'relative_error_field': relative_error_field,
+            'error_field': error_field.astype(dtype, copy=False),
+            'relative_error_field': relative_error_field.astype(dtype, copy=False),
             'x_coords': x_coords,
             'timesteps': timesteps,
             'dx': dx,
@@ -362,6 +623,314 @@ def calculate_normalized_spatial_errors(
     return normalized_errors
 
 
+def _error_fields(sim: np.ndarray, ana: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Derive every error field and per-timestep statistic of one variable from a
+    single ``sim - ana`` on [T, X] arrays.
+    """
+    if kernels.accelerated(sim, ana):
+        diff, absolute, squared, relative = kernels.error_fields(sim, ana)
+    else:
+        diff = sim - ana
+        absolute = np.abs(diff)
+        squared = diff * diff
+        # Same guard against division by zero as _pointwise_error
+        analytical_safe = np.where(np.abs(ana) < 1e-10, 1e-10, ana)
+        relative = absolute / np.abs(analytical_safe)
+
+    max_relative_index = np.unravel_index(np.argmax(relative), relative.shape)
+    return {
+        'difference': diff,
+        'absolute': absolute,
+        'squared': squared,
+        'relative': relative,
+        'std': np.std(diff, axis=1),
+        'mean_abs': np.mean(absolute, axis=1),
+        'max_abs': np.max(absolute, axis=1),
+        'max_relative_index': max_relative_index,
+        'max_relative': relative[max_relative_index],
+    }
+
+
+# [T, X] fields of _error_fields that RunErrors keeps in its storage dtype
+_STORED_FIELDS = ('difference', 'absolute', 'squared', 'relative')
+
+
+# Row-wise versions of the built-in metrics of src.analysis.metrics, evaluated on
+# the fields of _error_fields. Each returns one value per timestep.
+_FUSED_NORMS = {
+    'l1': lambda fields, ana: np.mean(fields['absolute'] / np.abs(np.where(ana == 0, 1, ana)), axis=1),
+    'l2': lambda fields, ana: np.sqrt(np.mean(fields['squared'], axis=1)),
+    'linf': lambda fields, ana: fields['max_abs'],
+    'relative_l1': lambda fields, ana: np.mean(fields['relative'], axis=1),
+    'relative_l2': lambda fields, ana: np.sqrt(np.mean(fields['relative']**2, axis=1)),
+    'mape': lambda fields, ana: 100.0 * np.mean(fields['relative'], axis=1),
+}
+_BUILTIN_METRICS = {name: METRIC_REGISTRY.get(name) for name in _FUSED_NORMS}
+
+
+class RunErrors:
+    """
+    Every error quantity of one run, computed from a single ``sim - analytical``.
+
+    For each variable the difference of the stacked [T, X] arrays is taken once;
+    the absolute, squared and relative fields, the per-timestep error norms,
+    standard deviations and absolute deviations and the location of the largest
+    relative error are all derived from it. The accessors return the same
+    structures as the corresponding module functions, so their consumers can
+    read from one ``RunErrors`` instead of recomputing the errors per quantity:
+
+        ==============================  ==========================================
+        ``spatial_errors(method)``      ``calculate_spatial_errors``
+        ``error_norms(metrics)``        ``calculate_error_norms``
+        ``std_devs()``                  ``calculate_std_deviation_across_vars``
+        ``abs_devs()``                  ``calculate_absolute_deviation_per_var``
+        ``normalized_errors()``         ``calculate_normalized_spatial_errors``
+        ==============================  ==========================================
+
+    Inputs that are not both ``SnapshotSeries`` (e.g. runs whose grid changes
+    between snapshots) are passed on to those functions unchanged.
+
+    With a ``storage_dtype`` of np.float32 the [T, X] error fields are kept (and
+    returned) in single precision, halving the memory of a cached run. The
+    per-timestep statistics and the norms of ``metrics`` are computed in float64
+    first; norms requested later are evaluated on the float64 inputs.
+
+    With ``roi`` set, the error norms (and so the rankings built on them) are
+    evaluated only within windows around the analytical waves, as in
+    ``calculate_error_norms``; the error fields still cover the whole domain.
+
+    Example:
+        >>> run_errors = RunErrors(all_sim_data, all_analytical_data, metrics=['l1', 'l2', 'linf'])
+        >>> spatial_errors = run_errors.spatial_errors('absolute')
+        >>> error_norms = run_errors.error_norms()
+    """
+
+    def __init__(self, sim_data, analytical_data,
+                 variables: List[str] = ['rho', 'ux', 'pp', 'ee'],
+                 metrics: List[str] = None, storage_dtype=np.float64, roi: Optional[Dict] = None):
+        """
+        Args:
+            sim_data: Simulation data of the run (SnapshotSeries or list of dicts)
+            analytical_data: Corresponding analytical solutions
+            variables: List of variable names to analyze
+            metrics: List of metric names to calculate up front (default: ['l1', 'l2'])
+            storage_dtype: dtype of the stored error fields (np.float64 or np.float32)
+            roi: Keyword arguments of ``roi_windows`` for region-of-interest norms,
+                or None for norms over the whole domain
+        """
+        self.sim_data = sim_data
+        self.analytical_data = analytical_data
+        self.variables = list(variables)
+        self.metrics = list(metrics) if metrics is not None else ['l1', 'l2']
+        self.storage_dtype = np.dtype(storage_dtype)
+        self.roi = roi
+
+        self.stacked = (isinstance(sim_data, SnapshotSeries) and isinstance(analytical_data, SnapshotSeries)
+                        and len(sim_data) == len(analytical_data))
+        self._fields = {}
+        self._norms = {}
+        self._windows = None
+        if self.stacked and roi is not None and len(sim_data):
+            self._windows = roi_windows(sim_data.x, sim_data.t, _roi_params(sim_data.params), **roi)
+
+        if self.stacked:
+            for var in self.variables:
+                stacked = _stacked_pair(sim_data, analytical_data, var)
+                if stacked is not None and len(sim_data):
+                    fields = self._fields[var] = _error_fields(*stacked)
+                    self._norms[var] = {}
+                    for metric in self.metrics:
+                        self._norm(var, metric)
+                    for name in _STORED_FIELDS:
+                        fields[name] = fields[name].astype(self.storage_dtype, copy=False)
+
+    def _select(self, variables: Optional[List[str]]) -> List[str]:
+        return self.variables if variables is None else list(variables)
+
+    def _norm(self, var: str, metric: str) -> np.ndarray:
+        """Per-timestep values of one metric, computed on first use."""
+        norms = self._norms[var]
+        if metric not in norms:
+            ana = self.analytical_data.fields[var]
+            if self._windows is not None:
+                sim = self.sim_data.fields[var]
+                norms[metric] = np.array([_roi_norm(sim[i], ana[i], windows, metric)
+                                          for i, windows in enumerate(self._windows)])
+            elif (metric in _FUSED_NORMS and METRIC_REGISTRY.get(metric) is _BUILTIN_METRICS[metric]
+                    and self._fields[var]['absolute'].dtype == np.float64):
+                norms[metric] = _FUSED_NORMS[metric](self._fields[var], ana)
+            else:
+                # Custom or overridden metric, or reduced-precision fields: one batched
+                # registry call on the float64 inputs
+                sim = self.sim_data.fields[var]
+                norms[metric] = np.asarray(calculate_errors_over_time(sim, ana, [metric])[metric],
+                                           dtype=np.float64)
+        return norms[metric]
+
+    def spatial_errors(self, error_method: str = 'absolute', variables: List[str] = None) -> Dict:
+        """
+        Point-by-point errors, as returned by ``calculate_spatial_errors``.
+
+        Args:
+            error_method: 'absolute', 'relative', 'difference' or 'squared'
+            variables: Subset of the analyzed variables (default: all)
+        """
+        variables = self._select(variables)
+        if not self.stacked:
+            spatial_errors = calculate_spatial_errors(self.sim_data, self.analytical_data, variables, error_method)
+            for var_errors in spatial_errors.values():
+                var_errors['errors_per_timestep'] = [e.astype(self.storage_dtype, copy=False)
+                                                     for e in var_errors['errors_per_timestep']]
+            return spatial_errors
+
+        field = error_method
+        if error_method not in ('absolute', 'relative', 'difference', 'squared'):
+            logger.warning(f"Unknown error method '{error_method}', using 'absolute'")
+            field = 'absolute'
+
+        return {
+            var: {
+                'x': self.sim_data.x,
+                'errors_per_timestep': list(self._fields[var][field]),
+                'timesteps': list(self.sim_data.t),
+                'var_files': list(self.sim_data.var_files),
+                'error_method': error_method
+            }
+            for var in variables if var in self._fields
+        }
+
+    def error_norms(self, metrics: List[str] = None, variables: List[str] = None) -> Dict:
+        """
+        Per-timestep error norms and their summary, as returned by ``calculate_error_norms``.
+
+        Args:
+            metrics: Metric names (default: the metrics given at construction)
+            variables: Subset of the analyzed variables (default: all)
+        """
+        metrics = self.metrics if metrics is None else list(metrics)
+        variables = self._select(variables)
+        if not self.stacked:
+            return calculate_error_norms(self.sim_data, self.analytical_data, variables, metrics, roi=self.roi)
+
+        error_norms = {}
+        for var in variables:
+            error_norms[var] = {}
+            if var not in self._fields:
+                continue
+
+            for metric in metrics:
+                error_norms[var][metric] = _summarize_norms(self._norm(var, metric), self.sim_data.t,
+                                                            self.sim_data.var_files)
+
+        return error_norms
+
+    def std_devs(self, variables: List[str] = None) -> Dict:
+        """Standard deviation of the difference, as returned by ``calculate_std_deviation_across_vars``."""
+        variables = self._select(variables)
+        if not self.stacked:
+            return calculate_std_deviation_across_vars(self.sim_data, self.analytical_data, variables)
+
+        std_devs = {}
+        for var in variables:
+            if var not in self._fields:
+                continue
+            deviations = self._fields[var]['std']
+            std_devs[var] = {
+                'mean_std': np.mean(deviations),
+                'max_std': np.max(deviations),
+                'min_std': np.min(deviations),
+                'std_of_std': np.std(deviations),
+                'per_timestep': list(deviations)
+            }
+
+        return std_devs
+
+    def abs_devs(self, variables: List[str] = None) -> Dict:
+        """Absolute deviation per VAR file, as returned by ``calculate_absolute_deviation_per_var``."""
+        variables = self._select(variables)
+        if not self.stacked:
+            return calculate_absolute_deviation_per_var(self.sim_data, self.analytical_data, variables)
+
+        results = {}
+        for var in variables:
+            if var not in self._fields:
+                continue
+            fields = self._fields[var]
+            var_results = [
+                {'var_idx': idx, 'timestep': t, 'mean_abs_dev': abs_dev, 'max_abs_dev': max_abs_dev}
+                for idx, (t, abs_dev, max_abs_dev)
+                in enumerate(zip(self.sim_data.t, fields['mean_abs'], fields['max_abs']))
+            ]
+            results[var] = {
+                'per_var': var_results,
+                'worst_mean_deviation': var_results[int(np.argmax(fields['mean_abs']))],
+                'worst_max_deviation': var_results[int(np.argmax(fields['max_abs']))]
+            }
+
+        return results
+
+    def normalized_errors(self, variables: List[str] = None, normalize_by_space: bool = False,
+                          normalize_by_time: bool = False) -> Dict:
+        """
+        2D error fields and maximum error location, as returned by
+        ``calculate_normalized_spatial_errors``.
+
+        Args:
+            variables: Subset of the analyzed variables (default: all)
+            normalize_by_space: If True, divide errors by spatial resolution (dx)
+            normalize_by_time: If True, divide errors by temporal resolution (dt)
+        """
+        variables = self._select(variables)
+        if not self.stacked:
+            return calculate_normalized_spatial_errors(self.sim_data, self.analytical_data, variables,
+                                                       normalize_by_space, normalize_by_time,
+                                                       dtype=self.storage_dtype)
+
+        x_coords = self.sim_data.x
+        timesteps = list(self.sim_data.t)
+        dx = x_coords[1] - x_coords[0] if len(x_coords) > 1 else 1.0
+        dt = timesteps[1] - timesteps[0] if len(timesteps) > 1 else 1.0
+
+        normalized_errors = {}
+        for var in variables:
+            if var not in self._fields:
+                continue
+            fields = self._fields[var]
+            error_field = fields['absolute']
+            relative_error_field = fields['relative']
+            max_relative = fields['max_relative']
+            if normalize_by_space:
+                error_field = error_field / dx
+                relative_error_field = relative_error_field / dx
+                max_relative = max_relative / dx
+            if normalize_by_time:
+                error_field = error_field / dt
+                relative_error_field = relative_error_field / dt
+                max_relative = max_relative / dt
+
+            # Maximum relative error; normalizing by positive dx, dt does not move it
+            max_time_idx, max_space_idx = fields['max_relative_index']
+
+            normalized_errors[var] = {
+                'error_field': error_field.astype(self.storage_dtype, copy=False),
+                'relative_error_field': relative_error_field.astype(self.storage_dtype, copy=False),
+                'x_coords': x_coords,
+                'timesteps': timesteps,
+                'dx': dx,
+                'dt': dt,
+                'max_error_location': {
+                    'value': float(max_relative),
+                    'time_index': int(max_time_idx),
+                    'space_index': int(max_space_idx),
+                    'time': float(timesteps[max_time_idx]),
+                    'x': float(x_coords[max_space_idx])
+                }
+            }
+
+        return normalized_errors
+
+
 class ExperimentErrorAnalyzer:
     """
     Analyzes and compares errors across multiple experiments and branches.
@@ -0,0 +1,272 @@
+# src/analysis/fronts.py
+"""
+Wave-front tracking for shock tube snapshots.
+
+A Sod-type solution consists of a rarefaction fan, a contact discontinuity and a
+shock. ``detect_fronts`` locates them in any number of snapshots at once by
+threshold detection on the normalized profiles of stacked [..., X] arrays:
+
+    - each snapshot is oriented so that the high-pressure state is on the left
+      (mirrored problems are mirrored back afterwards)
+    - the velocity, normalized to 0 in the initial states and 1 on the star
+      plateau, rises through the rarefaction fan and drops at the shock; the fan
+      head/tail are its 5%/95% crossings extrapolated along the (linear) fan, the
+      shock is its 50% crossing right of the peak and the shock width is the
+      distance between the 90% and 10% crossings
+    - the contact is the 50% crossing of the density between the fan tail and
+      the shock, with its 90%-10% width
+
+Crossings are interpolated linearly between cells. Positions are in units of
+``x``, widths in cells. A handful of scalars per snapshot then describes the
+wave structure of a run, and runs can be compared on them at negligible cost
+(``track_fronts``/``FrontTracker``).
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.analysis.snapshots import SnapshotSeries
+
+
+# Fields needed to locate the fronts
+FRONT_FIELDS = ('rho', 'ux', 'pp')
+
+# Front positions (units of x) and widths (cells) reported per snapshot
+POSITION_FEATURES = ('rarefaction_head', 'rarefaction_tail', 'contact', 'shock')
+WIDTH_FEATURES = ('rarefaction_width', 'contact_width', 'shock_width')
+FRONT_FEATURES = POSITION_FEATURES + WIDTH_FEATURES
+
+# Normalized levels of the threshold detection
+FAN_LEVELS = (0.05, 0.95)
+FRONT_LEVELS = (0.9, 0.5, 0.1)
+
+# Smallest normalized density jump that counts as a contact
+MIN_CONTACT_JUMP = 1e-3
+
+
+def _crossing(values: np.ndarray, level, start: np.ndarray, falling: bool) -> np.ndarray:
+    """
+    First fractional index at or after ``start`` where each row crosses ``level``.
+
+    Args:
+        values: Rows of shape [N, X]
+        level: Scalar or per-row level
+        start: Per-row first index to consider
+        falling: Look for values dropping below ``level`` instead of reaching it
+
+    Returns:
+        Fractional indices, shape [N] (NaN where a row does not cross)
+    """
+    n, nx = values.shape
+    rows = np.arange(n)
+    level = np.broadcast_to(np.asarray(level, dtype=np.float64), (n,))
+
+    beyond = values < level[:, None] if falling else values >= level[:, None]
+    beyond &= np.arange(nx) >= start[:, None]
+    hit = beyond.any(axis=1)
+    i = np.argmax(beyond, axis=1)
+
+    prev = np.maximum(i - 1, 0)
+    v0, v1 = values[rows, prev], values[rows, i]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = np.clip((level - v0) / (v1 - v0), 0.0, 1.0)
+    index = np.where((i > start) & (v1 != v0), prev + fraction, i)
+    return np.where(hit, index, np.nan)
+
+
+def _start(index: np.ndarray, rounding) -> np.ndarray:
+    """Integer start indices from fractional ones (0 where undefined)."""
+    return np.where(np.isfinite(index), rounding(np.nan_to_num(index)), 0).astype(np.int64)
+
+
+def detect_fronts(x: np.ndarray, rho: np.ndarray, ux: np.ndarray, pp: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Locate the rarefaction fan, contact and shock in every snapshot.
+
+    Args:
+        x: Spatial grid, shape [X]
+        rho: Density, shape [..., X] (e.g. [T, X] for a whole run)
+        ux: Velocity, same shape
+        pp: Pressure, same shape
+
+    Returns:
+        Dictionary mapping each of ``FRONT_FEATURES`` to an array of shape [...]:
+        positions in units of ``x`` and widths in cells; NaN where a front is
+        not found (e.g. the initial snapshot)
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    rho, ux, pp = (np.asarray(a, dtype=np.float64) for a in (rho, ux, pp))
+    shape, nx = rho.shape[:-1], rho.shape[-1]
+    rho, ux, pp = (a.reshape(-1, nx) for a in (rho, ux, pp))
+    n = rho.shape[0]
+    rows = np.arange(n)
+
+    # High-pressure state on the left; mirroring x also flips the velocity
+    flip = pp[:, 0] < pp[:, -1]
+    rho = np.where(flip[:, None], rho[:, ::-1], rho)
+    ux = np.where(flip[:, None], -ux[:, ::-1], ux)
+
+    peak = np.argmax(ux, axis=1)
+    u_peak = ux[rows, peak]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v_left = (ux - ux[:, :1]) / (u_peak - ux[:, 0])[:, None]
+        v_right = (ux - ux[:, -1:]) / (u_peak - ux[:, -1])[:, None]
+    moving = (u_peak > ux[:, 0]) & (u_peak > ux[:, -1])
+
+    # Rarefaction: the velocity rises linearly through the fan
+    low, high = FAN_LEVELS
+    zero = np.zeros(n, dtype=np.int64)
+    fan_low = _crossing(v_left, low, zero, falling=False)
+    fan_high = _crossing(v_left, high, zero, falling=False)
+    extend = (fan_high - fan_low) * low / (high - low)
+    head, tail = fan_low - extend, fan_high + extend
+
+    # Shock: the velocity drops from the plateau to the right state
+    shock_90, shock_50, shock_10 = (_crossing(v_right, level, peak, falling=True) for level in FRONT_LEVELS)
+
+    # Contact: density jump between the fan tail and the shock
+    tail_start = np.minimum(_start(tail, np.ceil), nx - 1)
+    # One shock width further back, the density is clear of the smeared shock
+    behind_shock = np.clip(_start(2.0 * shock_90 - shock_10, np.floor), tail_start, nx - 1)
+    rho_tail, rho_shock = rho[rows, tail_start], rho[rows, behind_shock]
+    jump = rho_tail - rho_shock
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r = (rho - rho_shock[:, None]) / jump[:, None]
+    contact_90, contact_50, contact_10 = (_crossing(r, level, tail_start, falling=True) for level in FRONT_LEVELS)
+    has_contact = (np.abs(jump) > MIN_CONTACT_JUMP * np.abs(rho).max(axis=1)) & (contact_50 < shock_90)
+
+    def valid(index, mask=moving):
+        return np.where(mask, index, np.nan)
+
+    positions = {
+        'rarefaction_head': valid(head),
+        'rarefaction_tail': valid(tail),
+        'contact': valid(contact_50, moving & has_contact),
+        'shock': valid(shock_50),
+    }
+    widths = {
+        'rarefaction_width': valid(tail - head),
+        'contact_width': valid(contact_10 - contact_90, moving & has_contact),
+        'shock_width': valid(shock_10 - shock_90),
+    }
+
+    cells = np.arange(nx)
+    features = {}
+    for name, index in positions.items():
+        index = np.where(flip, nx - 1 - index, index)
+        features[name] = np.interp(np.nan_to_num(index), cells, x)
+        features[name][np.isnan(index)] = np.nan
+    features.update(widths)
+    return {name: features[name].reshape(shape) for name in FRONT_FEATURES}
+
+
+def _has_fields(data) -> bool:
+    keys = data.fields if isinstance(data, SnapshotSeries) else data
+    return all(name in keys for name in FRONT_FIELDS)
+
+
+def _json_float(value) -> Optional[float]:
+    """Float for JSON output; None for fronts that were not found."""
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+
+def _summarize_fronts(simulation: Dict[str, list], analytical: Dict[str, list], timesteps: list,
+                      dx: float) -> Dict:
+    """Per-snapshot features of a run plus their offsets from the analytical fronts."""
+    summary = {}
+    for name in FRONT_FEATURES:
+        sim, ana = np.asarray(simulation[name], dtype=np.float64), np.asarray(analytical[name], dtype=np.float64)
+        # Offsets in cells: positions are divided by dx, widths already are in cells
+        offset = sim - ana
+        if name in POSITION_FEATURES:
+            offset = offset / dx
+        offset = offset[np.isfinite(offset)]
+        summary[name] = {
+            'simulation_mean': _json_float(np.nanmean(sim)) if np.isfinite(sim).any() else None,
+            'analytical_mean': _json_float(np.nanmean(ana)) if np.isfinite(ana).any() else None,
+            'mean_offset_cells': _json_float(np.mean(offset)) if offset.size else None,
+            'max_abs_offset_cells': _json_float(np.max(np.abs(offset))) if offset.size else None,
+        }
+
+    return {
+        'per_timestep': {
+            'simulation': {name: [_json_float(v) for v in simulation[name]] for name in FRONT_FEATURES},
+            'analytical': {name: [_json_float(v) for v in analytical[name]] for name in FRONT_FEATURES},
+        },
+        'timesteps': [float(t) for t in timesteps],
+        'dx': float(dx),
+        'summary': summary,
+    }
+
+
+class FrontTracker:
+    """
+    Online front tracking, one (simulation, analytical) snapshot pair at a time.
+
+    Counterpart of ``ErrorNormAccumulator`` for the streaming error-norm path;
+    only the scalar features of each snapshot are retained.
+
+    Example:
+        >>> tracker = FrontTracker()
+        >>> for sim_data, analytical_data in iter_snapshot_pairs(run_path):
+        ...     tracker.update(sim_data, analytical_data)
+        >>> fronts = tracker.result()
+    """
+
+    def __init__(self):
+        self._simulation = {name: [] for name in FRONT_FEATURES}
+        self._analytical = {name: [] for name in FRONT_FEATURES}
+        self._timesteps = []
+        self._dx = None
+
+    def update(self, sim_data: dict, analytical_data: dict):
+        """Add the fronts of one snapshot pair (skipped without rho, ux and pp)."""
+        if not (_has_fields(sim_data) and _has_fields(analytical_data)):
+            return
+        x = sim_data['x']
+        for target, data in ((self._simulation, sim_data), (self._analytical, analytical_data)):
+            features = detect_fronts(x, *(data[name] for name in FRONT_FIELDS))
+            for name in FRONT_FEATURES:
+                target[name].append(features[name][()])
+        self._timesteps.append(sim_data['t'])
+        if self._dx is None and len(x) > 1:
+            self._dx = x[1] - x[0]
+
+    def result(self) -> Optional[Dict]:
+        """
+        Returns:
+            Dictionary with 'per_timestep' features of 'simulation' and 'analytical',
+            'timesteps', 'dx' and a per-feature 'summary' (means and offsets in
+            cells; None where a front was not found), or None if no snapshot had
+            the required fields
+        """
+        if not self._timesteps:
+            return None
+        return _summarize_fronts(self._simulation, self._analytical, self._timesteps, self._dx or 1.0)
+
+
+def track_fronts(sim_data, analytical_data) -> Optional[Dict]:
+    """
+    Front features of a whole run, as returned by ``FrontTracker.result``.
+
+    ``SnapshotSeries`` inputs are processed in one ``detect_fronts`` call per side;
+    lists of snapshot dicts go through a ``FrontTracker``.
+
+    Args:
+        sim_data: Simulation data of the run (SnapshotSeries or list of dicts)
+        analytical_data: Corresponding analytical solutions
+    """
+    if isinstance(sim_data, SnapshotSeries) and isinstance(analytical_data, SnapshotSeries):
+        if not (_has_fields(sim_data) and _has_fields(analytical_data)) or not len(sim_data):
+            return None
+        simulation = detect_fronts(sim_data.x, *(sim_data.fields[name] for name in FRONT_FIELDS))
+        analytical = detect_fronts(sim_data.x, *(analytical_data.fields[name] for name in FRONT_FIELDS))
+        dx = sim_data.x[1] - sim_data.x[0] if sim_data.x.size > 1 else 1.0
+        return _summarize_fronts(simulation, analytical, list(sim_data.t), dx)
+
+    tracker = FrontTracker()
+    for sim_snapshot, analytical_snapshot in zip(sim_data, analytical_data):
+        tracker.update(sim_snapshot, analytical_snapshot)
+    return tracker.result()
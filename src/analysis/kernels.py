@@ -0,0 +1,296 @@
+# src/analysis/kernels.py
+"""
+Optional Numba-compiled loop kernels for the hottest array passes.
+
+The NumPy implementations of the error fields, the built-in error norms and the
+pressure/energy derivation evaluate one operation at a time, each pass writing a
+full temporary array. At large ``nxgrid`` that memory traffic dominates. The
+kernels here fuse those passes into single loops.
+
+Numba is optional. Without it (or after ``use_jit(False)``), ``accelerated``
+returns False and every caller keeps its NumPy path. The kernels are written to
+give bit-identical results to that path:
+
+    - elementwise expressions use the same operations in the same order
+    - sums use NumPy's pairwise summation, so means match ``np.mean(..., axis=-1)``
+    - exp/log are left to NumPy, whose SIMD implementations can differ from libm
+      in the last bit; the kernels fuse the arithmetic around them instead
+"""
+
+import numpy as np
+from loguru import logger
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+NUMBA_AVAILABLE = numba is not None
+
+# Arrays smaller than this are not worth a kernel call (or its first compilation)
+JIT_MIN_SIZE = 1 << 14
+
+# Same guard against division by zero as the NumPy relative error
+RELATIVE_EPSILON = 1e-10
+
+# Terms that can be summed per row by ``row_means``
+TERM_L1 = 0              # |(sim - ana) / ana|, with ana == 0 replaced by 1
+TERM_SQUARED = 1         # (sim - ana)^2
+TERM_RELATIVE = 2        # |sim - ana| / |ana|, with |ana| < epsilon replaced by epsilon
+TERM_RELATIVE_SQUARED = 3
+
+_jit_enabled = NUMBA_AVAILABLE
+
+
+def use_jit(enabled: bool = True) -> bool:
+    """
+    Switch the compiled kernels on or off.
+
+    Args:
+        enabled: Use the kernels where possible (ignored without Numba)
+
+    Returns:
+        Whether the kernels are now in use
+    """
+    global _jit_enabled
+    if enabled and not NUMBA_AVAILABLE:
+        logger.warning("Numba is not installed; using the NumPy implementations")
+    _jit_enabled = bool(enabled) and NUMBA_AVAILABLE
+    return _jit_enabled
+
+
+def jit_enabled() -> bool:
+    """Whether the compiled kernels are in use."""
+    return _jit_enabled
+
+
+def accelerated(*arrays) -> bool:
+    """
+    Whether the kernels can replace the NumPy path for these arrays.
+
+    They must be C-contiguous float64 arrays of one shape with at least
+    ``JIT_MIN_SIZE`` elements; anything else keeps the NumPy path.
+    """
+    if not _jit_enabled:
+        return False
+    first = arrays[0]
+    return all(
+        isinstance(a, np.ndarray) and a.dtype == np.float64 and a.flags.c_contiguous
+        and a.shape == first.shape for a in arrays
+    ) and first.ndim >= 1 and first.size >= JIT_MIN_SIZE
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, inline='always')
+    def _term(kind, s, a, epsilon):
+        d = s - a
+        if kind == TERM_L1:
+            return abs(d / (1.0 if a == 0.0 else a))
+        if kind == TERM_SQUARED:
+            return d * d
+        safe = epsilon if abs(a) < epsilon else a
+        if kind == TERM_RELATIVE:
+            return abs(d) / abs(safe)
+        q = d / safe
+        return q * q
+
+    @numba.njit(cache=True)
+    def _block_sum(sim, ana, start, n, kind, epsilon):
+        # Leaf of NumPy's pairwise summation (n <= 128): eight interleaved partial sums
+        if n < 8:
+            res = 0.0
+            for i in range(start, start + n):
+                res += _term(kind, sim[i], ana[i], epsilon)
+            return res
+        r0 = _term(kind, sim[start], ana[start], epsilon)
+        r1 = _term(kind, sim[start + 1], ana[start + 1], epsilon)
+        r2 = _term(kind, sim[start + 2], ana[start + 2], epsilon)
+        r3 = _term(kind, sim[start + 3], ana[start + 3], epsilon)
+        r4 = _term(kind, sim[start + 4], ana[start + 4], epsilon)
+        r5 = _term(kind, sim[start + 5], ana[start + 5], epsilon)
+        r6 = _term(kind, sim[start + 6], ana[start + 6], epsilon)
+        r7 = _term(kind, sim[start + 7], ana[start + 7], epsilon)
+        i = 8
+        while i < n - (n % 8):
+            k = start + i
+            r0 += _term(kind, sim[k], ana[k], epsilon)
+            r1 += _term(kind, sim[k + 1], ana[k + 1], epsilon)
+            r2 += _term(kind, sim[k + 2], ana[k + 2], epsilon)
+            r3 += _term(kind, sim[k + 3], ana[k + 3], epsilon)
+            r4 += _term(kind, sim[k + 4], ana[k + 4], epsilon)
+            r5 += _term(kind, sim[k + 5], ana[k + 5], epsilon)
+            r6 += _term(kind, sim[k + 6], ana[k + 6], epsilon)
+            r7 += _term(kind, sim[k + 7], ana[k + 7], epsilon)
+            i += 8
+        res = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+        while i < n:
+            res += _term(kind, sim[start + i], ana[start + i], epsilon)
+            i += 1
+        return res
+
+    @numba.njit(cache=True)
+    def _pairwise_sum(sim, ana, kind, epsilon):
+        # NumPy's pairwise summation (numpy/_core/src/umath/loops_utils.h.src): blocks of
+        # up to 128 terms, halves combined as pw(left) + pw(right). The recursion is
+        # unrolled onto explicit stacks, since recursive functions cannot be cached.
+        starts = np.empty(64, dtype=np.int64)
+        sizes = np.empty(64, dtype=np.int64)
+        stages = np.empty(64, dtype=np.int64)
+        partial = np.empty(64)
+        starts[0], sizes[0], stages[0] = 0, sim.size, 0
+        top, n_partial = 1, 0
+        while top > 0:
+            start, n, stage = starts[top - 1], sizes[top - 1], stages[top - 1]
+            if n <= 128:
+                top -= 1
+                partial[n_partial] = _block_sum(sim, ana, start, n, kind, epsilon)
+                n_partial += 1
+                continue
+            n2 = n // 2
+            n2 -= n2 % 8
+            if stage == 0:
+                stages[top - 1] = 1
+                starts[top], sizes[top], stages[top] = start, n2, 0
+                top += 1
+            elif stage == 1:
+                stages[top - 1] = 2
+                starts[top], sizes[top], stages[top] = start + n2, n - n2, 0
+                top += 1
+            else:
+                top -= 1
+                n_partial -= 1
+                partial[n_partial - 1] = partial[n_partial - 1] + partial[n_partial]
+        return partial[0]
+
+    @numba.njit(cache=True)
+    def _row_means(sim, ana, kind, epsilon, out):
+        n_x = sim.shape[1]
+        for row in range(sim.shape[0]):
+            out[row] = _pairwise_sum(sim[row], ana[row], kind, epsilon) / n_x
+
+    @numba.njit(cache=True)
+    def _row_max_abs(sim, ana, out):
+        for row in range(sim.shape[0]):
+            m = abs(sim[row, 0] - ana[row, 0])
+            for i in range(1, sim.shape[1]):
+                v = abs(sim[row, i] - ana[row, i])
+                if v > m or v != v:
+                    m = v
+                    if v != v:
+                        break
+            out[row] = m
+
+    @numba.njit(cache=True)
+    def _error_fields(sim, ana, epsilon, diff, absolute, squared, relative):
+        for i in range(sim.size):
+            a = ana[i]
+            d = sim[i] - a
+            ad = abs(d)
+            diff[i] = d
+            absolute[i] = ad
+            squared[i] = d * d
+            relative[i] = ad / abs(epsilon if abs(a) < epsilon else a)
+
+    @numba.njit(cache=True)
+    def _absolute_relative(sim, ana, epsilon, absolute, relative):
+        for i in range(sim.size):
+            a = ana[i]
+            ad = abs(sim[i] - a)
+            absolute[i] = ad
+            relative[i] = ad / abs(epsilon if abs(a) < epsilon else a)
+
+    @numba.njit(cache=True)
+    def _pressure_exponent(ss, log_rho, gamma_over_cp, lnTT0, gamma, offset, out):
+        # lnTT0 + gamma/cp*ss + gamma*ln(rho) - (gamma-1)*lnrho0, in the NumPy order
+        for i in range(ss.size):
+            out[i] = ((lnTT0 + gamma_over_cp * ss[i]) + gamma * log_rho[i]) - offset
+
+    @numba.njit(cache=True)
+    def _pressure_energy(exp_term, rho, cp_minus_cv, gamma_minus_one, energy, pp, ee):
+        for i in range(exp_term.size):
+            p = cp_minus_cv * exp_term[i]
+            pp[i] = p
+            if energy:
+                ee[i] = p / (rho[i] * gamma_minus_one)
+
+
+def _rows(array: np.ndarray) -> np.ndarray:
+    return array.reshape(-1, array.shape[-1])
+
+
+def row_means(sim: np.ndarray, ana: np.ndarray, kind: int,
+              epsilon: float = RELATIVE_EPSILON) -> np.ndarray:
+    """
+    Mean of an error term over the last axis, fused into one pass.
+
+    Args:
+        sim: Numerical values, shape [..., X] (see ``accelerated``)
+        ana: Analytical values, same shape
+        kind: One of the ``TERM_*`` constants
+        epsilon: Relative error guard for the relative terms
+
+    Returns:
+        Array of shape [...] (0-d for 1D input), equal to the NumPy mean
+    """
+    out = np.empty(sim.shape[:-1])
+    _row_means(_rows(sim), _rows(ana), kind, epsilon, out.reshape(-1))
+    return out[()] if out.ndim == 0 else out
+
+
+def row_max_abs(sim: np.ndarray, ana: np.ndarray) -> np.ndarray:
+    """Maximum of |sim - ana| over the last axis, without the |sim - ana| temporary."""
+    out = np.empty(sim.shape[:-1])
+    _row_max_abs(_rows(sim), _rows(ana), out.reshape(-1))
+    return out[()] if out.ndim == 0 else out
+
+
+def error_fields(sim: np.ndarray, ana: np.ndarray, epsilon: float = RELATIVE_EPSILON) -> tuple:
+    """
+    Signed, absolute, squared and relative error fields in one pass.
+
+    Returns:
+        Tuple (difference, absolute, squared, relative), each shaped like ``sim``
+    """
+    fields = tuple(np.empty(sim.shape) for _ in range(4))
+    _error_fields(sim.reshape(-1), ana.reshape(-1), epsilon, *(f.reshape(-1) for f in fields))
+    return fields
+
+
+def absolute_relative(sim: np.ndarray, ana: np.ndarray, epsilon: float = RELATIVE_EPSILON) -> tuple:
+    """Absolute and relative error fields in one pass, each shaped like ``sim``."""
+    absolute, relative = np.empty(sim.shape), np.empty(sim.shape)
+    _absolute_relative(sim.reshape(-1), ana.reshape(-1), epsilon, absolute.reshape(-1), relative.reshape(-1))
+    return absolute, relative
+
+
+def pressure_exponential(ss: np.ndarray, log_rho: np.ndarray, c: dict, out: np.ndarray):
+    """
+    Write exp(lnTT0 + gamma/cp*ss + gamma*ln(rho) - (gamma-1)*lnrho0) into ``out``.
+
+    The exponent is assembled in one pass and exponentiated by NumPy in place.
+
+    Args:
+        ss: Entropy
+        log_rho: ln(rho), e.g. the stored ``lnrho`` or ``np.log(rho)``
+        c: Constants from ``thermodynamic_constants``
+        out: Output buffer shaped like ``ss``
+    """
+    cp, gamma = c['cp'], c['gamma']
+    flat = out.reshape(-1)
+    _pressure_exponent(ss.reshape(-1), log_rho.reshape(-1), gamma / cp, c['lnTT0'], gamma,
+                       (gamma - 1.0) * c['lnrho0'], flat)
+    np.exp(flat, out=flat)
+
+
+def pressure_energy(exponential: np.ndarray, rho: np.ndarray, c: dict, energy: bool,
+                    pp: np.ndarray, ee: np.ndarray):
+    """
+    Pressure (cp - cv) * exponential and, if ``energy`` is set, p / (rho * (gamma - 1)).
+
+    ``pp`` may be ``exponential`` and ``ee`` may be ``rho``; each element is read
+    before it is overwritten.
+    """
+    _pressure_energy(exponential.reshape(-1), rho.reshape(-1), c['cp'] - c['cv'], c['gamma'] - 1.0,
+                     energy, pp.reshape(-1), ee.reshape(-1))
@@ -6,15 +6,24 @@ Modular error calculation system for comparing numerical and analytical solution
 Implements various error norms including L1 (mean absolute error) and L2 (root mean square error)
 as described in Gent et al. (2018) for shock tube test convergence analysis.
 
+The built-in metrics are vectorized: they reduce over the last (spatial) axis, so
+a single call on [T, X] arrays returns one value per timestep, and on [R, T, X]
+arrays one value per run and timestep. Scalar metrics that only accept one 1D
+snapshot can still be registered; the registry then applies them row by row.
+With Numba installed, large float64 inputs are reduced by the fused kernels of
+``src.analysis.kernels`` (bit-identical to the NumPy expressions below).
+
 Reference:
     Gent, F.A. et al. (2018). "Modelling supernova driven turbulence."
     Geophysical and Astrophysical Fluid Dynamics. Equation (23) for L1 norm.
 """
 
 import numpy as np
-from typing import Callable, Dict
+from typing import Callable, Dict, Sequence, Union
 from loguru import logger
 
+from src.analysis import kernels
+
 
 # ============================================================
 # ERROR METRIC FUNCTIONS
@@ -29,18 +38,21 @@ def l1_norm(numerical: np.ndarray, analytical: np.ndarray) -> float:
     This measures the average magnitude of errors across all grid points.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         
     Returns:
-        L1 error norm (scalar)
+        L1 error norm (scalar, or shape [...] for stacked input)
         
     Reference:
         Gent et al. (2018), Equation (23)
     """
+    if kernels.accelerated(numerical, analytical):
+        return kernels.row_means(numerical, analytical, kernels.TERM_L1)
+    
     analytical_copy = np.where(analytical == 0, 1, analytical)  
     
-    return np.mean(np.abs((numerical - analytical)/analytical_copy))
+    return np.mean(np.abs((numerical - analytical)/analytical_copy), axis=-1)
 
 
 def l2_norm(numerical: np.ndarray, analytical: np.ndarray) -> float:
@@ -52,13 +64,16 @@ def l2_norm(numerical: np.ndarray, analytical: np.ndarray) -> float:
     This measures the root mean square deviation, giving more weight to larger errors.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         
     Returns:
-        L2 error norm (scalar)
+        L2 error norm (scalar, or shape [...] for stacked input)
     """
-    return np.sqrt(np.mean((numerical - analytical)**2))
+    if kernels.accelerated(numerical, analytical):
+        return np.sqrt(kernels.row_means(numerical, analytical, kernels.TERM_SQUARED))
+    
+    return np.sqrt(np.mean((numerical - analytical)**2, axis=-1))
 
 
 def linf_norm(numerical: np.ndarray, analytical: np.ndarray) -> float:
@@ -70,13 +85,16 @@ def linf_norm(numerical: np.ndarray, analytical: np.ndarray) -> float:
     This measures the worst-case error at any single grid point.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         
     Returns:
-        L∞ error norm (scalar)
+        L∞ error norm (scalar, or shape [...] for stacked input)
     """
-    return np.max(np.abs(numerical - analytical))
+    if kernels.accelerated(numerical, analytical):
+        return kernels.row_max_abs(numerical, analytical)
+    
+    return np.max(np.abs(numerical - analytical), axis=-1)
 
 
 def relative_l1_norm(numerical: np.ndarray, analytical: np.ndarray, 
@@ -89,15 +107,18 @@ def relative_l1_norm(numerical: np.ndarray, analytical: np.ndarray,
     This normalizes errors by the analytical solution magnitude.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         epsilon: Small value to avoid division by zero
         
     Returns:
-        Relative L1 error norm (scalar)
+        Relative L1 error norm (scalar, or shape [...] for stacked input)
     """
+    if kernels.accelerated(numerical, analytical):
+        return kernels.row_means(numerical, analytical, kernels.TERM_RELATIVE, epsilon)
+    
     analytical_safe = np.where(np.abs(analytical) < epsilon, epsilon, analytical)
-    return np.mean(np.abs(numerical - analytical) / np.abs(analytical_safe))
+    return np.mean(np.abs(numerical - analytical) / np.abs(analytical_safe), axis=-1)
 
 
 def relative_l2_norm(numerical: np.ndarray, analytical: np.ndarray,
@@ -110,15 +131,18 @@ def relative_l2_norm(numerical: np.ndarray, analytical: np.ndarray,
     This normalizes the RMS error by the analytical solution magnitude.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         epsilon: Small value to avoid division by zero
         
     Returns:
-        Relative L2 error norm (scalar)
+        Relative L2 error norm (scalar, or shape [...] for stacked input)
     """
+    if kernels.accelerated(numerical, analytical):
+        return np.sqrt(kernels.row_means(numerical, analytical, kernels.TERM_RELATIVE_SQUARED, epsilon))
+    
     analytical_safe = np.where(np.abs(analytical) < epsilon, epsilon, analytical)
-    return np.sqrt(np.mean(((numerical - analytical) / analytical_safe)**2))
+    return np.sqrt(np.mean(((numerical - analytical) / analytical_safe)**2, axis=-1))
 
 
 def mean_absolute_percentage_error(numerical: np.ndarray, analytical: np.ndarray,
@@ -131,12 +155,12 @@ def mean_absolute_percentage_error(numerical: np.ndarray, analytical: np.ndarray
     This expresses the error as a percentage.
     
     Args:
-        numerical: Numerical solution values
-        analytical: Analytical solution values
+        numerical: Numerical solution values, shape [..., X]
+        analytical: Analytical solution values, same shape
         epsilon: Small value to avoid division by zero
         
     Returns:
-        MAPE in percentage (scalar)
+        MAPE in percentage (scalar, or shape [...] for stacked input)
     """
     return 100.0 * relative_l1_norm(numerical, analytical, epsilon)
 
@@ -153,11 +177,13 @@ class ErrorMetricRegistry:
     - Easy addition of new error metrics
     - Consistent interface for all metrics
     - Dynamic metric selection at runtime
+    - Batched evaluation over stacked [..., X] arrays (``calculate_batch``)
     """
     
     def __init__(self):
         self._metrics: Dict[str, Callable] = {}
         self._descriptions: Dict[str, str] = {}
+        self._vectorized: Dict[str, bool] = {}
         
         # Register default metrics
         self._register_default_metrics()
@@ -165,24 +191,25 @@ class ErrorMetricRegistry:
     def _register_default_metrics(self):
         """Register all built-in error metrics."""
         self.register('l1', l1_norm, 
-                     'L1 norm (mean absolute error)')
+                     'L1 norm (mean absolute error)', vectorized=True)
         
         self.register('l2', l2_norm,
-                     'L2 norm (root mean square error)')
+                     'L2 norm (root mean square error)', vectorized=True)
         
         self.register('linf', linf_norm,
-                     'L∞ norm (maximum absolute error)')
+                     'L∞ norm (maximum absolute error)', vectorized=True)
         
         self.register('relative_l1', relative_l1_norm,
-                     'Relative L1 norm')
+                     'Relative L1 norm', vectorized=True)
         
         self.register('relative_l2', relative_l2_norm,
-                     'Relative L2 norm')
+                     'Relative L2 norm', vectorized=True)
         
         self.register('mape', mean_absolute_percentage_error,
-                     'Mean Absolute Percentage Error')
+                     'Mean Absolute Percentage Error', vectorized=True)
     
-    def register(self, name: str, metric_func: Callable, description: str = ""):
+    def register(self, name: str, metric_func: Callable, description: str = "",
+                 vectorized: bool = False):
         """
         Register a new error metric.
         
@@ -190,12 +217,16 @@ class ErrorMetricRegistry:
             name: Unique identifier for the metric
             metric_func: Function that takes (numerical, analytical) and returns scalar error
             description: Human-readable description of the metric
+            vectorized: True if ``metric_func`` also accepts stacked [..., X] arrays and
+                reduces over the last axis only, returning shape [...]. Scalar metrics
+                are applied row by row by ``calculate_batch``.
         """
         if name in self._metrics:
             logger.warning(f"Overwriting existing metric '{name}'")
         
         self._metrics[name] = metric_func
         self._descriptions[name] = description
+        self._vectorized[name] = bool(vectorized)
         logger.debug(f"Registered error metric: {name}")
     
     def calculate(self, name: str, numerical: np.ndarray, 
@@ -219,7 +250,65 @@ class ErrorMetricRegistry:
             raise KeyError(f"Unknown error metric '{name}'. Available: {available}")
         
         return self._metrics[name](numerical, analytical)
-    
+
+    def get(self, name: str) -> Callable:
+        """
+        Get the function registered under a metric name.
+
+        Raises:
+            KeyError: If metric name is not registered
+        """
+        if name not in self._metrics:
+            available = ', '.join(self._metrics.keys())
+            raise KeyError(f"Unknown error metric '{name}'. Available: {available}")
+
+        return self._metrics[name]
+
+    def is_vectorized(self, name: str) -> bool:
+        """Whether a registered metric reduces stacked [..., X] arrays in one call."""
+        self.get(name)
+        return self._vectorized[name]
+
+    def calculate_batch(self, name: str, numerical: np.ndarray,
+                        analytical: np.ndarray) -> np.ndarray:
+        """
+        Calculate a metric for every row of stacked arrays.
+        
+        Vectorized metrics are called once on the whole array; scalar metrics fall
+        back to one call per row.
+        
+        Args:
+            name: Name of the registered metric
+            numerical: Numerical solution values, shape [..., X] (e.g. [T, X] or [R, T, X])
+            analytical: Analytical solution values, same shape
+            
+        Returns:
+            Error values reduced over the last axis, shape [...]
+            
+        Raises:
+            KeyError: If metric name is not registered
+            ValueError: If the shapes differ or a vectorized metric returns the wrong shape
+        """
+        metric_func = self.get(name)
+        numerical = np.asarray(numerical)
+        analytical = np.asarray(analytical)
+        if numerical.shape != analytical.shape or numerical.ndim == 0:
+            raise ValueError(f"Metric '{name}' needs arrays of equal shape [..., X], "
+                             f"got {numerical.shape} and {analytical.shape}")
+        
+        if self._vectorized[name]:
+            values = np.asarray(metric_func(numerical, analytical), dtype=np.float64)
+            if values.shape != numerical.shape[:-1]:
+                raise ValueError(f"Vectorized metric '{name}' returned shape {values.shape}, "
+                                 f"expected {numerical.shape[:-1]}")
+            return values
+        
+        # Scalar metric: one call per 1D row
+        n_x = numerical.shape[-1]
+        values = [metric_func(num, ana) for num, ana in
+                  zip(numerical.reshape(-1, n_x), analytical.reshape(-1, n_x))]
+        return np.asarray(values, dtype=np.float64).reshape(numerical.shape[:-1])
+
     def calculate_all(self, numerical: np.ndarray, 
                      analytical: np.ndarray) -> Dict[str, float]:
         """
@@ -308,7 +397,7 @@ def calculate_all_errors(numerical: np.ndarray,
 
 
 def register_custom_metric(name: str, metric_func: Callable, 
-                          description: str = ""):
+                          description: str = "", vectorized: bool = False):
     """
     Convenience function to register a custom error metric.
     
@@ -316,28 +405,35 @@ def register_custom_metric(name: str, metric_func: Callable,
         name: Unique identifier for the metric
         metric_func: Function that takes (numerical, analytical) and returns scalar error
         description: Human-readable description of the metric
+        vectorized: True if ``metric_func`` reduces stacked [..., X] arrays over the
+            last axis (see ``ErrorMetricRegistry.register``)
         
     Example:
         >>> def my_custom_error(num, ana):
-        ...     return np.sum((num - ana)**4)
+        ...     return np.sum((num - ana)**4, axis=-1)
         >>> 
-        >>> register_custom_metric('l4', my_custom_error, 'L4 norm')
+        >>> register_custom_metric('l4', my_custom_error, 'L4 norm', vectorized=True)
     """
-    METRIC_REGISTRY.register(name, metric_func, description)
+    METRIC_REGISTRY.register(name, metric_func, description, vectorized=vectorized)
 
 
 # ============================================================
 # HELPER FUNCTIONS FOR BATCH PROCESSING
 # ============================================================
 
-def calculate_errors_over_time(numerical_list: list, analytical_list: list,
+def calculate_errors_over_time(numerical_list: Union[Sequence[np.ndarray], np.ndarray],
+                               analytical_list: Union[Sequence[np.ndarray], np.ndarray],
                                metrics: list = None) -> Dict[str, list]:
     """
     Calculate error metrics across multiple timesteps.
     
+    Snapshots on a common grid are stacked and each metric is evaluated in one
+    ``calculate_batch`` call. If that fails, or the snapshots cannot be stacked,
+    the metric is evaluated per timestep and failing timesteps give NaN.
+    
     Args:
-        numerical_list: List of numerical solution arrays (one per timestep)
-        analytical_list: List of analytical solution arrays (one per timestep)
+        numerical_list: Numerical solution arrays, one per timestep (or a [T, X] array)
+        analytical_list: Analytical solution arrays, one per timestep (or a [T, X] array)
         metrics: List of metric names to calculate (default: ['l1', 'l2'])
         
     Returns:
@@ -354,10 +450,24 @@ def calculate_errors_over_time(numerical_list: list, analytical_list: list,
     if metrics is None:
         metrics = ['l1', 'l2']
     
-    results = {metric: [] for metric in metrics}
+    n = min(len(numerical_list), len(analytical_list))
+    numerical_list, analytical_list = numerical_list[:n], analytical_list[:n]
     
-    for num, ana in zip(numerical_list, analytical_list):
-        for metric in metrics:
+    stacked = None
+    if n and len({np.shape(a) for a in (*numerical_list, *analytical_list)}) == 1:
+        stacked = np.asarray(numerical_list), np.asarray(analytical_list)
+    
+    results = {}
+    for metric in metrics:
+        if stacked is not None:
+            try:
+                results[metric] = list(METRIC_REGISTRY.calculate_batch(metric, *stacked))
+                continue
+            except Exception as e:
+                logger.debug(f"Batched {metric} failed ({e}), calculating per timestep")
+        
+        results[metric] = []
+        for num, ana in zip(numerical_list, analytical_list):
             try:
                 error_val = METRIC_REGISTRY.calculate(metric, num, ana)
                 results[metric].append(error_val)
@@ -407,3 +517,57 @@ def calculate_convergence_rate(errors: list, resolutions: list,
     logger.info(f"  (error ∝ dx^{convergence_rate:.3f})")
     
     return convergence_rate
+
+
+def calculate_convergence_rates(errors: np.ndarray, resolutions: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Fit convergence rates of many resolution ladders at once.
+
+    Batched version of ``calculate_convergence_rate``: the least-squares line
+    log(error) = p * log(dx) + c is fitted along the last axis for every leading
+    index in one array expression. Ladders of different lengths are padded with
+    NaN; non-finite or non-positive entries are left out of their fit.
+
+    Args:
+        errors: Error values, shape [..., R] for R resolutions
+        resolutions: Grid spacings (dx values), broadcastable to ``errors``
+
+    Returns:
+        Dictionary of arrays of shape [...]:
+        'rate' (p), 'intercept' (c), 'r_squared' of the fit and 'n_points' used;
+        rate and intercept are NaN where fewer than 2 distinct dx remain
+
+    Example:
+        >>> errors = np.array([[1e-3, 2.5e-4, 6.25e-5], [4e-3, 2e-3, 1e-3]])
+        >>> calculate_convergence_rates(errors, [0.01, 0.005, 0.0025])['rate']
+        array([2., 1.])
+    """
+    errors = np.asarray(errors, dtype=np.float64)
+    resolutions = np.broadcast_to(np.asarray(resolutions, dtype=np.float64), errors.shape)
+
+    valid = np.isfinite(errors) & np.isfinite(resolutions) & (errors > 0) & (resolutions > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_dx = np.where(valid, np.log(np.where(valid, resolutions, 1.0)), 0.0)
+        log_err = np.where(valid, np.log(np.where(valid, errors, 1.0)), 0.0)
+
+        n_points = valid.sum(axis=-1)
+        mean_x = log_dx.sum(axis=-1) / n_points
+        mean_y = log_err.sum(axis=-1) / n_points
+        dx_c = np.where(valid, log_dx - mean_x[..., None], 0.0)
+        dy_c = np.where(valid, log_err - mean_y[..., None], 0.0)
+
+        sxx = (dx_c * dx_c).sum(axis=-1)
+        sxy = (dx_c * dy_c).sum(axis=-1)
+        syy = (dy_c * dy_c).sum(axis=-1)
+
+        fitted = (n_points >= 2) & (sxx > 0)
+        rate = np.where(fitted, sxy / sxx, np.nan)
+        intercept = np.where(fitted, mean_y - rate * mean_x, np.nan)
+        r_squared = np.where(fitted & (syy > 0), sxy * sxy / (sxx * syy), np.where(fitted, 1.0, np.nan))
+
+    return {
+        'rate': rate,
+        'intercept': intercept,
+        'r_squared': r_squared,
+        'n_points': n_points,
+    }
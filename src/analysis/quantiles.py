@@ -0,0 +1,254 @@
+# src/analysis/quantiles.py
+"""
+Summary statistics and percentiles of error matrices, exact or streamed.
+
+``exact_statistics`` computes the minimum, maximum, median and all requested
+percentiles of an in-memory array with a single ``np.percentile`` call (one
+partition pass) instead of one sort or partition per statistic.
+
+``QuantileSketch`` is a mergeable streaming alternative for matrices that do not
+fit in memory, or for statistics across many runs. It keeps a histogram with
+logarithmically spaced buckets (the DDSketch scheme), so every quantile estimate
+is within a chosen relative accuracy of a value in the data, whatever the
+dynamic range of the errors. It is updated one block (e.g. one timestep) at a
+time, and sketches of different runs can be merged. Count, minimum, maximum,
+mean and standard deviation are tracked exactly.
+"""
+
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+
+# Percentiles reported by get_error_statistics
+DEFAULT_PERCENTILES = (10, 25, 75, 90, 95, 99)
+
+
+def _percentile_key(q: float) -> str:
+    return f"p{q:g}"
+
+
+def _statistics(minimum: float, maximum: float, mean: float, median: float, std: float,
+                percentile_values: Dict[float, float]) -> Dict:
+    return {
+        'min': float(minimum),
+        'max': float(maximum),
+        'mean': float(mean),
+        'median': float(median),
+        'std': float(std),
+        'percentiles': {_percentile_key(q): float(v) for q, v in percentile_values.items()},
+    }
+
+
+def _empty_statistics(percentiles: Sequence[float]) -> Dict:
+    return _statistics(0.0, 0.0, 0.0, 0.0, 0.0, {q: 0.0 for q in percentiles})
+
+
+def exact_statistics(values: np.ndarray, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
+    """
+    Exact statistics of the finite entries of an array.
+
+    Args:
+        values: Array of any shape (e.g. a [time, space] error matrix)
+        percentiles: Percentiles to report, in [0, 100]
+
+    Returns:
+        Dictionary with 'min', 'max', 'mean', 'median', 'std' and 'percentiles'
+        ({'p10': ..., ...}); all zero if there are no finite entries
+    """
+    valid = np.asarray(values)[np.isfinite(values)]
+    if valid.size == 0:
+        return _empty_statistics(percentiles)
+
+    mean = np.mean(valid)
+    std = np.std(valid)
+    # One partition pass for everything order-based; valid is a private copy
+    q = [0.0, 50.0, 100.0, *percentiles]
+    quantiles = np.percentile(valid, q, overwrite_input=True)
+
+    return _statistics(quantiles[0], quantiles[2], mean, quantiles[1], std,
+                       dict(zip(percentiles, quantiles[3:])))
+
+
+class _Buckets:
+    """Dense bucket counts indexed by integer key, grown on demand."""
+
+    __slots__ = ('offset', 'counts')
+
+    def __init__(self):
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def _cover(self, lo: int, hi: int):
+        if self.counts.size == 0:
+            self.offset, self.counts = lo, np.zeros(hi - lo + 1, dtype=np.int64)
+            return
+        new_lo, new_hi = min(lo, self.offset), max(hi, self.offset + self.counts.size - 1)
+        if new_lo < self.offset or new_hi >= self.offset + self.counts.size:
+            counts = np.zeros(new_hi - new_lo + 1, dtype=np.int64)
+            counts[self.offset - new_lo:self.offset - new_lo + self.counts.size] = self.counts
+            self.offset, self.counts = new_lo, counts
+
+    def add(self, keys: np.ndarray):
+        if keys.size:
+            lo, hi = int(keys.min()), int(keys.max())
+            self._cover(lo, hi)
+            start = lo - self.offset
+            self.counts[start:start + hi - lo + 1] += np.bincount(keys - lo, minlength=hi - lo + 1)
+
+    def merge(self, other: '_Buckets'):
+        if other.counts.size:
+            self._cover(other.offset, other.offset + other.counts.size - 1)
+            start = other.offset - self.offset
+            self.counts[start:start + other.counts.size] += other.counts
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming sketch of a distribution of values.
+
+    Example:
+        >>> sketch = QuantileSketch(relative_accuracy=0.01)
+        >>> for row in error_matrix:          # e.g. a memory-mapped [T, X] matrix
+        ...     sketch.update(row)
+        >>> sketch.merge(other_run_sketch)    # statistics across runs
+        >>> stats = sketch.statistics()       # same structure as exact_statistics
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Args:
+            relative_accuracy: Bound on the relative error of quantile estimates, in (0, 1)
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(f"relative_accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+
+        self._positive = _Buckets()
+        self._negative = _Buckets()    # keyed by |value|
+        self.zero_count = 0
+
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _keys(self, magnitudes: np.ndarray) -> np.ndarray:
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def _merge_moments(self, n: int, mean: float, m2: float):
+        # Chan et al. pairwise update of count, mean and sum of squared deviations
+        total = self.count + n
+        delta = mean - self._mean
+        self._mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    def update(self, values) -> 'QuantileSketch':
+        """
+        Add the finite entries of an array of any shape.
+
+        Returns:
+            The sketch itself, so updates can be chained
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return self
+
+        mean = np.mean(values)
+        self._merge_moments(values.size, mean, float(np.sum((values - mean)**2)))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+        self._positive.add(self._keys(values[values > 0.0]))
+        self._negative.add(self._keys(-values[values < 0.0]))
+        self.zero_count += int(np.count_nonzero(values == 0.0))
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """
+        Add the contents of another sketch, e.g. of another run.
+
+        Raises:
+            ValueError: If the sketches were built with different accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(f"Cannot merge sketches with relative accuracy {self.relative_accuracy} "
+                             f"and {other.relative_accuracy}")
+        if other.count:
+            self._merge_moments(other.count, other._mean, other._m2)
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._positive.merge(other._positive)
+            self._negative.merge(other._negative)
+            self.zero_count += other.zero_count
+        return self
+
+    def _value(self, key: int) -> float:
+        # Point of bucket (gamma^(key-1), gamma^key] with the smallest relative error
+        return 2.0 * self._gamma**key / (self._gamma + 1.0)
+
+    def quantiles(self, percentiles: Iterable[float]) -> np.ndarray:
+        """
+        Estimate percentiles (rank q/100 * (count - 1), as NumPy's linear method).
+
+        The 0th and 100th percentiles are the exact minimum and maximum.
+
+        Returns:
+            Array of estimates (NaN for an empty sketch)
+        """
+        percentiles = np.asarray(list(percentiles), dtype=np.float64)
+        if self.count == 0:
+            return np.full(percentiles.shape, np.nan)
+
+        # Buckets in ascending order of value: negatives (largest magnitude first), zero, positives
+        neg_counts = self._negative.counts[::-1]
+        neg_keys = self._negative.offset + np.arange(self._negative.counts.size)[::-1]
+        cumulative = np.cumsum(np.concatenate([neg_counts, [self.zero_count], self._positive.counts]))
+        n_neg = neg_counts.size
+
+        estimates = np.empty(percentiles.shape)
+        for i, q in enumerate(percentiles):
+            if q <= 0.0:
+                estimates[i] = self.min
+                continue
+            if q >= 100.0:
+                estimates[i] = self.max
+                continue
+            rank = q / 100.0 * (self.count - 1)
+            bucket = int(np.searchsorted(cumulative, rank, side='right'))
+            if bucket < n_neg:
+                value = -self._value(int(neg_keys[bucket]))
+            elif bucket == n_neg:
+                value = 0.0
+            else:
+                value = self._value(self._positive.offset + bucket - n_neg - 1)
+            estimates[i] = min(max(value, self.min), self.max)
+        return estimates
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else np.nan
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self._m2 / self.count)) if self.count else np.nan
+
+    def statistics(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
+        """Statistics with the same structure as ``exact_statistics``."""
+        if self.count == 0:
+            return _empty_statistics(percentiles)
+        estimates = self.quantiles([50.0, *percentiles])
+        return _statistics(self.min, self.max, self.mean, estimates[0], self.std,
+                           dict(zip(percentiles, estimates[1:])))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return (f"QuantileSketch(count={self.count}, relative_accuracy={self.relative_accuracy}, "
+                f"buckets={self._positive.counts.size + self._negative.counts.size})")
@@ -0,0 +1,310 @@
+# src/analysis/riemann.py
+"""
+Exact Riemann solver for the Sod shock tube, vectorized over time and space.
+
+``pencil.calc.shocktube.sod`` is replaced by a self-contained NumPy solver. The
+star-region state between the two nonlinear waves (pressure p*, velocity u* and
+the densities on either side of the contact) depends only on the left and right
+initial states, so it is solved once per parameter set with a Newton iteration
+on the pressure function (Toro, "Riemann Solvers and Numerical Methods for Fluid
+Dynamics", ch. 4) and cached. The self-similar solution is then sampled at
+S = (x - x0) / t for a whole [T, X] grid in one pass.
+
+The initial states are taken from the Pencil Code params object in the same way
+as the runs set them up: ``rho_left``/``rho_right`` and ``ss_left``/``ss_right``
+across a jump at ``xjump_mid``, at rest unless ``uu_left``/``uu_right`` are set.
+The pressure follows from the entropy relation of ``src.analysis.thermodynamics``.
+"""
+
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Dict, Iterable, Sequence
+
+import numpy as np
+
+from src.analysis.thermodynamics import thermodynamic_constants
+
+
+# Outputs that can be requested in addition to rho, ux and pp, as with sod(..., magic=[...])
+MAGIC_VARIABLES = ('ee', 'TT')
+
+
+def _scalar(value) -> float:
+    """First entry of a params value that may be stored as an array."""
+    return float(np.ravel(value)[0])
+
+
+def initial_states(params) -> Dict:
+    """
+    Left and right primitive states of the shock tube from a params object.
+
+    Args:
+        params: Pencil Code params object (rho_left/right, ss_left/right, cp, gamma;
+            rho0, cs0, xjump_mid and uu_left/right are optional)
+
+    Returns:
+        Dictionary with 'left' and 'right' (rho, u, p) tuples, 'gamma', 'x0' and
+        the thermodynamic constants 'cp' and 'cv'
+    """
+    c = thermodynamic_constants(params)
+    cp, gamma = c['cp'], c['gamma']
+
+    def state(side: str) -> tuple:
+        rho = _scalar(getattr(params, f'rho_{side}'))
+        ss = _scalar(getattr(params, f'ss_{side}'))
+        u = _scalar(getattr(params, f'uu_{side}', 0.0))
+        p = (cp - c['cv']) * np.exp(c['lnTT0'] + gamma / cp * ss + gamma * np.log(rho)
+                                    - (gamma - 1.0) * c['lnrho0'])
+        return rho, u, float(p)
+
+    return {
+        'left': state('left'),
+        'right': state('right'),
+        'gamma': gamma,
+        'x0': _scalar(getattr(params, 'xjump_mid', 0.0)),
+        'cp': cp,
+        'cv': c['cv'],
+    }
+
+
+def _pressure_function(p: float, rho: float, pk: float, ck: float, gamma: float) -> tuple:
+    """Toro's f_K(p) and its derivative for one side of the contact."""
+    if p > pk:
+        # Shock
+        a = 2.0 / ((gamma + 1.0) * rho)
+        b = (gamma - 1.0) / (gamma + 1.0) * pk
+        root = np.sqrt(a / (p + b))
+        return (p - pk) * root, root * (1.0 - 0.5 * (p - pk) / (p + b))
+    # Rarefaction
+    ratio = p / pk
+    f = 2.0 * ck / (gamma - 1.0) * (ratio ** ((gamma - 1.0) / (2.0 * gamma)) - 1.0)
+    df = ratio ** (-(gamma + 1.0) / (2.0 * gamma)) / (rho * ck)
+    return f, df
+
+
+@lru_cache(maxsize=64)
+def solve_star_state(left: tuple, right: tuple, gamma: float,
+                     tol: float = 1e-12, max_iter: int = 100) -> Dict[str, float]:
+    """
+    Solve for the star region of a Riemann problem.
+
+    Results are cached, so repeated calls for the same run are free.
+
+    Args:
+        left: Left state (rho, u, p)
+        right: Right state (rho, u, p)
+        gamma: Adiabatic index
+        tol: Relative pressure change at which the Newton iteration stops
+        max_iter: Maximum number of Newton iterations
+
+    Returns:
+        Dictionary with p_star, u_star, rho_star_left, rho_star_right and the
+        sound speeds c_left, c_right
+
+    Raises:
+        ValueError: If the states generate a vacuum or the iteration does not converge
+    """
+    rho_l, u_l, p_l = left
+    rho_r, u_r, p_r = right
+    c_l = np.sqrt(gamma * p_l / rho_l)
+    c_r = np.sqrt(gamma * p_r / rho_r)
+
+    if 2.0 / (gamma - 1.0) * (c_l + c_r) <= u_r - u_l:
+        raise ValueError("Initial states generate a vacuum; no exact Sod solution")
+
+    # Primitive-variable guess, kept positive
+    p = max(tol, 0.5 * (p_l + p_r) - 0.125 * (u_r - u_l) * (rho_l + rho_r) * (c_l + c_r))
+    for _ in range(max_iter):
+        f_l, df_l = _pressure_function(p, rho_l, p_l, c_l, gamma)
+        f_r, df_r = _pressure_function(p, rho_r, p_r, c_r, gamma)
+        p_new = max(tol, p - (f_l + f_r + u_r - u_l) / (df_l + df_r))
+        converged = 2.0 * abs(p_new - p) / (p_new + p) < tol
+        p = p_new
+        if converged:
+            break
+    else:
+        raise ValueError(f"Star pressure did not converge in {max_iter} iterations")
+
+    f_l, _ = _pressure_function(p, rho_l, p_l, c_l, gamma)
+    f_r, _ = _pressure_function(p, rho_r, p_r, c_r, gamma)
+    u = 0.5 * (u_l + u_r) + 0.5 * (f_r - f_l)
+
+    g = (gamma - 1.0) / (gamma + 1.0)
+
+    def star_density(rho_k: float, p_k: float) -> float:
+        ratio = p / p_k
+        if ratio > 1.0:
+            return rho_k * (ratio + g) / (g * ratio + 1.0)
+        return rho_k * ratio ** (1.0 / gamma)
+
+    return {
+        'p_star': float(p),
+        'u_star': float(u),
+        'rho_star_left': float(star_density(rho_l, p_l)),
+        'rho_star_right': float(star_density(rho_r, p_r)),
+        'c_left': float(c_l),
+        'c_right': float(c_r),
+    }
+
+
+def _sample_side(s: np.ndarray, state: tuple, rho_star: float, p_star: float, u_star: float,
+                 c: float, gamma: float, sign: float) -> tuple:
+    """
+    Sample the wave on one side of the contact at speeds ``s``.
+
+    ``sign`` is -1 for the left wave and +1 for the right one; with it the right
+    wave is the mirror image of the left one.
+
+    Returns:
+        Tuple (inside, rho, u, p) where ``inside`` marks the points between the
+        outer state and the contact (star state or rarefaction fan)
+    """
+    rho_k, u_k, p_k = state
+    ratio = p_star / p_k
+    # Speeds measured outwards from the contact
+    outward = sign * (s - u_k)
+
+    if ratio > 1.0:
+        # Shock: outer state beyond the shock, star state behind it
+        shock = c * np.sqrt((gamma + 1.0) / (2.0 * gamma) * ratio + (gamma - 1.0) / (2.0 * gamma))
+        behind = outward <= shock
+        return behind, np.where(behind, rho_star, rho_k), np.where(behind, u_star, u_k), np.where(behind, p_star, p_k)
+
+    # Rarefaction: head at c, tail at c_star, self-similar fan in between
+    tail = sign * (u_star - u_k) + c * ratio ** ((gamma - 1.0) / (2.0 * gamma))
+    behind = outward <= c
+    in_fan = behind & (outward > tail)
+
+    base = np.maximum(2.0 / (gamma + 1.0) + (gamma - 1.0) / ((gamma + 1.0) * c) * outward, 0.0)
+    fan_rho = rho_k * base ** (2.0 / (gamma - 1.0))
+    fan_u = 2.0 / (gamma + 1.0) * (-sign * c + (gamma - 1.0) / 2.0 * u_k + s)
+    fan_p = p_k * base ** (2.0 * gamma / (gamma - 1.0))
+
+    rho = np.where(in_fan, fan_rho, np.where(behind, rho_star, rho_k))
+    u = np.where(in_fan, fan_u, np.where(behind, u_star, u_k))
+    p = np.where(in_fan, fan_p, np.where(behind, p_star, p_k))
+    return behind, rho, u, p
+
+
+def _wave_speeds(state: tuple, p_star: float, u_star: float, c: float, gamma: float,
+                 sign: float) -> tuple:
+    """
+    Kind and speed range of the wave on one side of the contact.
+
+    Returns:
+        Tuple ('shock' or 'rarefaction', (slowest speed, fastest speed))
+    """
+    _, u_k, p_k = state
+    ratio = p_star / p_k
+    if ratio > 1.0:
+        shock = u_k + sign * c * np.sqrt((gamma + 1.0) / (2.0 * gamma) * ratio + (gamma - 1.0) / (2.0 * gamma))
+        return 'shock', (shock, shock)
+    # Head at c and tail at c_star, measured outwards from the contact as in _sample_side
+    head = u_k + sign * c
+    tail = u_star + sign * c * ratio ** ((gamma - 1.0) / (2.0 * gamma))
+    return 'rarefaction', (min(head, tail), max(head, tail))
+
+
+def wave_positions(params, t: Sequence[float]) -> Dict[str, tuple]:
+    """
+    Positions of the waves of the exact solution at the given times.
+
+    Args:
+        params: Pencil Code params object
+        t: Times, shape [T]
+
+    Returns:
+        Dictionary mapping 'rarefaction', 'contact' and 'shock' to (left edge,
+        right edge) arrays of shape [T]; edges coincide except for the fan. If both
+        nonlinear waves are of the same kind they are named e.g. 'shock_left' and
+        'shock_right'
+    """
+    init = initial_states(params)
+    gamma = init['gamma']
+    star = solve_star_state(init['left'], init['right'], gamma)
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+
+    left_kind, left_speeds = _wave_speeds(init['left'], star['p_star'], star['u_star'], star['c_left'],
+                                          gamma, sign=-1.0)
+    right_kind, right_speeds = _wave_speeds(init['right'], star['p_star'], star['u_star'], star['c_right'],
+                                            gamma, sign=1.0)
+    if left_kind == right_kind:
+        left_kind, right_kind = f"{left_kind}_left", f"{right_kind}_right"
+
+    speeds = {left_kind: left_speeds, 'contact': (star['u_star'], star['u_star']), right_kind: right_speeds}
+    return {name: (init['x0'] + lo * t, init['x0'] + hi * t) for name, (lo, hi) in speeds.items()}
+
+
+def exact_sod(x: np.ndarray, t: Sequence[float], params,
+              magic: Iterable[str] = ('ee',)) -> SimpleNamespace:
+    """
+    Exact Sod shock tube solution on a [T, X] grid.
+
+    Drop-in replacement for ``pencil.calc.shocktube.sod(x, t, par=params, magic=...)``.
+
+    Args:
+        x: Spatial grid, shape [X]
+        t: Times, shape [T] (a scalar is treated as one time)
+        params: Pencil Code params object
+        magic: Extra outputs: 'ee' (specific internal energy) and/or 'TT' (temperature)
+
+    Returns:
+        Namespace with ``rho``, ``ux``, ``pp`` and the requested extras, each of
+        shape [T, X]
+
+    Raises:
+        ValueError: For an unknown ``magic`` entry or states without a solution
+    """
+    magic = list(magic or ())
+    unknown = [m for m in magic if m not in MAGIC_VARIABLES]
+    if unknown:
+        raise ValueError(f"Unsupported magic variables {unknown}; available: {list(MAGIC_VARIABLES)}")
+
+    init = initial_states(params)
+    gamma = init['gamma']
+    star = solve_star_state(init['left'], init['right'], gamma)
+
+    x = np.asarray(x, dtype=np.float64).ravel()
+    t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+
+    # Similarity variable; at t = 0 the initial discontinuity is returned
+    dx = (x - init['x0'])[np.newaxis, :]
+    s = np.where(dx < 0.0, -np.inf, np.inf) * np.ones((t.size, 1))
+    np.divide(dx, t[:, np.newaxis], out=s, where=t[:, np.newaxis] > 0.0)
+
+    left = s <= star['u_star']
+    _, rho_l, u_l, p_l = _sample_side(s, init['left'], star['rho_star_left'], star['p_star'],
+                                      star['u_star'], star['c_left'], gamma, sign=-1.0)
+    _, rho_r, u_r, p_r = _sample_side(s, init['right'], star['rho_star_right'], star['p_star'],
+                                      star['u_star'], star['c_right'], gamma, sign=1.0)
+
+    solution = SimpleNamespace(
+        rho=np.where(left, rho_l, rho_r),
+        ux=np.where(left, u_l, u_r),
+        pp=np.where(left, p_l, p_r),
+    )
+    if 'ee' in magic:
+        solution.ee = solution.pp / (solution.rho * (gamma - 1.0))
+    if 'TT' in magic:
+        solution.TT = solution.pp / (solution.rho * (init['cp'] - init['cv']))
+    return solution
+
+
+def compare_with_pencil_sod(x: np.ndarray, t: Sequence[float], params) -> Dict[str, float]:
+    """
+    Compare ``exact_sod`` with ``pencil.calc.shocktube.sod`` on the same grid.
+
+    Requires the Pencil Code Python package.
+
+    Returns:
+        Maximum absolute difference per variable (rho, ux, pp, ee)
+    """
+    from pencil.calc.shocktube import sod
+
+    reference = sod(x, list(np.atleast_1d(t)), par=params, lplot=False, magic=['ee'])
+    solution = exact_sod(x, t, params, magic=['ee'])
+    return {
+        var: float(np.max(np.abs(getattr(solution, var) - np.reshape(getattr(reference, var),
+                                                                       getattr(solution, var).shape))))
+        for var in ('rho', 'ux', 'pp', 'ee')
+    }
@@ -0,0 +1,172 @@
+# src/analysis/run_cache.py
+"""
+Memory-bounded cache of the per-run results of ``analyze_suite_videos_only``.
+
+After PHASE 1 each run is reduced to a result dictionary (see ``_render_run``).
+Most of it is small (error norms, fronts, grid), but the error fields in
+``HEAVY_KEYS`` are [T, X] arrays per variable, so a cache of all runs grows
+linearly with the suite. ``RunResultCache`` keeps the small part of every run
+in memory and the heavy part of the most recently used runs only, within a byte
+budget. Heavy parts beyond the budget are dropped in LRU order; they are
+persisted in the run store (``src.analysis.run_store``) and read back on access.
+
+The cache is a read-only mapping in insertion order, so the cross-run phases
+iterate and index it like the dictionary it replaces. Indexing returns the full
+result; callers that only need the small part use ``light``, which never reads
+from the run store.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+import re
+from typing import Callable, Dict, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+
+# Fields of a run's result that hold error fields and are evicted under memory pressure
+HEAVY_KEYS = ('spatial_errors', 'normalized_errors')
+
+_SIZE_UNITS = {'': 1024 ** 2, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+
+def parse_memory_size(text: str) -> int:
+    """
+    Parse a memory size such as ``512M``, ``8G`` or ``1.5GB``.
+
+    Plain numbers are megabytes, as for SLURM's ``--mem``.
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size cannot be parsed or is not positive
+    """
+    match = re.fullmatch(r'\s*([0-9]*\.?[0-9]+)\s*([KMGT]?)(?:I?B)?\s*', str(text), flags=re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid memory size '{text}' (use e.g. 512M or 8G)")
+    size = int(float(match.group(1)) * _SIZE_UNITS[match.group(2).upper()])
+    if size <= 0:
+        raise ValueError(f"Memory size must be positive, got '{text}'")
+    return size
+
+
+def result_nbytes(value) -> int:
+    """Bytes held by the NumPy arrays nested in dictionaries, lists and tuples."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(result_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(result_nbytes(item) for item in value)
+    return 0
+
+
+def _format_size(nbytes: int) -> str:
+    return f"{nbytes / 1024 ** 2:.1f} MB"
+
+
+class RunResultCache(Mapping):
+    """
+    Per-run results with the heavy error fields kept within a memory budget.
+
+    Example:
+        >>> cache = RunResultCache(max_bytes=parse_memory_size('8G'),
+        ...                        load=lambda run_name: store.get_result(run_name, fingerprints[run_name]))
+        >>> cache.put(run_name, result)          # result already persisted in the store
+        >>> cache[run_name]['spatial_errors']    # read back from the store if evicted
+        >>> cache.light(run_name)['error_norms'] # never read back
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None, load: Optional[Callable[[str], Optional[Dict]]] = None):
+        """
+        Args:
+            max_bytes: Budget for the heavy fields of all runs (None for no limit)
+            load: Returns the persisted result of a run, or None. Without it nothing
+                is evicted.
+        """
+        self.max_bytes = max_bytes
+        self._load = load
+        self._light: Dict[str, Dict] = {}
+        self._heavy: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._evicted = set()
+        self.nbytes = 0
+        self.peak_nbytes = 0
+        self.evictions = 0
+        self.reloads = 0
+
+    def put(self, run_name: str, result: Dict):
+        """Add or replace the result of a run; may evict the heavy fields of other runs."""
+        self._drop(run_name)
+        self._light[run_name] = {key: value for key, value in result.items() if key not in HEAVY_KEYS}
+        self._insert(run_name, {key: result[key] for key in HEAVY_KEYS if key in result})
+
+    def light(self, run_name: str) -> Dict:
+        """Result of a run without the heavy fields; never reads from the run store."""
+        return dict(self._light[run_name])
+
+    def restrict(self, run_names: Iterable[str]):
+        """Keep only the given runs, in the given order."""
+        run_names = [run_name for run_name in run_names if run_name in self._light]
+        for run_name in set(self._light) - set(run_names):
+            self._drop(run_name)
+            del self._light[run_name]
+        self._light = {run_name: self._light[run_name] for run_name in run_names}
+
+    def stats(self) -> str:
+        """One-line summary of the memory use for logging."""
+        budget = _format_size(self.max_bytes) if self.max_bytes is not None else "unlimited"
+        return (f"{_format_size(self.nbytes)} of error fields held (peak {_format_size(self.peak_nbytes)}, "
+                f"budget {budget}), {self.evictions} evicted, {self.reloads} read back from the run store")
+
+    def _insert(self, run_name: str, heavy: Dict):
+        if not heavy:
+            return
+        size = result_nbytes(heavy)
+        self._heavy[run_name] = (heavy, size)
+        self.nbytes += size
+        self.peak_nbytes = max(self.peak_nbytes, self.nbytes)
+        self._evict()
+
+    def _drop(self, run_name: str):
+        self._evicted.discard(run_name)
+        if run_name in self._heavy:
+            self.nbytes -= self._heavy.pop(run_name)[1]
+
+    def _evict(self):
+        """Drops least recently used heavy fields until within budget (the newest run always stays)."""
+        if self.max_bytes is None or self._load is None:
+            return
+        while self.nbytes > self.max_bytes and len(self._heavy) > 1:
+            run_name, (_, size) = self._heavy.popitem(last=False)
+            self.nbytes -= size
+            self._evicted.add(run_name)
+            self.evictions += 1
+            logger.debug(f"Evicted error fields of {run_name} ({_format_size(size)})")
+
+    def __getitem__(self, run_name: str) -> Dict:
+        light = self._light[run_name]
+        if run_name in self._heavy:
+            self._heavy.move_to_end(run_name)
+            heavy = self._heavy[run_name][0]
+        elif run_name in self._evicted:
+            stored = self._load(run_name)
+            if stored is None:
+                raise KeyError(f"Error fields of {run_name} are no longer in the run store")
+            self.reloads += 1
+            self._evicted.discard(run_name)
+            heavy = {key: stored[key] for key in HEAVY_KEYS if key in stored}
+            self._insert(run_name, heavy)
+        else:
+            heavy = {}
+        return {**light, **heavy}
+
+    def __iter__(self):
+        return iter(self._light)
+
+    def __len__(self) -> int:
+        return len(self._light)
+
+    def __contains__(self, run_name) -> bool:
+        return run_name in self._light
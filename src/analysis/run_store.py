@@ -0,0 +1,227 @@
+# src/analysis/run_store.py
+"""
+Per-suite store of the reduced error results of each run.
+
+``--analyze`` and ``--error-norms`` both need the error norms of every run. Each
+run is reduced once to a small record:
+
+    - per-timestep error norms of every variable and metric
+    - tracked wave fronts
+    - analysed VAR files and grid spacing
+
+The record is written to ``analysis/<experiment>/error/store/<run>.json``, and
+a later ``--error-norms`` reads it back instead of loading the run again.
+``--analyze`` also needs the error fields, which the record does not hold, so it
+only reuses its own full results (see below).
+
+A record is only reused under the settings it was computed with: the snapshot
+selection, the error-norm region (``roi``) and, as a superset, the variables and
+metrics. Records computed under other settings are recomputed and overwritten.
+
+Every record also carries the fingerprint of its run (``run_fingerprint``): the
+name, size and modification time of each VAR file and the content hash of the
+analysis code. A record whose run was extended, rewritten or analysed by other
+code is not reused. ``--analyze`` additionally keeps the full per-run result of
+PHASE 1 (error fields included) next to the record, fingerprinted together with
+its rendering settings, so unchanged runs are neither reloaded nor re-rendered.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from loguru import logger
+
+from src.analysis.snapshot_store import var_file_signature
+
+
+# Bump when the content of stored records changes so old records are not reused
+STORE_VERSION = 2
+
+RECORD_SUFFIX = '.json'
+RESULT_SUFFIX = '.pkl'
+
+# Sources whose content hash versions the stored results
+CODE_DIR = Path(__file__).resolve().parents[1]
+
+
+def run_store_dir(analysis_dir: Path) -> Path:
+    """Returns the directory of the suite's run records."""
+    return analysis_dir / "error" / "store"
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """Content hash of the Python sources under ``src/`` (computed once per process)."""
+    digest = hashlib.sha256()
+    for source in sorted(CODE_DIR.rglob('*.py')):
+        digest.update(source.relative_to(CODE_DIR).as_posix().encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def run_fingerprint(files: Sequence[Path], config: Optional[dict] = None) -> str:
+    """
+    Content fingerprint of a run's inputs.
+
+    Args:
+        files: Input files of the run (its VAR files, plus e.g. ``param.nml``)
+        config: Further settings the result depends on (None for none)
+
+    Returns:
+        Hex digest over the name, size and modification time of each file,
+        ``config`` and ``code_version()``
+    """
+    digest = hashlib.sha256(code_version().encode('utf-8'))
+    digest.update(json.dumps(var_file_signature(list(files))).encode('utf-8'))
+    digest.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _jsonable(value):
+    """Plain JSON types for settings (tuples become lists, NumPy scalars floats)."""
+    return json.loads(json.dumps(value, default=float))
+
+
+def store_settings(metrics: Sequence[str], variables: Sequence[str], selection: Optional[dict],
+                   roi: Optional[dict]) -> Dict:
+    """
+    Settings a run record depends on.
+
+    Args:
+        metrics: Metrics of the stored norms
+        variables: Variables of the stored norms
+        selection: Snapshot selection (``resolve_snapshot_selection``)
+        roi: Error-norm region (``resolve_roi``), None for the whole domain
+    """
+    return {
+        'metrics': list(metrics),
+        'variables': list(variables),
+        'selection': _jsonable(dict(selection or {})),
+        'roi': _jsonable(roi),
+    }
+
+
+class RunResultStore:
+    """
+    Error norms, fronts and grid of each run of a suite, persisted as one JSON per run.
+
+    Example:
+        >>> store = RunResultStore(run_store_dir(analysis_dir))
+        >>> settings = store_settings(metrics, variables, selection, roi)
+        >>> record = store.get(run_name, settings, fingerprint)
+        >>> if record is None:
+        ...     record = {...}                      # load the run and compute the norms
+        ...     store.put(run_name, settings, record, fingerprint)
+    """
+
+    def __init__(self, store_dir: Path):
+        """
+        Args:
+            store_dir: Directory of the records (created on the first ``put``)
+        """
+        self.store_dir = Path(store_dir)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, run_name: str, suffix: str = RECORD_SUFFIX) -> Path:
+        return self.store_dir / f"{run_name}{suffix}"
+
+    def get(self, run_name: str, settings: Dict, fingerprint: Optional[str]) -> Optional[Dict]:
+        """
+        Return the stored record of a run if it was computed under ``settings``.
+
+        The stored metrics and variables may be a superset of the requested ones;
+        the returned norms are restricted to the requested ones.
+
+        Args:
+            run_name: Name of the run
+            settings: Output of ``store_settings``
+            fingerprint: Current ``run_fingerprint`` of the run (None never matches)
+
+        Returns:
+            Record with 'branch', 'error_norms', 'fronts', 'n_timesteps',
+            'var_files', 'dx' and 'nx', or None if there is no usable record
+        """
+        try:
+            with open(self._path(run_name), 'r') as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        stored_settings = stored.get('settings', {})
+        usable = (stored.get('version') == STORE_VERSION
+                  and fingerprint is not None and stored.get('fingerprint') == fingerprint
+                  and stored_settings.get('selection') == settings['selection']
+                  and stored_settings.get('roi') == settings['roi']
+                  and set(settings['metrics']) <= set(stored_settings.get('metrics', []))
+                  and set(settings['variables']) <= set(stored_settings.get('variables', [])))
+        if not usable:
+            logger.debug(f"Stored record of {run_name} was computed from other data or settings")
+            self.misses += 1
+            return None
+
+        record = stored['record']
+        record['error_norms'] = {
+            var: {metric: var_norms[metric] for metric in settings['metrics'] if metric in var_norms}
+            for var, var_norms in record['error_norms'].items() if var in settings['variables']
+        }
+        self.hits += 1
+        return record
+
+    def put(self, run_name: str, settings: Dict, record: Dict, fingerprint: Optional[str]):
+        """
+        Store the record of a run, replacing any previous one.
+
+        The file is written to a temporary path and renamed, so concurrent readers
+        never see a partial record.
+        """
+        payload = {'version': STORE_VERSION, 'settings': settings, 'fingerprint': fingerprint, 'record': record}
+        self._write(self._path(run_name), lambda f: f.write(json.dumps(payload, default=float).encode('utf-8')))
+
+    def get_result(self, run_name: str, fingerprint: Optional[str]) -> Optional[Dict]:
+        """
+        Return the stored PHASE 1 result of a run if its fingerprint is unchanged.
+
+        Args:
+            run_name: Name of the run
+            fingerprint: ``run_fingerprint`` over the run's files and rendering
+                settings (None never matches)
+
+        Returns:
+            The dictionary passed to ``put_result``, or None
+        """
+        try:
+            with open(self._path(run_name, RESULT_SUFFIX), 'rb') as f:
+                stored = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            self.misses += 1
+            return None
+
+        if (stored.get('version') != STORE_VERSION or fingerprint is None
+                or stored.get('fingerprint') != fingerprint):
+            logger.debug(f"Stored result of {run_name} is out of date")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return stored['result']
+
+    def put_result(self, run_name: str, fingerprint: Optional[str], result: Dict):
+        """Store the PHASE 1 result of a run under its fingerprint, replacing any previous one."""
+        payload = {'version': STORE_VERSION, 'fingerprint': fingerprint, 'result': result}
+        self._write(self._path(run_name, RESULT_SUFFIX),
+                    lambda f: pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _write(self, path: Path, dump):
+        """Writes a file through a temporary path and an atomic rename."""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        with open(tmp_path, 'wb') as f:
+            dump(f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,306 @@
+# src/analysis/snapshot_store.py
+"""
+Persistent columnar store for the processed VAR snapshots of a run.
+
+Reading every VAR file with ``pencil.read.var`` and deriving pressure and energy
+is the dominant cost of a repeat analysis. This module consolidates the derived
+snapshots of a run into a single memory-mappable file so later analyses can skip
+that work entirely.
+
+File layout:
+    [8 bytes]  magic ``PCSNAP01``
+    [8 bytes]  little-endian uint64 length of the JSON header
+    [N bytes]  UTF-8 JSON header (array offsets, shapes, VAR file signature)
+    [padding]  up to the next 64-byte boundary
+    [data]     ``x[X]``, ``t[T]`` and one ``[T, X]`` array per field, each 64-byte aligned
+
+The store is invalidated whenever the name, size or modification time of any
+VAR file in the run changes.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+
+STORE_VERSION = 1
+STORE_SUFFIX = ".snap"
+STORE_FIELDS = ('rho', 'ux', 'pp', 'ee')
+
+_MAGIC = b"PCSNAP01"
+_ALIGN = 64
+_DTYPE = '<f8'
+
+
+def _align(offset: int) -> int:
+    """Rounds an offset up to the next alignment boundary."""
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def var_file_signature(var_files: List[Path]) -> List[Dict]:
+    """
+    Build the invalidation signature of a run's VAR files.
+
+    Args:
+        var_files: VAR file paths in VAR order
+
+    Returns:
+        List of {'name', 'size', 'mtime_ns'} entries, one per VAR file
+    """
+    signature = []
+    for var_file in var_files:
+        stat = var_file.stat()
+        signature.append({
+            'name': var_file.name,
+            'size': int(stat.st_size),
+            'mtime_ns': int(stat.st_mtime_ns)
+        })
+    return signature
+
+
+class SnapshotStoreWriter:
+    """
+    Incremental writer for a snapshot store.
+
+    Rows are appended one snapshot at a time, so a run can be consolidated while
+    it is being streamed without holding all snapshots in memory. Space is
+    reserved for every VAR file of the run and the header is rewritten on commit
+    to cover only the rows that were appended. Callers abort instead of committing
+    if a VAR file failed to load, since the signature still covers it.
+    The file only becomes visible at ``store_file`` once ``commit`` succeeds.
+    """
+
+    def __init__(self, store_file: Path, signature: List[Dict], capacity: int,
+                 x: np.ndarray, fields: tuple):
+        """
+        Args:
+            store_file: Destination path of the store
+            signature: Output of ``var_file_signature`` for the run's VAR files
+            capacity: Maximum number of snapshots (usually the number of VAR files)
+            x: Spatial grid shared by all snapshots
+            fields: Field names stored for each snapshot
+        """
+        self.store_file = store_file
+        self.signature = signature
+        self.capacity = capacity
+        self.x = np.asarray(x, dtype=_DTYPE)
+        self.fields = list(fields)
+        self.var_files = []
+        self.t = []
+        self._tmp_file = store_file.with_name(f"{store_file.name}.tmp{os.getpid()}")
+        self._file = None
+
+        # Lay out arrays relative to the start of the data section
+        n_x = self.x.size
+        self._arrays = {}
+        offset = 0
+        for name, shape in [('x', (n_x,)), ('t', (capacity,))] + [(f, (capacity, n_x)) for f in self.fields]:
+            self._arrays[name] = {'offset': offset, 'shape': list(shape)}
+            offset = _align(offset + int(np.prod(shape)) * np.dtype(_DTYPE).itemsize)
+
+        # The provisional header lists every VAR file; the final one can only be shorter
+        provisional = self._header([s['name'] for s in signature][:capacity] or [''] * capacity, capacity)
+        self._header_len = len(provisional)
+        self._data_start = _align(len(_MAGIC) + 8 + self._header_len)
+
+        store_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_file, 'wb')
+        self._file.write(_MAGIC)
+        self._file.write(struct.pack('<Q', self._header_len))
+        self._file.write(provisional)
+        self._write_array('x', self.x)
+
+    def _header(self, var_files: List[str], n_t: int) -> bytes:
+        arrays = {name: dict(spec) for name, spec in self._arrays.items()}
+        arrays['t']['shape'] = [n_t]
+        for name in self.fields:
+            arrays[name]['shape'] = [n_t, self.x.size]
+        header = {
+            'version': STORE_VERSION,
+            'dtype': _DTYPE,
+            'n_snapshots': n_t,
+            'n_x': int(self.x.size),
+            'fields': self.fields,
+            'var_files': var_files,
+            'signature': self.signature,
+            'arrays': arrays
+        }
+        return json.dumps(header).encode('utf-8')
+
+    def _write_array(self, name: str, values: np.ndarray, row: int = 0):
+        spec = self._arrays[name]
+        row_bytes = int(np.prod(spec['shape'][1:])) * np.dtype(_DTYPE).itemsize
+        self._file.seek(self._data_start + spec['offset'] + row * row_bytes)
+        self._file.write(np.ascontiguousarray(values, dtype=_DTYPE).tobytes())
+
+    def append(self, snapshot: dict) -> bool:
+        """
+        Append one snapshot.
+
+        Returns:
+            False if the snapshot does not fit the store (grid change or capacity
+            exceeded); the writer should then be aborted.
+        """
+        row = len(self.t)
+        if row >= self.capacity or np.shape(snapshot['x']) != self.x.shape:
+            return False
+        if any(f not in snapshot for f in self.fields):
+            return False
+
+        for name in self.fields:
+            self._write_array(name, snapshot[name], row)
+        self.t.append(float(snapshot['t']))
+        self.var_files.append(snapshot.get('var_file', f'VAR{row}'))
+        return True
+
+    def commit(self) -> bool:
+        """Finalise the header and atomically move the store into place."""
+        if self._file is None:
+            return False
+        try:
+            if not self.t:
+                self.abort()
+                return False
+
+            # Pad the final header to the reserved length so the data offsets stay valid
+            header = self._header(self.var_files, len(self.t))
+            if len(header) > self._header_len:
+                raise ValueError("final header exceeds the reserved header space")
+            header = header + b' ' * (self._header_len - len(header))
+            self._file.seek(len(_MAGIC) + 8)
+            self._file.write(header)
+            self._write_array('t', np.array(self.t, dtype=_DTYPE))
+            self._file.close()
+            self._file = None
+
+            os.replace(self._tmp_file, self.store_file)
+            logger.debug(f"Wrote snapshot store {self.store_file} ({len(self.t)} snapshots, {self.x.size} points)")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to write snapshot store {self.store_file}: {e}")
+            self.abort()
+            return False
+
+    def abort(self):
+        """Discard the partially written store."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._tmp_file.exists():
+            self._tmp_file.unlink()
+
+
+def create_store_writer(store_file: Path, signature: List[Dict], first_snapshot: dict,
+                        fields: tuple = STORE_FIELDS) -> Optional[SnapshotStoreWriter]:
+    """
+    Create a writer sized for a run, using its first snapshot for the grid and fields.
+
+    Args:
+        store_file: Destination path of the store
+        signature: Output of ``var_file_signature`` for the run's VAR files
+        first_snapshot: First processed snapshot of the run
+        fields: Candidate field names; only those present in the snapshot are stored
+
+    Returns:
+        A ``SnapshotStoreWriter``, or None if the file could not be created
+    """
+    try:
+        return SnapshotStoreWriter(store_file, signature, len(signature), first_snapshot['x'],
+                                   tuple(f for f in fields if f in first_snapshot))
+    except Exception as e:
+        logger.warning(f"Cannot create snapshot store {store_file}: {e}")
+        return None
+
+
+def write_snapshot_store(store_file: Path, snapshots: List[dict], signature: List[Dict],
+                         fields: tuple = STORE_FIELDS) -> bool:
+    """
+    Write processed snapshots of a run to a consolidated store file.
+
+    The file is written to a temporary path and atomically renamed, so a crashed
+    or concurrent analysis never leaves a half-written store behind.
+
+    Args:
+        store_file: Destination path of the store
+        snapshots: Snapshot dicts as produced by ``load_all_var_files``
+        signature: Output of ``var_file_signature`` for the run's VAR files
+        fields: Field names to store (must be present in every snapshot)
+
+    Returns:
+        True if the store was written, False otherwise
+    """
+    if not snapshots:
+        return False
+
+    fields = tuple(f for f in fields if all(f in s for s in snapshots))
+    writer = create_store_writer(store_file, signature, snapshots[0], fields)
+    if writer is None:
+        return False
+
+    for snapshot in snapshots:
+        if not writer.append(snapshot):
+            logger.warning(f"Not writing snapshot store {store_file.name}: grid changes between snapshots")
+            writer.abort()
+            return False
+
+    return writer.commit()
+
+
+def read_snapshot_store(store_file: Path, signature: List[Dict]) -> Optional[Dict]:
+    """
+    Open a consolidated store as read-only memory maps.
+
+    Args:
+        store_file: Path of the store
+        signature: Current ``var_file_signature`` of the run's VAR files
+
+    Returns:
+        None if the store is missing, stale or unreadable. Otherwise:
+        {
+            'x': np.ndarray,           # [X] memory-mapped grid
+            't': np.ndarray,           # [T] memory-mapped snapshot times
+            'fields': {name: np.ndarray},  # [T, X] memory-mapped fields
+            'var_files': list          # VAR file name of each snapshot
+        }
+    """
+    if not store_file.exists():
+        return None
+
+    try:
+        with open(store_file, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                logger.warning(f"Ignoring snapshot store with unknown format: {store_file}")
+                return None
+            (header_len,) = struct.unpack('<Q', f.read(8))
+            header = json.loads(f.read(header_len).decode('utf-8'))
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable snapshot store {store_file}: {e}")
+        return None
+
+    if header.get('version') != STORE_VERSION or header.get('signature') != signature:
+        logger.info(f"Snapshot store {store_file.name} is out of date, VAR files will be re-read")
+        return None
+
+    data_start = _align(len(_MAGIC) + 8 + header_len)
+
+    def _map(name):
+        spec = header['arrays'][name]
+        return np.memmap(store_file, dtype=header['dtype'], mode='r',
+                         offset=data_start + spec['offset'], shape=tuple(spec['shape']))
+
+    try:
+        return {
+            'x': _map('x'),
+            't': _map('t'),
+            'fields': {name: _map(name) for name in header['fields']},
+            'var_files': header['var_files']
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        # A store cut short (e.g. by a full disk) is smaller than its header says
+        logger.warning(f"Ignoring truncated snapshot store {store_file}: {e}")
+        return None
@@ -0,0 +1,133 @@
+# src/analysis/snapshots.py
+"""
+Compact container for the snapshots of one run.
+
+Run data used to be passed around as a list of dicts, one per VAR file, each
+holding its own ``x`` array, a reference to ``params`` and one 1D array per
+variable. ``SnapshotSeries`` stores the same data column-wise: one shared ``x``,
+a ``t`` vector and a contiguous ``[T, X]`` array per variable. Whole-run operations
+then become single array expressions.
+
+Indexing or iterating a series yields the familiar per-snapshot dicts (as views
+into the stacked arrays), so code written for the list-of-dicts layout keeps
+working unchanged.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+
+class SnapshotSeries:
+    """
+    Time series of 1D snapshots on a shared grid.
+
+    Example:
+        >>> series = SnapshotSeries.from_snapshots(all_sim_data)
+        >>> series.fields['rho'].shape      # [T, X]
+        >>> series[0]['rho'] is a view of series.fields['rho'][0]
+        >>> late = series[series.t > 0.1]   # boolean or slice selection -> SnapshotSeries
+    """
+
+    __slots__ = ('x', 't', 'fields', 'var_files', 'params')
+
+    def __init__(self, x: np.ndarray, t: Sequence[float], fields: Dict[str, np.ndarray],
+                 var_files: Optional[List[str]] = None, params=None):
+        """
+        Args:
+            x: Spatial grid shared by all snapshots, shape [X]
+            t: Snapshot times, shape [T]
+            fields: Variable name -> array of shape [T, X]
+            var_files: VAR file name of each snapshot (default: VAR0, VAR1, ...)
+            params: Pencil Code params object of the run (optional)
+        """
+        self.x = np.asarray(x)
+        self.t = np.asarray(t, dtype=np.float64)
+        self.fields = dict(fields)
+        self.var_files = list(var_files) if var_files is not None else [f'VAR{i}' for i in range(len(self.t))]
+        self.params = params
+
+        for name, values in self.fields.items():
+            if np.shape(values) != (len(self.t), self.x.size):
+                raise ValueError(f"Field '{name}' has shape {np.shape(values)}, "
+                                 f"expected {(len(self.t), self.x.size)}")
+
+    @classmethod
+    def from_snapshots(cls, snapshots: Sequence[dict],
+                       variables: Optional[Sequence[str]] = None) -> 'SnapshotSeries':
+        """
+        Stack a list of snapshot dicts into a series.
+
+        Args:
+            snapshots: Snapshot dicts with 'x', 't' and one entry per variable
+            variables: Variables to keep (default: every array-valued entry of the
+                first snapshot other than 'x')
+
+        Raises:
+            ValueError: If the list is empty or the grid changes between snapshots
+        """
+        if not snapshots:
+            raise ValueError("Cannot build a SnapshotSeries from an empty snapshot list")
+
+        first = snapshots[0]
+        x = np.asarray(first['x'])
+        if any(np.shape(s['x']) != x.shape for s in snapshots):
+            raise ValueError("Grid changes between snapshots; cannot stack them into a SnapshotSeries")
+
+        if variables is None:
+            variables = [k for k, v in first.items() if k != 'x' and isinstance(v, np.ndarray) and v.shape == x.shape]
+
+        return cls(
+            x=x,
+            t=[s['t'] for s in snapshots],
+            fields={var: np.stack([s[var] for s in snapshots]) for var in variables},
+            var_files=[s.get('var_file', f'VAR{i}') for i, s in enumerate(snapshots)],
+            params=first.get('params'),
+        )
+
+    @property
+    def variables(self) -> tuple:
+        """Names of the stored variables."""
+        return tuple(self.fields)
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def __getitem__(self, index):
+        """
+        An integer index returns one snapshot as a dict of views. A slice, index
+        array or boolean mask returns a new ``SnapshotSeries``.
+        """
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(f"Snapshot index {index} out of range for {len(self)} snapshots")
+            snapshot = {"x": self.x}
+            snapshot.update({var: values[index] for var, values in self.fields.items()})
+            snapshot["t"] = self.t[index]
+            snapshot["var_file"] = self.var_files[index]
+            if self.params is not None:
+                snapshot["params"] = self.params
+            return snapshot
+
+        positions = np.arange(len(self))[index]
+        return SnapshotSeries(
+            x=self.x,
+            t=self.t[index],
+            fields={var: values[index] for var, values in self.fields.items()},
+            var_files=[self.var_files[i] for i in positions],
+            params=self.params,
+        )
+
+    def __iter__(self) -> Iterator[dict]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dicts(self) -> List[dict]:
+        """List-of-dicts view for callers that need a real list."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        return (f"SnapshotSeries(n_snapshots={len(self)}, n_x={self.x.size}, "
+                f"variables={list(self.fields)})")
@@ -0,0 +1,325 @@
+# src/analysis/var_reader.py
+"""
+Native memory-mapped reader for single-processor Pencil Code VAR files.
+
+``pencil.read.var`` builds a full Python object for every snapshot: it reads all
+fields, trims ghost zones by copying and sets one attribute per field. For the 1D
+shock tube runs that overhead dominates the bytes actually read. This reader
+parses ``dim.dat`` and ``index.pro`` once per run, memory-maps the Fortran record
+layout of each ``VAR*`` file and returns the requested fields as zero-copy views
+of the file, with ghost zones removed by slicing.
+
+VAR file layout (Fortran unformatted sequential, 4-byte record markers):
+    record 1: f(mx, my, mz, nvar)                      -> C order [nvar, mz, my, mx]
+    record 2: t, x(mx), y(my), z(mz), dx, dy, dz[, deltay]
+
+Only the layout written by a single processor (``data/proc0/VAR*`` with
+``nprocx = nprocy = nprocz = 1``) is supported; ``NativeVarReader`` raises
+``ValueError`` for anything else so callers can fall back to ``pencil.read.var``.
+"""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+
+_MARKER = np.dtype('<i4')
+_PRECISIONS = {'S': np.dtype('<f4'), 'D': np.dtype('<f8')}
+
+
+def read_dim_file(dim_file: Path) -> Dict:
+    """
+    Parse a Pencil Code ``dim.dat`` file.
+
+    Args:
+        dim_file: Path to ``data/dim.dat`` or ``data/procN/dim.dat``
+
+    Returns:
+        Dictionary with mx, my, mz, mvar, maux, precision (numpy dtype),
+        nghostx/y/z and, when present, nprocx/y/z
+    """
+    with open(dim_file, 'r') as f:
+        lines = [line.split() for line in f if line.strip()]
+
+    mx, my, mz, mvar, maux = (int(v) for v in lines[0][:5])
+    precision = lines[1][0].strip().upper()
+    if precision not in _PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}' in {dim_file}")
+    nghostx, nghosty, nghostz = (int(v) for v in lines[2][:3])
+
+    dim = {
+        'mx': mx, 'my': my, 'mz': mz,
+        'mvar': mvar, 'maux': maux,
+        'precision': _PRECISIONS[precision],
+        'nghostx': nghostx, 'nghosty': nghosty, 'nghostz': nghostz
+    }
+    if len(lines) > 3 and len(lines[3]) >= 3:
+        dim['nprocx'], dim['nprocy'], dim['nprocz'] = (int(v) for v in lines[3][:3])
+    return dim
+
+
+def read_index_file(index_file: Path) -> Dict[str, int]:
+    """
+    Parse a Pencil Code ``index.pro`` file.
+
+    Args:
+        index_file: Path to ``data/index.pro``
+
+    Returns:
+        Mapping from field name (without the leading 'i', e.g. 'lnrho', 'ux', 'ss')
+        to its zero-based position in the f-array
+    """
+    index = {}
+    with open(index_file, 'r') as f:
+        for line in f:
+            if '=' not in line:
+                continue
+            name, value = (part.strip() for part in line.split('=', 1))
+            name = name.replace('$', '')
+            if not name.startswith('i') or len(name) < 2:
+                continue
+            try:
+                position = int(value)
+            except ValueError:
+                continue
+            if position > 0:
+                index[name[1:]] = position - 1
+    return index
+
+
+class NativeVarReader:
+    """
+    Memory-mapped VAR reader for one single-processor run.
+
+    The run's ``dim.dat``, ``index.pro`` and ``ldensity_nolog`` are read once at
+    construction; each ``read`` call only maps the requested VAR file.
+
+    Example:
+        >>> reader = NativeVarReader(run_path / "data")
+        >>> var = reader.read("VAR10", fields=['rho', 'ux', 'ss'])
+        >>> var.rho.shape, var.t
+    """
+
+    def __init__(self, data_dir: Path):
+        """
+        Args:
+            data_dir: The run's ``data`` directory
+
+        Raises:
+            ValueError: If the run was written by more than one processor
+            FileNotFoundError: If ``dim.dat`` or ``index.pro`` is missing
+        """
+        self.data_dir = Path(data_dir)
+        self.proc_dir = self.data_dir / "proc0" if (self.data_dir / "proc0").is_dir() else self.data_dir
+
+        global_dim = read_dim_file(self.data_dir / "dim.dat")
+        nprocs = global_dim.get('nprocx', 1) * global_dim.get('nprocy', 1) * global_dim.get('nprocz', 1)
+        if nprocs != 1:
+            raise ValueError(f"Native reader supports single-processor runs only ({nprocs} processors)")
+
+        local_dim_file = self.proc_dir / "dim.dat"
+        self.dim = read_dim_file(local_dim_file) if local_dim_file.exists() else global_dim
+        self.index = read_index_file(self.data_dir / "index.pro")
+        self.density_field = self._density_field()
+
+        d = self.dim
+        self._dtype = d['precision']
+        self._grid_points = d['mx'] * d['my'] * d['mz']
+        self._trim = (
+            slice(d['nghostz'], d['mz'] - d['nghostz']),
+            slice(d['nghosty'], d['my'] - d['nghosty']),
+            slice(d['nghostx'], d['mx'] - d['nghostx'])
+        )
+        logger.debug(f"Native VAR reader: mx={d['mx']}, my={d['my']}, mz={d['mz']}, "
+                     f"precision={self._dtype}, fields={sorted(self.index)}, density={self.density_field}")
+
+    def _density_field(self) -> Optional[str]:
+        """
+        Name under which the f-array stores the density: 'rho' or 'lnrho'.
+
+        Pencil Code can list ``ilnrho`` next to ``irho`` (both pointing to the
+        density slot) in ``ldensity_nolog`` runs, so the choice follows
+        ``ldensity_nolog`` in ``param.nml``. The index entry of that name is
+        added if only the other one is listed. Without ``param.nml`` the name
+        listed in index.pro is used, preferring 'lnrho'.
+        """
+        try:
+            nolog = bool(getattr(read_param_file(self.data_dir), 'ldensity_nolog', False))
+        except Exception as e:
+            logger.debug(f"Cannot read ldensity_nolog from {self.data_dir} ({e}), using index.pro")
+            return 'lnrho' if 'lnrho' in self.index else ('rho' if 'rho' in self.index else None)
+
+        name, other = ('rho', 'lnrho') if nolog else ('lnrho', 'rho')
+        if name not in self.index and other in self.index:
+            self.index[name] = self.index[other]
+        return name if name in self.index else None
+
+    def read(self, var_file_name: str, fields: Optional[Iterable[str]] = None) -> SimpleNamespace:
+        """
+        Map one VAR file and return trimmed fields as zero-copy views.
+
+        Args:
+            var_file_name: VAR file name inside the processor directory (e.g. 'VAR5')
+            fields: Field names to return (default: every field in index.pro that
+                is present in the file)
+
+        Returns:
+            Namespace with ``t``, trimmed ``x``, ``y``, ``z``, their spacings
+            ``dx``, ``dy``, ``dz`` and one attribute per field,
+            shaped [nz, ny, nx] like ``pencil.read.var(..., trimall=True)``
+
+        Raises:
+            ValueError: If the file does not match the layout described by dim.dat
+            KeyError: If a requested field is not in index.pro or not in the file
+        """
+        path = self.proc_dir / var_file_name
+        itemsize = self._dtype.itemsize
+
+        # Record 1: the f-array. Its length fixes the number of stored variables.
+        data_len = int(np.fromfile(path, dtype=_MARKER, count=1)[0])
+        nvar, remainder = divmod(data_len, self._grid_points * itemsize)
+        if remainder or nvar < 1:
+            raise ValueError(f"{var_file_name}: record length {data_len} does not match dim.dat")
+
+        data_offset = _MARKER.itemsize
+        f = np.memmap(path, dtype=self._dtype, mode='r', offset=data_offset,
+                      shape=(nvar, self.dim['mz'], self.dim['my'], self.dim['mx']))
+
+        closing_marker = int(np.fromfile(path, dtype=_MARKER, count=1, offset=data_offset + data_len)[0])
+        if closing_marker != data_len:
+            raise ValueError(f"{var_file_name}: corrupt record markers ({data_len} != {closing_marker})")
+
+        # Record 2: t, x, y, z, dx, dy, dz
+        grid_offset = data_offset + data_len + 2 * _MARKER.itemsize
+        mx, my, mz = self.dim['mx'], self.dim['my'], self.dim['mz']
+        n_grid = 1 + mx + my + mz + 3
+        grid = np.fromfile(path, dtype=self._dtype, count=n_grid, offset=grid_offset)
+        spacing = 1 + mx + my + mz
+
+        var = SimpleNamespace(
+            t=grid[0],
+            x=grid[1:1 + mx][self._trim[2]],
+            y=grid[1 + mx:1 + mx + my][self._trim[1]],
+            z=grid[1 + mx + my:spacing][self._trim[0]],
+            dx=grid[spacing],
+            dy=grid[spacing + 1],
+            dz=grid[spacing + 2],
+        )
+
+        names = list(fields) if fields is not None else [n for n, i in self.index.items() if i < nvar]
+        for name in names:
+            if name not in self.index:
+                raise KeyError(f"Field '{name}' not found in index.pro")
+            position = self.index[name]
+            if position >= nvar:
+                raise KeyError(f"Field '{name}' (index {position + 1}) not stored in {var_file_name}")
+            setattr(var, name, f[(position,) + self._trim])
+
+        return var
+
+
+def read_var_list(proc_dir: Path) -> Dict[str, float]:
+    """
+    Parse the ``varN.list`` file Pencil Code writes next to the VAR files.
+
+    Args:
+        proc_dir: Directory holding the VAR files (``data/proc0`` or ``data``)
+
+    Returns:
+        Mapping from VAR file name to snapshot time (empty if there is no list)
+    """
+    var_list = Path(proc_dir) / "varN.list"
+    if not var_list.exists():
+        return {}
+
+    times = {}
+    with open(var_list, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            try:
+                times[parts[0]] = float(parts[1].replace('D', 'E').replace('d', 'e'))
+            except ValueError:
+                continue
+    return times
+
+
+def read_var_time(var_file: Path, precision: np.dtype) -> float:
+    """
+    Read only the snapshot time of a VAR file.
+
+    The record markers locate the time at the start of record 2, so just a few
+    bytes are read; the f-array is skipped.
+
+    Args:
+        var_file: Path to a ``VAR*`` file
+        precision: Floating point dtype of the run (``read_dim_file(...)['precision']``)
+
+    Returns:
+        Snapshot time
+    """
+    data_len = int(np.fromfile(var_file, dtype=_MARKER, count=1)[0])
+    grid_offset = _MARKER.itemsize + data_len + 2 * _MARKER.itemsize
+    return float(np.fromfile(var_file, dtype=precision, count=1, offset=grid_offset)[0])
+
+
+def read_var_times(data_dir: Path, var_files: Iterable[Path]) -> Dict[str, float]:
+    """
+    Snapshot times of a run's VAR files without reading their fields.
+
+    Times come from ``varN.list`` where available; files missing from it have
+    their time read from the VAR file header (``read_var_time``).
+
+    Args:
+        data_dir: The run's ``data`` directory
+        var_files: Paths of the VAR files
+
+    Returns:
+        Mapping from VAR file name to snapshot time
+    """
+    var_files = list(var_files)
+    if not var_files:
+        return {}
+
+    listed = read_var_list(var_files[0].parent)
+    times = {p.name: listed[p.name] for p in var_files if p.name in listed}
+    missing = [p for p in var_files if p.name not in times]
+    if missing:
+        precision = read_dim_file(Path(data_dir) / "dim.dat")['precision']
+        times.update((p.name, read_var_time(p, precision)) for p in missing)
+    return times
+
+
+def read_param_file(data_dir: Path) -> SimpleNamespace:
+    """
+    Read a run's parameters from ``param.nml``.
+
+    Used when ``pencil.read.param`` is not available, and reads what it reads by
+    default (``param2=False``): the start parameters, not the run parameters of
+    ``param2.nml``. All namelist groups are merged into one namespace with
+    lower-case attribute names, arrays as numpy arrays.
+
+    Args:
+        data_dir: The run's ``data`` directory
+
+    Returns:
+        Namespace with one attribute per parameter
+
+    Raises:
+        FileNotFoundError: If ``param.nml`` is missing
+    """
+    import f90nml
+
+    path = Path(data_dir) / "param.nml"
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found")
+    params = SimpleNamespace()
+    for groups in f90nml.read(path).values():
+        for group in (groups if isinstance(groups, list) else [groups]):
+            for key, value in group.items():
+                setattr(params, key.lower(), np.asarray(value) if isinstance(value, list) else value)
+    return params
@@ -314,6 +314,56 @@ def create_error_evolution_plots(top_3, error_norms_cache, metrics, output_dir,
         logger.info(f"       └─ Saved {metric.upper()} evolution to {output_file.name}")
 
 
+def create_convergence_plots(study, output_dir, name):
+    """Create log-log error vs dx plots with fitted convergence orders, one figure per metric."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    var_labels = {'rho': r'$\rho$', 'ux': r'$u_x$', 'pp': r'$p$', 'ee': r'$e$'}
+    colors = plt.cm.viridis(np.linspace(0, 1, max(len(study['keys']), 1)))
+    
+    for m, metric in enumerate(study['metrics']):
+        n_vars = len(study['variables'])
+        n_cols = min(n_vars, 2)
+        n_rows = int(np.ceil(n_vars / n_cols))
+        fig, axes = plt.subplots(n_rows, n_cols, figsize=(8 * n_cols, 6 * n_rows), squeeze=False)
+        fig.suptitle(f'{name}: {metric.upper()} Convergence', fontsize=16, fontweight='bold')
+        axes = axes.flatten()
+        
+        for v, var in enumerate(study['variables']):
+            ax = axes[v]
+            for k, key in enumerate(study['keys']):
+                dx = study['dx'][k]
+                errors = study['errors'][k, v, m]
+                valid = np.isfinite(dx) & np.isfinite(errors) & (errors > 0)
+                if not valid.any():
+                    continue
+                
+                rate = study['rate'][k, v, m]
+                label = f'{key[:40]} (p={rate:.2f})' if np.isfinite(rate) else key[:40]
+                ax.plot(dx[valid], errors[valid], 'o', color=colors[k], markersize=6, label=label)
+                if np.isfinite(rate):
+                    fit_dx = dx[valid][[0, -1]]
+                    ax.plot(fit_dx, np.exp(study['intercept'][k, v, m]) * fit_dx**rate,
+                           '--', color=colors[k], linewidth=1.5, alpha=0.7)
+            
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+            ax.set_xlabel('Grid spacing dx', fontsize=10)
+            ax.set_ylabel(f'{metric.upper()} Error', fontsize=10)
+            ax.set_title(f'{var_labels.get(var, var)} - {metric.upper()} vs dx', fontsize=12)
+            if ax.get_legend_handles_labels()[0]:
+                ax.legend(fontsize=7, loc='best')
+            ax.grid(True, which='both', alpha=0.3)
+        
+        for ax in axes[n_vars:]:
+            ax.set_visible(False)
+        
+        plt.tight_layout()
+        output_file = output_dir / f"{name}_{metric}_convergence.png"
+        plt.savefig(output_file, dpi=150, bbox_inches='tight')
+        plt.close()
+        logger.info(f"       └─ Saved {metric.upper()} convergence plot to {output_file.name}")
+
+
 
 
 # ============================================================================
@@ -344,4 +394,5 @@ __all__ = [
     'create_best_performers_plot',
     'create_branch_comparison_plot',
     'create_error_evolution_plots',
+    'create_convergence_plots',
 ]
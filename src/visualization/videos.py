@@ -8,9 +8,23 @@ from loguru import logger
 from typing import Dict, List
 
 from src.experiment.naming import format_experiment_title, format_short_experiment_name
+from src.analysis.snapshots import SnapshotSeries
 
 
-def create_var_evolution_video(sim_data_list: List[dict], analytical_data_list: List[dict],
+def _all_values(data_list, var: str, scale: float = 1.0):
+    """Values of a variable over all snapshots as one flat array (None if absent).
+    
+    Accepts a list of snapshot dicts or a ``SnapshotSeries``; for a series this is a
+    single array expression over its [T, X] field.
+    """
+    if isinstance(data_list, SnapshotSeries):
+        return data_list.fields[var].ravel() * scale if var in data_list.fields else None
+    values = [d[var] * scale for d in data_list if var in d]
+    return np.concatenate(values) if values else None
+
+
+def create_var_evolution_video(sim_data_list: List[dict] | SnapshotSeries,
+                               analytical_data_list: List[dict] | SnapshotSeries,
                                output_path: Path, run_name: str,
                                variables: List[str] = ['rho', 'ux', 'pp', 'ee'],
                                fps: int = 2, save_frames: bool = False):
@@ -18,8 +32,8 @@ def create_var_evolution_video(sim_data_list: List[dict], analytical_data_list:
     Creates an animated GIF showing evolution of variables across all VAR files using matplotlib.
     
     Args:
-        sim_data_list: List of simulation data from all VAR files
-        analytical_data_list: List of analytical solutions for all VAR files
+        sim_data_list: Simulation data from all VAR files (list of dicts or SnapshotSeries)
+        analytical_data_list: Analytical solutions for all VAR files (list of dicts or SnapshotSeries)
         output_path: Directory to save the animation
         run_name: Name of the run for title
         variables: List of variables to plot
@@ -115,9 +129,8 @@ def create_var_evolution_video(sim_data_list: List[dict], analytical_data_list:
                 x_data = sim_data_list[0]['x']
                 ax.set_xlim(x_data.min(), x_data.max())
                 
-                all_sim_vals = [sd[var] for sd in sim_data_list if var in sd]
-                if all_sim_vals:
-                    all_vals = np.concatenate(all_sim_vals)
+                all_vals = _all_values(sim_data_list, var)
+                if all_vals is not None:
                     y_range = all_vals.max() - all_vals.min()
                     y_min = max(0, all_vals.min() - 0.1 * y_range)
                     y_max = all_vals.max() + 0.1 * y_range
@@ -130,11 +143,11 @@ def create_var_evolution_video(sim_data_list: List[dict], analytical_data_list:
             ax.set_xlim(x_data.min(), x_data.max())
             
             # Calculate y-limits across all timesteps
-            all_sim_vals = [sd[var]*unit_dict[var] for sd in sim_data_list if var in sd]
-            all_anal_vals = [ad[var]*unit_dict[var] for ad in analytical_data_list if var in ad]
+            all_sim_vals = _all_values(sim_data_list, var, unit_dict[var])
+            all_anal_vals = _all_values(analytical_data_list, var, unit_dict[var])
             
-            if all_sim_vals and all_anal_vals:
-                all_vals = np.concatenate([np.concatenate(all_sim_vals), np.concatenate(all_anal_vals)])
+            if all_sim_vals is not None and all_anal_vals is not None:
+                all_vals = np.concatenate([all_sim_vals, all_anal_vals])
                 if var_scales.get(var) == 'log':
                     y_min = np.min(all_vals[all_vals > 0]) * 0.5
                     y_max = np.max(all_vals) * 2.0
@@ -229,15 +242,16 @@ def create_var_evolution_video(sim_data_list: List[dict], analytical_data_list:
         plt.close()
 
 
-def create_var_evolution_frames(sim_data_list: List[dict], analytical_data_list: List[dict],
+def create_var_evolution_frames(sim_data_list: List[dict] | SnapshotSeries,
+                                analytical_data_list: List[dict] | SnapshotSeries,
                                 output_path: Path, run_name: str,
                                 variables: List[str] = ['rho', 'ux', 'pp', 'ee']):
     """
     Creates individual PNG frames showing evolution of variables.
     
     Args:
-        sim_data_list: List of simulation data from all VAR files
-        analytical_data_list: List of analytical solutions for all VAR files
+        sim_data_list: Simulation data from all VAR files (list of dicts or SnapshotSeries)
+        analytical_data_list: Analytical solutions for all VAR files (list of dicts or SnapshotSeries)
         output_path: Directory to save the frames (should be evolution base directory)
         run_name: Name of the run for title
         variables: List of variables to plot
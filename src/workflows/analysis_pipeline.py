@@ -14,12 +14,12 @@ from src.core.logging import setup_file_logging
 from src.core.config_loader import create_config_loader
 from src.experiment.job_manager import _ensure_manifest_exists
 from src.analysis.errors import (
-    calculate_std_deviation_across_vars, 
-    calculate_absolute_deviation_per_var,
-    calculate_spatial_errors,
     calculate_error_norms,
-    calculate_normalized_spatial_errors,
-    ExperimentErrorAnalyzer
+    ErrorNormAccumulator,
+    RunErrors,
+    ExperimentErrorAnalyzer,
+    ROI_HALF_WIDTH,
+    ROI_WAVES
 )
 from src.analysis.metrics import calculate_errors_over_time
 from src.visualization.plots import (
@@ -28,6 +28,7 @@ from src.visualization.plots import (
     create_best_performers_plot,
     create_branch_comparison_plot,
     create_error_evolution_plots,
+    create_convergence_plots,
 )
 from src.visualization.videos import (
     create_var_evolution_video,
@@ -42,6 +43,23 @@ from src.visualization.plots_plotly import (
 )
 from src.experiment.naming import format_experiment_title, format_short_experiment_name
 from src.analysis.organizer import AnalysisOrganizer
+from src.analysis.snapshot_store import (
+    STORE_SUFFIX,
+    var_file_signature,
+    read_snapshot_store,
+    write_snapshot_store,
+    create_store_writer
+)
+from src.analysis.var_reader import NativeVarReader, read_var_times, read_param_file
+from src.analysis.thermodynamics import derive_pressure_energy
+from src.analysis.riemann import exact_sod
+from src.analysis.analytical_cache import AnalyticalCache
+from src.analysis.snapshots import SnapshotSeries
+from src.analysis.fronts import FrontTracker, track_fronts
+from src.analysis.run_cache import RunResultCache
+from src.analysis.run_store import RunResultStore, run_fingerprint, run_store_dir, store_settings
+from src.workflows.phases import RUN_PHASES, resolve_phases
+from src.analysis.convergence import convergence_study, find_error_norms_summary, load_norm_records, save_convergence_table
 
 # --- Add Pencil Code Python Library to Path ---
 PENCIL_CODE_PYTHON_PATH = DIRS.root.parent / "pencil-code" / "python"
@@ -49,12 +67,13 @@ if str(PENCIL_CODE_PYTHON_PATH) not in sys.path:
     logger.info(f"Adding '{PENCIL_CODE_PYTHON_PATH}' to system path.")
     sys.path.insert(0, str(PENCIL_CODE_PYTHON_PATH))
 
+# Pencil is optional: the analytical solution is computed in-tree, and VAR files and
+# params can be read natively (see _open_var_reader and read_run_params).
 try:
     import pencil.read as read
-    from pencil.calc.shocktube import sod
 except ImportError as e:
-    logger.error(f"FATAL: Failed to import Pencil Code modules. {e}")
-    sys.exit(1)
+    read = None
+    logger.warning(f"Pencil Code Python modules not available ({e}), reading runs natively")
 
 def clear_directory(directory: Path):
     """Clears all files in a directory, creating it if it doesn't exist."""
@@ -66,12 +85,12 @@ def clear_directory(directory: Path):
 
 
 def get_analytical_solution(params, x: np.ndarray, t: float) -> dict | None:
-    """Calculates the analytical Sod shock tube solution."""
+    """Calculates the analytical Sod shock tube solution (``src.analysis.riemann``)."""
     try:
         if not hasattr(params, 'rho0'): setattr(params, 'rho0', 1.0)
         if not hasattr(params, 'cs0'): setattr(params, 'cs0', 1.0)
         
-        solution = sod(x, [t], par=params, lplot=False, magic=['ee'])
+        solution = exact_sod(x, [t], params, magic=['ee'])
         return {
             'rho': np.squeeze(solution.rho), 'ux': np.squeeze(solution.ux),
             'pp': np.squeeze(solution.pp), 'ee': np.squeeze(solution.ee), 'x': x, 't': t
@@ -80,74 +99,805 @@ def get_analytical_solution(params, x: np.ndarray, t: float) -> dict | None:
         logger.error(f"Failed to calculate analytical solution: {e}")
         return None
 
-def load_all_var_files(run_path: Path) -> list[dict] | None:
-    """Loads and processes all VAR files from a simulation run."""
+
+def get_analytical_series(params, x: np.ndarray, t, var_files: list[str] | None = None) -> SnapshotSeries | None:
+    """Calculates the analytical Sod shock tube solution for a whole vector of times.
+    
+    The exact Riemann solution is sampled on the whole [T, X] grid at once
+    instead of once per snapshot.
+    
+    Args:
+        params: Pencil Code params object of the run
+        x: Spatial grid, shape [X]
+        t: Snapshot times, shape [T]
+        var_files: VAR file names the times belong to
+    
+    Returns:
+        ``SnapshotSeries`` with [T, X] arrays for rho, ux, pp and ee, row i
+        belonging to t[i]. None if the solution fails.
+    """
     try:
-        if not run_path.is_dir():
-            logger.warning(f"Run directory not found: {run_path}")
+        if not hasattr(params, 'rho0'): setattr(params, 'rho0', 1.0)
+        if not hasattr(params, 'cs0'): setattr(params, 'cs0', 1.0)
+        
+        t = np.asarray(t, dtype=np.float64)
+        solution = exact_sod(x, t, params, magic=['ee'])
+        shape = (t.size, np.size(x))
+        return SnapshotSeries(
+            x=x,
+            t=t,
+            fields={var: np.reshape(getattr(solution, var), shape) for var in ANALYSIS_VARIABLES},
+            var_files=var_files,
+        )
+    except Exception as e:
+        logger.error(f"Failed to calculate analytical solutions: {e}")
+        return None
+
+
+def get_analytical_solutions(sim_data, cache: AnalyticalCache | None = None) -> SnapshotSeries | list[dict] | None:
+    """Calculates the analytical solution for every snapshot of a run.
+    
+    For a ``SnapshotSeries`` all times are solved in a single batched call
+    (``get_analytical_series``). A list of snapshot dicts, whose grid may change
+    between snapshots, is solved one snapshot at a time.
+    
+    Args:
+        sim_data: ``SnapshotSeries`` or list of snapshot dicts from ``load_all_var_files``
+        cache: Optional suite-wide cache; runs sharing initial state, grid and times
+            then reuse one solution (series only)
+    
+    Returns:
+        A ``SnapshotSeries`` sharing the simulation grid if ``sim_data`` is a series,
+        otherwise a list of analytical dicts. None if any solution fails.
+    """
+    if isinstance(sim_data, SnapshotSeries):
+        if not len(sim_data):
             return None
+        solve = lambda: get_analytical_series(sim_data.params, sim_data.x, sim_data.t, sim_data.var_files)
+        if cache is None:
+            return solve()
+        return cache.get_or_compute(sim_data.params, sim_data.x, sim_data.t, solve, var_files=sim_data.var_files)
+    
+    solutions = [get_analytical_solution(s['params'], s['x'], s['t']) for s in sim_data]
+    if not solutions or not all(solutions):
+        return None
+    return solutions
+
+
+def find_timestep_mismatch(sim_data, analytical_data, tolerance: float = 1e-10) -> int | None:
+    """Checks that simulation and analytical snapshots are paired at the same times.
+    
+    Returns:
+        Index of the first mismatching snapshot (or of the first unpaired one if the
+        lengths differ), None if all times match
+    """
+    sim_t = np.array([s['t'] for s in sim_data]) if not isinstance(sim_data, SnapshotSeries) else sim_data.t
+    ana_t = (np.array([a['t'] for a in analytical_data]) if not isinstance(analytical_data, SnapshotSeries)
+             else analytical_data.t)
+    n = min(len(sim_t), len(ana_t))
+    mismatches = np.flatnonzero(np.abs(sim_t[:n] - ana_t[:n]) > tolerance)
+    if mismatches.size:
+        return int(mismatches[0])
+    return n if len(sim_t) != len(ana_t) else None
+
+
+# Output variables derived from a VAR file and the primitive fields each one needs.
+# 'density' is stored as either lnrho or rho depending on ldensity_nolog.
+ANALYSIS_VARIABLES = ('rho', 'ux', 'pp', 'ee')
+_VARIABLE_PRIMITIVES = {
+    'rho': ('density',),
+    'ux': ('ux',),
+    'pp': ('density', 'ss'),
+    'ee': ('density', 'ss'),
+}
+
+
+def _select_variables(variables) -> tuple:
+    """Normalises a requested variable list to known output variables in canonical order."""
+    if variables is None:
+        return ANALYSIS_VARIABLES
+    unknown = [v for v in variables if v not in _VARIABLE_PRIMITIVES]
+    if unknown:
+        logger.warning(f"Ignoring unknown analysis variables: {', '.join(unknown)}")
+    return tuple(v for v in ANALYSIS_VARIABLES if v in variables)
+
+
+def required_primitive_fields(variables) -> set:
+    """Returns the primitive VAR fields ('density', 'ux', 'ss') needed for the given output variables."""
+    return {field for var in _select_variables(variables) for field in _VARIABLE_PRIMITIVES[var]}
+
+
+def load_error_analysis_config(experiment_name: str, plan: dict) -> dict:
+    """Returns the ``error_analysis`` settings of an experiment.
+    
+    Settings from ``analysis_config.yaml`` are used as defaults and overridden by
+    the ``error_analysis`` section of the plan file.
+    """
+    error_config = {}
+    try:
+        analysis_config = create_config_loader(experiment_name, DIRS.config).load_analysis_config()
+        error_config.update(analysis_config.get('error_analysis', {}) or {})
+    except Exception as e:
+        logger.debug(f"No analysis_config error_analysis section for {experiment_name}: {e}")
+    error_config.update(plan.get('error_analysis', {}) or {})
+    return error_config
+
+
+SNAPSHOT_SELECTION_KEYS = ('var_stride', 't_min', 't_max', 'max_snapshots')
+
+
+def resolve_snapshot_selection(error_config: dict, overrides: dict | None = None) -> dict:
+    """Combines the snapshot selection of the ``error_analysis`` config with command-line overrides.
+
+    Args:
+        error_config: Settings returned by ``load_error_analysis_config``
+        overrides: Values given on the command line; None entries are ignored
+
+    Returns:
+        Dictionary with the set keys of ``var_stride``, ``t_min``, ``t_max`` and
+        ``max_snapshots`` (empty if every snapshot is used)
+    """
+    selection = {key: error_config[key] for key in SNAPSHOT_SELECTION_KEYS if error_config.get(key) is not None}
+    selection.update({key: value for key, value in (overrides or {}).items()
+                      if key in SNAPSHOT_SELECTION_KEYS and value is not None})
+
+    if selection.get('var_stride', 1) < 1:
+        raise ValueError(f"var_stride must be a positive integer, got {selection['var_stride']}")
+    if selection.get('max_snapshots', 1) < 1:
+        raise ValueError(f"max_snapshots must be a positive integer, got {selection['max_snapshots']}")
+    if selection.get('t_min', -np.inf) > selection.get('t_max', np.inf):
+        raise ValueError(f"t_min ({selection['t_min']}) is larger than t_max ({selection['t_max']})")
+    return selection
+
+
+# Metrics --error-norms computes by default; --analyze stores them for every run so
+# that a later --error-norms finds them in the run store
+DEFAULT_ERROR_NORM_METRICS = ('l1', 'l2', 'linf')
+
+# Fields of a run's reduced results kept in the run store (src.analysis.run_store)
+RUN_RECORD_KEYS = ('branch', 'error_norms', 'fronts', 'n_timesteps', 'var_files', 'dx', 'nx')
+
+# Run inputs besides the VAR files that are fingerprinted for incremental analysis
+RUN_INPUT_FILES = ('param.nml', 'var.list', 'dim.dat', 'index.pro')
+
+# Settings of analyze_suite_videos_only the rendered output of a run depends on
+RENDER_SETTINGS = ('metrics', 'norm_metrics', 'analyze_variables', 'error_variables', 'storage_dtype',
+                   'roi', 'combine_in_videos', 'use_code_units', 'selection')
+
+
+# Storage precisions allowed for the ``storage_dtype`` of the error_analysis config
+STORAGE_DTYPES = {'float64': np.float64, 'float32': np.float32}
+
+
+def resolve_storage_dtype(error_config: dict) -> type:
+    """Returns the dtype in which error fields are cached and exported.
+
+    ``storage_dtype: float32`` in the ``error_analysis`` config halves the memory
+    and disk use of the [time, space] error fields; error norms are computed in
+    float64 either way.
+
+    Raises:
+        ValueError: If the configured dtype is not one of ``STORAGE_DTYPES``
+    """
+    name = str(error_config.get('storage_dtype', 'float64'))
+    if name not in STORAGE_DTYPES:
+        raise ValueError(f"storage_dtype must be one of {', '.join(STORAGE_DTYPES)}, got {name}")
+    return STORAGE_DTYPES[name]
+
+
+def resolve_roi(error_config: dict) -> dict | None:
+    """Returns the region-of-interest settings of the ``error_analysis`` config.
+
+    With an ``roi`` section, error norms are only evaluated in windows of
+    ``half_width`` cells around the analytical ``waves`` (see ``roi_windows``);
+    ``roi: true`` uses the defaults and ``enabled: false`` switches it off.
+
+    Returns:
+        Keyword arguments for ``roi_windows`` ('half_width', 'waves'), or None for
+        norms over the whole domain
+
+    Raises:
+        ValueError: For an unknown wave or a negative half width
+    """
+    roi = error_config.get('roi')
+    if not roi:
+        return None
+    roi = {} if roi is True else dict(roi)
+    if not roi.get('enabled', True):
+        return None
+
+    half_width = int(roi.get('half_width', ROI_HALF_WIDTH))
+    waves = tuple(roi.get('waves', ROI_WAVES))
+    if half_width < 0:
+        raise ValueError(f"roi.half_width must be non-negative, got {half_width}")
+    unknown = [wave for wave in waves if wave not in ROI_WAVES]
+    if unknown or not waves:
+        raise ValueError(f"roi.waves must be a non-empty subset of {', '.join(ROI_WAVES)}, got {list(waves)}")
+    return {'half_width': half_width, 'waves': waves}
+
+
+def _grid_spacing(x) -> dict:
+    """Grid spacing and number of points of a snapshot's x coordinates, as recorded in error-norm summaries."""
+    return {'dx': float(x[1] - x[0]) if len(x) > 1 else None, 'nx': int(len(x))}
+
+
+# Metrics runs can be ranked by in PHASE 2, as averages over timesteps of the
+# absolute density error of each snapshot
+RANKING_METRICS = ('l1', 'l2', 'linf')
+
+
+def _ranking_errors(spatial_errors: dict) -> dict:
+    """Time-averaged mean, RMS and maximum of the absolute density (rho) error, per ranking metric.
+
+    Computed in PHASE 1 and kept with the small part of a run's result, so PHASE 2
+    ranks runs without reading their error fields back.
+    """
+    if 'rho' not in spatial_errors or not spatial_errors['rho']['errors_per_timestep']:
+        return dict.fromkeys(RANKING_METRICS, float('inf'))
+    totals = dict.fromkeys(RANKING_METRICS, 0.0)
+    count = 0
+    for errors in spatial_errors['rho']['errors_per_timestep']:
+        # Stored errors may be float32 (storage_dtype); rank in float64
+        errors = np.asarray(errors, dtype=np.float64)
+        totals['l1'] += np.mean(np.abs(errors))
+        totals['l2'] += np.sqrt(np.mean(errors**2))
+        totals['linf'] += np.max(np.abs(errors))
+        count += 1
+    return {metric: float(total / count) for metric, total in totals.items()}
+
+
+def _select_var_files(var_files: list[Path], data_dir: Path, selection: dict | None) -> list[Path]:
+    """Applies a snapshot selection to the sorted VAR files of a run.
+
+    The time window is applied first, then the stride, then ``max_snapshots``
+    thins the remaining files evenly (keeping the first and last). Snapshot times
+    come from ``varN.list`` or the VAR file headers, so the fields of skipped
+    files are never read.
+    """
+    if not selection:
+        return var_files
+
+    selected = var_files
+    if selection.get('t_min') is not None or selection.get('t_max') is not None:
+        times = read_var_times(data_dir, selected)
+        t_min = selection.get('t_min', -np.inf)
+        t_max = selection.get('t_max', np.inf)
+        selected = [p for p in selected if t_min <= times[p.name] <= t_max]
+
+    selected = selected[::selection.get('var_stride', 1)]
+
+    max_snapshots = selection.get('max_snapshots')
+    if max_snapshots is not None and len(selected) > max_snapshots:
+        keep = np.unique(np.linspace(0, len(selected) - 1, max_snapshots).round().astype(int))
+        selected = [selected[i] for i in keep]
+
+    logger.info(f"Snapshot selection {selection}: {len(selected)} of {len(var_files)} VAR files")
+    return selected
+
+
+# Per-worker state for parallel VAR loading. The run's data directory, VAR reader
+# and field selection are installed once per worker process by the pool initializer
+# instead of being pickled with every task.
+_VAR_WORKER_STATE = {}
+
+
+def _init_var_worker(data_dir: str, fast_reader: bool = False, primitives: set | None = None):
+    """Pool initializer: stores the run's data directory, VAR reader and field selection in the worker."""
+    _VAR_WORKER_STATE['data_dir'] = data_dir
+    _VAR_WORKER_STATE['reader'] = _open_var_reader(data_dir, fast_reader)
+    _VAR_WORKER_STATE['primitives'] = primitives
+
+
+def _open_var_reader(data_dir: str, fast_reader: bool) -> NativeVarReader | None:
+    """Creates the native VAR reader for a run, or None to use ``pencil.read.var``.
+    
+    Without Pencil installed the native reader is always used.
+    """
+    if not fast_reader and read is not None:
+        return None
+    try:
+        return NativeVarReader(Path(data_dir))
+    except Exception as e:
+        if read is None:
+            logger.error(f"Native VAR reader unavailable for {data_dir} ({e}) and Pencil is not installed")
+        else:
+            logger.warning(f"Native VAR reader unavailable for {data_dir} ({e}), using pencil.read.var")
+        return None
+
+
+def read_run_params(data_dir: Path):
+    """Reads a run's params with ``pencil.read.param``, or from ``param.nml`` without Pencil."""
+    if read is not None:
+        return read.param(datadir=str(data_dir), quiet=True, conflicts_quiet=True)
+    return read_param_file(data_dir)
+
+
+def _native_field_names(reader: NativeVarReader, primitives: set) -> list[str]:
+    """Maps primitive fields to the names stored in the run's index.pro.
+    
+    The density is read as 'rho' or 'lnrho' according to the run's ``ldensity_nolog``
+    (see ``NativeVarReader.density_field``), not from which index entries exist.
+    """
+    fields = []
+    if 'density' in primitives:
+        fields.append(reader.density_field or 'rho')
+    fields.extend(f for f in ('ux', 'ss') if f in primitives and f in reader.index)
+    return fields
+
+
+def _read_var_primitives(var_file_name: str, data_dir: str, reader: NativeVarReader | None = None,
+                         primitives: set | None = None) -> dict | None:
+    """Reads the primitive fields of a single VAR file.
+    
+    Args:
+        var_file_name: VAR file name (e.g. 'VAR5')
+        data_dir: The run's data directory
+        reader: Native VAR reader, or None to use ``pencil.read.var``
+        primitives: Primitive fields to read (default: density, ux and ss)
+    
+    Returns:
+        Dict with 'x', 't', 'var_file' and the requested fields as 1D arrays; the
+        density is returned as 'lnrho' or 'rho', whichever the run stores.
+    """
+    try:
+        if primitives is None:
+            primitives = required_primitive_fields(ANALYSIS_VARIABLES)
         
-        data_dir = run_path / "data"
-        proc_dir = data_dir / "proc0" if (data_dir / "proc0").is_dir() else data_dir
+        if reader is not None:
+            var = reader.read(var_file_name, fields=_native_field_names(reader, primitives))
+        else:
+            # Read VAR file with trimall=True to remove ghost zones for 1D data
+            var = read.var(var_file_name, datadir=data_dir, quiet=True, trimall=True)
         
-        # Sort VAR files numerically by extracting the number from filename
-        var_files = sorted(proc_dir.glob("VAR*"), key=lambda p: int(p.stem.replace('VAR', '')))
+        # Use grid from VAR file (ghost zones trimmed)
+        fields = {"x": np.squeeze(var.x), "t": var.t, "var_file": var_file_name}
         
-        if not var_files:
-            logger.warning(f"No VAR files found in {proc_dir}")
-            return None
+        if 'density' in primitives:
+            if hasattr(var, 'lnrho'):
+                fields["lnrho"] = np.squeeze(var.lnrho)
+            else:
+                fields["rho"] = np.squeeze(var.rho)
         
-        logger.info(f"Loading all {len(var_files)} VAR files from {run_path}")
+        if 'ux' in primitives:
+            fields["ux"] = np.squeeze(var.ux)
         
-        # Read params once - it's the same for all VAR files
-        params = read.param(datadir=str(data_dir), quiet=True, conflicts_quiet=True)
+        if 'ss' in primitives:
+            if not hasattr(var, 'ss'):
+                logger.error(f"Variable 'ss' not found in {var_file_name}")
+                return None
+            fields["ss"] = np.squeeze(var.ss)
         
-        all_data = []
+        return fields
+    except Exception as e:
+        logger.warning(f"Failed to load {var_file_name}: {e}")
+        return None
+
+
+def _derive_variables(fields: dict, params, variables) -> dict:
+    """Derives output variables from primitive fields.
+    
+    Works on a single snapshot ([X] arrays) or a whole run stacked as [T, X].
+    """
+    derived = {}
+    density = fields.get('rho')
+    if density is None and 'lnrho' in fields and ('rho' in variables or 'ee' in variables):
+        density = np.exp(fields['lnrho'])
+    
+    if 'rho' in variables:
+        derived['rho'] = density
+    if 'ux' in variables:
+        derived['ux'] = fields['ux']
+    if 'pp' in variables or 'ee' in variables:
+        thermo = derive_pressure_energy(fields['ss'], params, rho=density, lnrho=fields.get('lnrho'),
+                                        energy='ee' in variables)
+        derived.update({name: values for name, values in thermo.items() if name in variables})
+    
+    return {var: derived[var] for var in variables}
+
+
+def _snapshot_from_fields(fields: dict, derived: dict) -> dict:
+    """Assembles a snapshot dict in the canonical key order."""
+    return {"x": fields['x'], **derived, "t": fields['t'], "var_file": fields['var_file']}
+
+
+def _load_var_snapshot(var_file_name: str, data_dir: str, params,
+                       reader: NativeVarReader | None = None, variables=None) -> dict | None:
+    """Reads a single VAR file and derives the requested output variables from it.
+    
+    Only the primitive fields needed for ``variables`` (default: rho, ux, pp, ee)
+    are read and derived. The returned dict does not contain ``params``; the
+    caller attaches the shared object. If ``reader`` is given, the fields are
+    memory-mapped by the native reader instead of being read with ``pencil.read.var``.
+    """
+    variables = _select_variables(variables)
+    fields = _read_var_primitives(var_file_name, data_dir, reader, required_primitive_fields(variables))
+    if fields is None:
+        return None
+    return _snapshot_from_fields(fields, _derive_variables(fields, params, variables))
+
+
+def _derive_snapshot_series(primitive_snapshots: list[dict], params,
+                            variables=None) -> SnapshotSeries | list[dict]:
+    """Derives the output variables of a whole run in one vectorized pass.
+    
+    The primitive fields of all snapshots are stacked into [T, X] arrays and the
+    thermodynamic stage runs once over the stack; the result is a ``SnapshotSeries``.
+    Runs whose grid changes between snapshots cannot be stacked and are derived
+    one snapshot at a time into a list of snapshot dicts instead.
+    """
+    variables = _select_variables(variables)
+    if len({np.shape(fields['x']) for fields in primitive_snapshots}) != 1:
+        snapshots = [_snapshot_from_fields(fields, _derive_variables(fields, params, variables))
+                     for fields in primitive_snapshots]
+        for snapshot in snapshots:
+            snapshot["params"] = params
+        return snapshots
+    
+    stacked = {name: np.stack([fields[name] for fields in primitive_snapshots])
+               for name in ('lnrho', 'rho', 'ux', 'ss') if name in primitive_snapshots[0]}
+    return SnapshotSeries(
+        x=primitive_snapshots[0]['x'],
+        t=[fields['t'] for fields in primitive_snapshots],
+        fields=_derive_variables(stacked, params, variables),
+        var_files=[fields['var_file'] for fields in primitive_snapshots],
+        params=params,
+    )
+
+
+def _read_var_primitives_in_worker(var_file_name: str) -> dict | None:
+    """Worker entry point: reads one VAR file using the state set by the initializer."""
+    return _read_var_primitives(var_file_name, _VAR_WORKER_STATE['data_dir'], _VAR_WORKER_STATE['reader'],
+                                _VAR_WORKER_STATE['primitives'])
+
+
+def _read_var_primitives_parallel(var_file_names: list[str], data_dir: str, n_workers: int,
+                                  fast_reader: bool = False, primitives: set | None = None) -> list[dict | None]:
+    """Reads the primitive fields of VAR files on a process pool, preserving VAR order.
+    
+    Falls back to serial reading if the pool cannot be started.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_var_worker,
+                                 initargs=(data_dir, fast_reader, primitives)) as executor:
+            chunksize = max(1, len(var_file_names) // (n_workers * 4))
+            return list(executor.map(_read_var_primitives_in_worker, var_file_names, chunksize=chunksize))
+    except Exception as e:
+        logger.warning(f"Parallel VAR loading failed ({e}), falling back to serial loading")
+        reader = _open_var_reader(data_dir, fast_reader)
+        return [_read_var_primitives(name, data_dir, reader, primitives) for name in var_file_names]
+
+
+def snapshot_store_path(analysis_dir: Path, run_name: str) -> Path:
+    """Returns the location of a run's consolidated snapshot store."""
+    return analysis_dir / "var" / "store" / f"{run_name}{STORE_SUFFIX}"
+
+
+def analytical_cache_dir(analysis_dir: Path) -> Path:
+    """Returns the directory of the suite's persisted analytical solutions."""
+    return analysis_dir / "analytical_cache"
+
+
+def _run_input_files(run_path: Path) -> list[Path]:
+    """Every VAR file of a run plus the data files its analysis reads (see ``RUN_INPUT_FILES``)."""
+    data_dir = run_path / "data"
+    proc_dir = data_dir / "proc0" if (data_dir / "proc0").is_dir() else data_dir
+    inputs = sorted(proc_dir.glob("VAR*"))
+    for directory in dict.fromkeys([data_dir, proc_dir]):
+        inputs.extend(directory / name for name in RUN_INPUT_FILES if (directory / name).is_file())
+    return inputs
+
+
+def _find_var_files(run_path: Path, selection: dict | None = None) -> tuple[Path, list[Path]] | None:
+    """Locates the data directory and the numerically sorted VAR files of a run.
+    
+    With a ``selection`` (see ``resolve_snapshot_selection``) only the selected
+    VAR files are returned.
+    """
+    if not run_path.is_dir():
+        logger.warning(f"Run directory not found: {run_path}")
+        return None
+    
+    data_dir = run_path / "data"
+    proc_dir = data_dir / "proc0" if (data_dir / "proc0").is_dir() else data_dir
+    
+    # Sort VAR files numerically by extracting the number from filename
+    var_files = sorted(proc_dir.glob("VAR*"), key=lambda p: int(p.stem.replace('VAR', '')))
+    
+    if not var_files:
+        logger.warning(f"No VAR files found in {proc_dir}")
+        return None
+    
+    var_files = _select_var_files(var_files, data_dir, selection)
+    if not var_files:
+        logger.warning(f"No VAR files of {run_path} match the snapshot selection {selection}")
+        return None
+    
+    return data_dir, var_files
+
+
+def _store_has_variables(store: dict, variables) -> bool:
+    """Checks that a snapshot store holds every requested output variable."""
+    missing = [v for v in _select_variables(variables) if v not in store['fields']]
+    if missing:
+        logger.info(f"Snapshot store lacks {', '.join(missing)}, VAR files will be re-read")
+    return not missing
+
+
+def _store_series(store: dict, params, variables=None) -> SnapshotSeries:
+    """Wraps a memory-mapped store as a ``SnapshotSeries`` without copying."""
+    return SnapshotSeries(
+        x=store['x'],
+        t=store['t'],
+        fields={name: field for name, field in store['fields'].items() if name in _select_variables(variables)},
+        var_files=store['var_files'],
+        params=params,
+    )
+
+
+def iter_var_snapshots(run_path: Path, store_file: Path | None = None, fast_reader: bool = False,
+                       variables=None, selection: dict | None = None):
+    """Yields the processed snapshots of a run one at a time, in VAR order.
+    
+    Only one snapshot is held in memory at a time. If ``store_file`` is up to date
+    the snapshots are read from it; otherwise the VAR files are read one by one
+    and the store is written incrementally as they stream past.
+    
+    Args:
+        run_path: Path to the run directory
+        store_file: Optional consolidated snapshot store for this run
+        fast_reader: Read VAR files with the native memory-mapped reader
+        variables: Output variables to load (default: rho, ux, pp, ee)
+        selection: Optional snapshot selection (see ``resolve_snapshot_selection``)
+    
+    Yields:
+        Snapshot dicts with the same keys as the entries of ``load_all_var_files``
+    """
+    found = _find_var_files(run_path, selection)
+    if found is None:
+        return
+    data_dir, var_files = found
+    
+    params = read_run_params(data_dir)
+    
+    signature = var_file_signature(var_files) if store_file is not None else None
+    if store_file is not None:
+        store = read_snapshot_store(store_file, signature)
+        if store is not None and _store_has_variables(store, variables):
+            logger.info(f"Streaming {len(store['var_files'])} snapshots from store {store_file.name}")
+            yield from _store_series(store, params, variables)
+            return
+    
+    logger.info(f"Streaming {len(var_files)} VAR files from {run_path}")
+    reader = _open_var_reader(str(data_dir), fast_reader)
+    writer = None
+    try:
         for var_file in var_files:
-            try:
-                # Read VAR file with trimall=True to remove ghost zones for 1D data
-                var = read.var(var_file.name, datadir=str(data_dir), quiet=True, trimall=True)
-                
-                density = np.exp(var.lnrho) if hasattr(var, 'lnrho') else var.rho
-                cp, gamma = params.cp, params.gamma
-                cv = cp / gamma
-                
-                if not hasattr(var, 'ss'):
-                    logger.error(f"Variable 'ss' not found in {var_file.name}")
-                    continue
-                
-                rho0 = getattr(params, 'rho0', 1.0)
-                cs0 = getattr(params, 'cs0', 1.0)
-                lnrho0 = np.log(rho0)
-                lnTT0 = np.log(cs0**2 / (cp * (gamma - 1.0)))
-                
-                pressure = (cp - cv) * np.exp(lnTT0 + (gamma / cp * var.ss) + 
-                                             (gamma * np.log(density)) - ((gamma - 1.0) * lnrho0))
-                internal_energy = pressure / (density * (gamma - 1.0)) if gamma > 1.0 else np.zeros_like(density)
-                
-                # Use grid from VAR file (includes ghost zones)
-                all_data.append({
-                    "x": np.squeeze(var.x), 
-                    "rho": np.squeeze(density), 
-                    "ux": np.squeeze(var.ux),
-                    "pp": np.squeeze(pressure), 
-                    "ee": np.squeeze(internal_energy), 
-                    "t": var.t, 
-                    "params": params,
-                    "var_file": var_file.name
-                })
-            except Exception as e:
-                logger.warning(f"Failed to load {var_file.name}: {e}")
+            snapshot = _load_var_snapshot(var_file.name, str(data_dir), params, reader, variables)
+            if snapshot is None:
+                # The signature covers every VAR file, so a store without this one
+                # would hide it from later analyses until its mtime changes
+                if writer is not None:
+                    writer.abort()
+                    writer = None
+                if store_file is not None:
+                    logger.warning(f"Not writing snapshot store {store_file.name}: {var_file.name} failed to load")
+                store_file = None
                 continue
+            snapshot["params"] = params
+            
+            if store_file is not None:
+                if writer is None:
+                    writer = create_store_writer(store_file, signature, snapshot)
+                    store_file = None if writer is None else store_file
+                if writer is not None and not writer.append(snapshot):
+                    writer.abort()
+                    writer, store_file = None, None
+            
+            yield snapshot
         
-        return all_data if all_data else None
+        if writer is not None:
+            writer.commit()
+            writer = None
+    finally:
+        # Consumer stopped early or loading failed: never leave a partial store behind
+        if writer is not None:
+            writer.abort()
+
+
+class AnalyticalSolutionError(ValueError):
+    """An analytical solution could not be computed or does not match its simulation snapshot."""
+
+
+def iter_snapshot_pairs(run_path: Path, store_file: Path | None = None, fast_reader: bool = False,
+                        variables=None, selection: dict | None = None):
+    """Yields (simulation, analytical) snapshot pairs for a run, one at a time.
+    
+    The analytical solution of each snapshot is computed on demand, so memory use
+    stays at one snapshot pair regardless of the number of VAR files.
+    
+    Args:
+        run_path: Path to the run directory
+        store_file: Optional consolidated snapshot store for this run
+        fast_reader: Read VAR files with the native memory-mapped reader
+        variables: Output variables to load (default: rho, ux, pp, ee)
+        selection: Optional snapshot selection (see ``resolve_snapshot_selection``)
+    
+    Yields:
+        Tuple of (sim_data, analytical_data) dicts
+    
+    Raises:
+        AnalyticalSolutionError: If an analytical solution cannot be computed or
+            its time does not match the simulation snapshot.
+    """
+    for idx, sim_data in enumerate(iter_var_snapshots(run_path, store_file=store_file,
+                                                             fast_reader=fast_reader,
+                                                             variables=variables,
+                                                             selection=selection)):
+        analytical_data = get_analytical_solution(sim_data['params'], sim_data['x'], sim_data['t'])
+        if analytical_data is None:
+            raise AnalyticalSolutionError(f"Failed to generate analytical solution for {sim_data['var_file']}")
+        if abs(sim_data['t'] - analytical_data['t']) > 1e-10:
+            raise AnalyticalSolutionError(f"Timestep mismatch at VAR {idx}: sim_t={sim_data['t']:.6e} "
+                             f"vs anal_t={analytical_data['t']:.6e}")
+        yield sim_data, analytical_data
+
+
+def load_all_var_files(run_path: Path, jobs: int = 1, store_file: Path | None = None,
+                       fast_reader: bool = False, variables=None,
+                       selection: dict | None = None) -> SnapshotSeries | list[dict] | None:
+    """Loads and processes all VAR files from a simulation run.
+    
+    The primitive fields of all VAR files are read first; pressure and internal
+    energy are then derived for the whole run at once on stacked [T, X] arrays
+    (see ``src.analysis.thermodynamics``).
+    
+    The run is returned as a ``SnapshotSeries``, which also behaves as a sequence
+    of per-snapshot dicts. If the grid changes between snapshots, a plain list of
+    snapshot dicts is returned instead.
+    
+    Args:
+        run_path: Path to the run directory
+        jobs: Number of worker processes used to read VAR files. With jobs > 1 the
+            files are read in parallel; snapshots are always returned in VAR order.
+        store_file: Optional consolidated snapshot store for this run. If it is up to
+            date with the VAR files, snapshots are memory-mapped from it instead of
+            re-reading the VAR files; otherwise it is (re)written after loading.
+        fast_reader: Read VAR files with the native memory-mapped reader
+            (``src.analysis.var_reader``) instead of ``pencil.read.var``. Runs the
+            native reader cannot handle fall back to ``pencil.read.var``.
+        variables: Output variables to load (default: rho, ux, pp, ee). Only the
+            primitive fields these depend on are read, and only these are derived.
+        selection: Optional snapshot selection (see ``resolve_snapshot_selection``).
+            It is applied while the VAR files are discovered, so skipped files are
+            never read.
+    """
+    try:
+        found = _find_var_files(run_path, selection)
+        if found is None:
+            return None
+        data_dir, var_files = found
+        
+        # Read params once - it's the same for all VAR files
+        params = read_run_params(data_dir)
+        
+        signature = var_file_signature(var_files) if store_file is not None else None
+        if store_file is not None:
+            store = read_snapshot_store(store_file, signature)
+            if store is not None and _store_has_variables(store, variables):
+                logger.info(f"Loading {len(store['var_files'])} snapshots from store {store_file.name}")
+                all_data = _store_series(store, params, variables)
+                return all_data if len(all_data) else None
+        
+        var_file_names = [var_file.name for var_file in var_files]
+        primitives = required_primitive_fields(variables)
+        
+        if jobs and jobs > 1:
+            n_workers = min(jobs, len(var_files))
+            logger.info(f"Loading all {len(var_files)} VAR files from {run_path} ({n_workers} workers)")
+            primitive_snapshots = _read_var_primitives_parallel(var_file_names, str(data_dir), n_workers,
+                                                                fast_reader, primitives)
+        else:
+            logger.info(f"Loading all {len(var_files)} VAR files from {run_path}")
+            reader = _open_var_reader(str(data_dir), fast_reader)
+            primitive_snapshots = [_read_var_primitives(name, str(data_dir), reader, primitives)
+                                   for name in var_file_names]
+        
+        n_failed = sum(fields is None for fields in primitive_snapshots)
+        primitive_snapshots = [fields for fields in primitive_snapshots if fields is not None]
+        if not primitive_snapshots:
+            return None
+        
+        all_data = _derive_snapshot_series(primitive_snapshots, params, variables)
+        
+        # The signature covers every VAR file, so a store without the failed ones
+        # would hide them from later analyses until their mtime changes
+        if store_file is not None and n_failed:
+            logger.warning(f"Not writing snapshot store {store_file.name}: {n_failed} VAR file(s) failed to load")
+        elif store_file is not None:
+            write_snapshot_store(store_file, all_data, signature)
+        
+        return all_data
         
     except Exception as e:
         logger.error(f"Failed to load VAR files from {run_path}: {e}")
         return None
 
+
+def load_run_with_analytical(run_path: Path, jobs: int = 1, store_file: Path | None = None,
+                             fast_reader: bool = False, variables=None,
+                             selection: dict | None = None,
+                             analytical_cache: AnalyticalCache | None = None) -> tuple:
+    """Loads a run and computes its analytical solutions.
+    
+    The analytical solutions are computed in one batched call per run (or taken
+    from ``analytical_cache``) and checked to be paired with the simulation
+    snapshots at the same times.
+    
+    Returns:
+        Tuple of (all_sim_data, all_analytical_data). ``all_sim_data`` is None if the
+        VAR files could not be loaded, ``all_analytical_data`` is None if the
+        analytical solutions failed or are not paired with the snapshots.
+    """
+    all_sim_data = load_all_var_files(run_path, jobs=jobs, store_file=store_file,
+                                      fast_reader=fast_reader, variables=variables, selection=selection)
+    if not all_sim_data:
+        return None, None
+    
+    all_analytical_data = get_analytical_solutions(all_sim_data, cache=analytical_cache)
+    if all_analytical_data is not None:
+        idx = find_timestep_mismatch(all_sim_data, all_analytical_data)
+        if idx is not None:
+            logger.error(f"Timestep mismatch at VAR {idx} of {run_path.name}")
+            return all_sim_data, None
+    return all_sim_data, all_analytical_data
+
+
+def iter_prefetched(items, load, depth: int = 1):
+    """Yields ``(item, load(item))`` in order, loading up to ``depth`` items ahead.
+    
+    Loading runs on a single background thread while the caller processes the
+    current item, so disk I/O and the derivation of the next runs overlap with
+    rendering. At most ``depth`` loaded items wait in memory besides the one being
+    processed. With ``depth <= 0`` items are loaded on demand in the caller's thread.
+    
+    Args:
+        items: Items to load (e.g. run names), in processing order
+        load: Callable that loads one item
+        depth: Number of items to load ahead of the one being processed
+    """
+    if depth <= 0:
+        for item in items:
+            yield item, load(item)
+        return
+    
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+    
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+    pending = deque()
+    try:
+        # The current item plus ``depth`` items ahead of it
+        for item in islice(items, depth + 1):
+            pending.append((item, executor.submit(load, item)))
+        
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+            # The caller is done with ``item``: refill the look-ahead window
+            for next_item in islice(items, 1):
+                pending.append((next_item, executor.submit(load, next_item)))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def process_run_analysis(run_path: Path, run_name: str, branch_name: str, 
-                        error_method: str = 'absolute') -> tuple[dict, dict, dict, list, list] | None:
+                        error_method: str = 'absolute', jobs: int = 1,
+                        store_file: Path | None = None, fast_reader: bool = False,
+                        selection: dict | None = None) -> tuple[dict, dict, dict, list, list] | None:
     """Processes a single run for comprehensive error analysis across all VAR files.
     
     Args:
@@ -155,6 +905,10 @@ def process_run_analysis(run_path: Path, run_name: str, branch_name: str,
         run_name: Name of the run
         branch_name: Name of the branch
         error_method: Error calculation method ('absolute', 'relative', 'difference', 'squared')
+        jobs: Number of worker processes used to load VAR files
+        store_file: Optional consolidated snapshot store for this run
+        fast_reader: Read VAR files with the native memory-mapped reader
+        selection: Optional snapshot selection (see ``resolve_snapshot_selection``)
     
     Returns:
         Tuple of (std_devs, abs_devs, spatial_errors, all_sim_data, all_analytical_data) or None if failed.
@@ -162,51 +916,323 @@ def process_run_analysis(run_path: Path, run_name: str, branch_name: str,
     """
     logger.info(f"--- Analyzing run: {run_name} (branch: {branch_name}) ---")
     
-    # Load all VAR files ONCE
-    all_sim_data = load_all_var_files(run_path)
-    if not all_sim_data:
-        return None
+    # Load all VAR files ONCE
+    all_sim_data = load_all_var_files(run_path, jobs=jobs, store_file=store_file, fast_reader=fast_reader,
+                                      selection=selection)
+    if not all_sim_data:
+        return None
+    
+    logger.info(f"Loaded {len(all_sim_data)} VAR files (t={all_sim_data[0]['t']:.3e} to {all_sim_data[-1]['t']:.3e})")
+    
+    # Generate analytical solutions for all timesteps
+    all_analytical_data = get_analytical_solutions(all_sim_data)
+    if all_analytical_data is None:
+        logger.error(f"Failed to generate analytical solutions for {run_name}")
+        return None
+    
+    # Validation: Verify timestep pairing is correct
+    idx = find_timestep_mismatch(all_sim_data, all_analytical_data)
+    if idx is not None:
+        if idx < min(len(all_sim_data), len(all_analytical_data)):
+            logger.error(f"Timestep mismatch at VAR {idx}: sim_t={all_sim_data[idx]['t']:.6e} "
+                         f"vs anal_t={all_analytical_data[idx]['t']:.6e}")
+        else:
+            logger.error(f"{len(all_sim_data)} simulation snapshots but {len(all_analytical_data)} analytical solutions")
+        return None
+    
+    logger.info(f"✓ Generated {len(all_analytical_data)} analytical solutions with correct timestep pairing")
+    
+    # Calculate error metrics from one sim - analytical difference per variable
+    run_errors = RunErrors(all_sim_data, all_analytical_data)
+    std_devs = run_errors.std_devs()
+    abs_devs = run_errors.abs_devs()
+    spatial_errors = run_errors.spatial_errors(error_method)
+    
+    # Return loaded data along with metrics for caching/reuse
+    return std_devs, abs_devs, spatial_errors, all_sim_data, all_analytical_data
+
+
+def _run_phase_outputs(run_name: str, context: dict) -> dict:
+    """Files and frame directories that the per-run phases of ``_render_run`` write for a run."""
+    combined = context['combine_in_videos'] and len(context['metrics']) > 1
+    error_name = f"{run_name}_combined_error_evolution" if combined else f"{run_name}_error_evolution"
+    return {
+        'var_videos': [context['var_evolution_dir'] / f"{run_name}_var_evolution.gif",
+                       context['var_evolution_dir'].parent / "frames" / run_name],
+        'error_videos': [context['error_evolution_dir'] / f"{error_name}.gif",
+                         context['error_evolution_dir'].parent / "frames" / run_name],
+        'plotly': [context['var_evo_plotly_dir'] / f"{run_name}_var_evolution.html",
+                   context['error_evo_plotly_dir'] / f"{error_name}.html"],
+    }
+
+
+def _missing_run_phases(run_name: str, phases: set, context: dict) -> set:
+    """Recorded per-run phases of a run with an output that no longer exists (or an empty frames directory)."""
+    def exists(path: Path) -> bool:
+        return any(path.iterdir()) if path.is_dir() else path.exists()
+    
+    return {name for name, paths in _run_phase_outputs(run_name, context).items()
+            if name in phases and not all(exists(path) for path in paths)}
+
+
+def _render_run(run_name: str, branch_name: str, all_sim_data, all_analytical_data, context: dict) -> dict:
+    """Per-run part of PHASE 1 of ``analyze_suite_videos_only``: errors, videos and exports of one run.
+    
+    Everything that needs the snapshots of the run happens here and only the
+    reduced results are returned, so runs can be processed in worker processes
+    and the cross-run phases never hold the raw data. Only the per-run phases in
+    ``context['run_phases']`` are run (see ``src.workflows.phases``).
+    
+    Args:
+        run_name: Name of the run
+        branch_name: Branch the run belongs to
+        all_sim_data: Simulation snapshots of the run
+        all_analytical_data: Corresponding analytical solutions
+        context: Suite settings assembled by ``analyze_suite_videos_only``
+    
+    Returns:
+        Dictionary with the run's 'branch' and the per-run 'phases' it ran. With the
+        'errors' phase also its 'unit_length', absolute 'spatial_errors',
+        'normalized_errors', 'error_norms' (of ``context['norm_metrics']``), 'fronts',
+        'n_timesteps', 'var_files' and grid spacing ('dx', 'nx')
+    """
+    metrics = context['metrics']
+    analyze_variables = context['analyze_variables']
+    analysis_dir = context['analysis_dir']
+    run_phases = context['run_phases']
+    
+    # Get unit length - respect use_code_units flag
+    unit_length = 1.0
+    if all_sim_data and 'params' in all_sim_data[0]:
+        # Check if we should use code units (normalized) or physical units
+        if context['use_code_units']:
+            unit_length = 1.0  # Force code units for normalized calculations
+            logger.debug(f"     ├─ Using code units (unit_length=1.0) for normalized calculations")
+        elif hasattr(all_sim_data[0]['params'], 'unit_length'):
+            unit_length = all_sim_data[0]['params'].unit_length
+            logger.debug(f"     ├─ Using physical units (unit_length={unit_length:.3e})")
+
+    if 'var_videos' in run_phases:
+        logger.info(f"     ├─ Creating var evolution video and frames...")
+        create_var_evolution_video(
+            all_sim_data, all_analytical_data, context['var_evolution_dir'], run_name, fps=2, save_frames=True
+        )
+    
+    if 'plotly' in run_phases:
+        # Also create interactive plotly version
+        logger.info(f"     ├─ Creating interactive plotly var evolution...")
+        create_var_evolution_plotly(
+            all_sim_data, all_analytical_data, context['var_evo_plotly_dir'], run_name
+        )
+    
+    if 'errors' not in run_phases:
+        return {'branch': branch_name, 'phases': list(run_phases)}
+    
+    # All error fields and norms of the run from one sim - analytical per variable;
+    # everything below only reads from it
+    run_errors = RunErrors(all_sim_data, all_analytical_data, variables=context['error_variables'], metrics=metrics,
+                           storage_dtype=context['storage_dtype'], roi=context['roi'])
+    
+    # Always calculate absolute error for caching
+    spatial_errors_abs = run_errors.spatial_errors('absolute', variables=ANALYSIS_VARIABLES)
+    
+    error_evolution_dir = context['error_evolution_dir']
+    error_evo_plotly_dir = context['error_evo_plotly_dir']
+    
+    if {'error_videos', 'plotly'} & set(run_phases):
+        # Create COMBINED error evolution with all configured metrics by DEFAULT
+        if context['combine_in_videos'] and len(metrics) > 1:
+            # Calculate spatial errors for each error calculation method
+            spatial_errors_dict = {}
+        
+            # Map metrics to error calculation methods
+            # L1 and LINF use absolute error, L2 uses squared error
+            if 'l1' in metrics or 'linf' in metrics:
+                spatial_errors_dict['L1/LINF (Absolute)'] = spatial_errors_abs
+            if 'l2' in metrics:
+                spatial_errors_sq = run_errors.spatial_errors('squared', variables=ANALYSIS_VARIABLES)
+                spatial_errors_dict['L2 (Squared)'] = spatial_errors_sq
+        
+            if 'error_videos' in run_phases:
+                # Create combined video showing all metrics together
+                logger.info(f"     ├─ Creating combined error evolution (L1, L2, LINF) video and frames...")
+                create_combined_error_evolution_video(
+                    spatial_errors_dict, error_evolution_dir, run_name, fps=2, 
+                    unit_length=unit_length, save_frames=True
+                )
+        
+            if 'plotly' in run_phases:
+                # Also create interactive plotly version
+                logger.info(f"     ├─ Creating interactive plotly combined error evolution...")
+                create_combined_error_evolution_plotly(
+                    spatial_errors_dict, error_evo_plotly_dir, run_name, unit_length=unit_length
+                )
+            logger.info(f"     └─ ✓ Created combined error evolution with {len(spatial_errors_dict)} error types")
+        else:
+            if 'error_videos' in run_phases:
+                # Fallback: create single error evolution video
+                logger.info(f"     ├─ Creating single error evolution video and frames...")
+                create_error_evolution_video(
+                    spatial_errors_abs, error_evolution_dir, run_name, fps=2, 
+                    unit_length=unit_length, save_frames=True
+                )
+        
+            if 'plotly' in run_phases:
+                # Also create interactive plotly version
+                logger.info(f"     ├─ Creating interactive plotly error evolution...")
+                create_error_evolution_plotly(
+                    spatial_errors_abs, error_evo_plotly_dir, run_name, unit_length=unit_length
+                )
+            logger.info(f"     └─ ✓ Created error evolution video")
+    
+    # Calculate normalized spatial-temporal errors (for notebook usage)
+    logger.info(f"     ├─ Calculating normalized spatial-temporal errors...")
+    normalized_errors = run_errors.normalized_errors(
+        variables=analyze_variables,
+        normalize_by_space=False,
+        normalize_by_time=False
+    )
+    
+    # Save to pickle cache for fast notebook loading
+    cache_dir = analysis_dir / "error" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = cache_dir / f"{run_name}_normalized_errors.pkl"
     
-    logger.info(f"Loaded {len(all_sim_data)} VAR files (t={all_sim_data[0]['t']:.3e} to {all_sim_data[-1]['t']:.3e})")
+    try:
+        import pickle
+        with open(cache_file, 'wb') as f:
+            pickle.dump(normalized_errors, f, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"     └─ ✓ Calculated and cached errors for {len(normalized_errors)} variables")
+    except Exception as e:
+        logger.warning(f"     └─ ✓ Calculated errors for {len(normalized_errors)} variables (cache save failed: {e})")
     
-    # Generate analytical solutions for all timesteps
-    all_analytical_data = []
-    for sim_data in all_sim_data:
-        analytical_data = get_analytical_solution(sim_data['params'], sim_data['x'], sim_data['t'])
-        if analytical_data:
-            all_analytical_data.append(analytical_data)
+    # Create and cache "mind the gap" spacetime data
+    logger.info(f"     ├─ Creating 'mind the gap' spacetime data...")
+    from src.analysis.data_prep import prepare_spacetime_error_data, export_spacetime_data_to_json
     
-    if not all_analytical_data:
-        logger.error(f"Failed to generate analytical solutions for {run_name}")
-        return None
+    mind_gap_dir = analysis_dir / "error" / "mind_the_gap" / run_name
+    mind_gap_dir.mkdir(parents=True, exist_ok=True)
     
-    # Validation: Ensure we have one analytical solution per VAR file
-    if len(all_analytical_data) != len(all_sim_data):
-        logger.error(f"Mismatch: {len(all_sim_data)} VAR files but {len(all_analytical_data)} analytical solutions")
-        return None
+    # Prepare and save data for each variable
+    for var in analyze_variables:
+        prepared_data = prepare_spacetime_error_data(
+            normalized_errors,
+            var,
+            unit_length,
+            use_relative=True
+        )
+        if prepared_data:
+            export_spacetime_data_to_json(prepared_data, mind_gap_dir, run_name, var)
+    
+    logger.info(f"     └─ ✓ Saved spacetime data for interactive visualization")
+    logger.info(f"     └─ ✓ Calculated errors for {len(analyze_variables)} variables")
+    
+    # Error norms for PHASE 3, while the snapshots are at hand
+    return {
+        'branch': branch_name,
+        'phases': list(run_phases),
+        'unit_length': unit_length,
+        'spatial_errors': spatial_errors_abs,
+        'normalized_errors': normalized_errors,
+        'error_norms': run_errors.error_norms(context['norm_metrics'], variables=ANALYSIS_VARIABLES),
+        'ranking_errors': _ranking_errors(spatial_errors_abs),
+        'fronts': track_fronts(all_sim_data, all_analytical_data),
+        'n_timesteps': len(all_sim_data),
+        'var_files': [sim_data['var_file'] for sim_data in all_sim_data],
+        **_grid_spacing(all_sim_data[0]['x'])
+    }
+
+
+def _load_run_for_rendering(run_name: str, context: dict, analytical_cache: AnalyticalCache, jobs: int) -> tuple:
+    """Loads a run of the suite with its analytical solutions (all variables, for the var evolution videos)."""
+    return load_run_with_analytical(context['hpc_run_base_dir'] / run_name, jobs=jobs,
+                                    store_file=snapshot_store_path(context['analysis_dir'], run_name),
+                                    fast_reader=context['fast_reader'], selection=context['selection'],
+                                    analytical_cache=analytical_cache)
+
+
+def _process_loaded_run(run_name: str, branch_name: str, loaded: tuple, context: dict) -> dict:
+    """Renders a loaded run with ``_render_run``.
     
-    # Validation: Verify timestep pairing is correct
-    for idx, (sim, anal) in enumerate(zip(all_sim_data, all_analytical_data)):
-        if abs(sim['t'] - anal['t']) > 1e-10:
-            logger.error(f"Timestep mismatch at VAR {idx}: sim_t={sim['t']:.6e} vs anal_t={anal['t']:.6e}")
-            return None
+    Raises:
+        ValueError: If the VAR files or the analytical solutions could not be loaded
+    """
+    all_sim_data, all_analytical_data = loaded
+    if not all_sim_data:
+        raise ValueError("Failed to load VAR files")
+    if all_analytical_data is None:
+        raise ValueError("Failed to generate analytical solutions")
+    return _render_run(run_name, branch_name, all_sim_data, all_analytical_data, context)
+
+
+# Suite settings and analytical cache of a run worker, set by _init_run_worker
+_RUN_WORKER_STATE = {}
+
+
+def _init_run_worker(context: dict):
+    """Pool initializer: stores the suite settings and a per-worker analytical cache."""
+    _RUN_WORKER_STATE['context'] = context
+    _RUN_WORKER_STATE['analytical_cache'] = AnalyticalCache(analytical_cache_dir(context['analysis_dir']))
+
+
+def _process_run_in_worker(run_name: str, branch_name: str) -> dict:
+    """Worker entry point: loads and renders one run (its VAR files are read serially)."""
+    context = _RUN_WORKER_STATE['context']
+    loaded = _load_run_for_rendering(run_name, context, _RUN_WORKER_STATE['analytical_cache'], jobs=1)
+    return _process_loaded_run(run_name, branch_name, loaded, context)
+
+
+def _process_runs_parallel(tasks: list[tuple[str, str]], context: dict, n_workers: int, collect) -> dict:
+    """Processes (run name, branch) tasks on a process pool.
     
-    logger.info(f"✓ Generated {len(all_analytical_data)} analytical solutions with correct timestep pairing")
+    A failing run does not affect the others. Runs are left unprocessed if the
+    pool cannot be started or breaks down, so the caller can fall back to serial
+    processing. Each result is handed to ``collect(run_name, result)`` as soon as
+    its run is done, so the results of all runs are never held at once.
     
-    # Calculate error metrics
-    std_devs = calculate_std_deviation_across_vars(all_sim_data, all_analytical_data)
-    abs_devs = calculate_absolute_deviation_per_var(all_sim_data, all_analytical_data)
-    spatial_errors = calculate_spatial_errors(all_sim_data, all_analytical_data, error_method=error_method)
+    Returns:
+        Dictionary mapping the processed run names to None (collected) or the
+        exception the run failed with
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
     
-    # Return loaded data along with metrics for caching/reuse
-    return std_devs, abs_devs, spatial_errors, all_sim_data, all_analytical_data
+    results = {}
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_run_worker,
+                                 initargs=(context,)) as executor:
+            futures = {executor.submit(_process_run_in_worker, run_name, branch_name): run_name
+                       for run_name, branch_name in tasks}
+            for done, future in enumerate(as_completed(futures), 1):
+                # Forget the future once collected: it holds the run's full result,
+                # which must only be referenced by the caller's (memory-bounded) cache
+                run_name = futures.pop(future)
+                try:
+                    collect(run_name, future.result())
+                    results[run_name] = None
+                    logger.info(f"  ├─ [{done}/{len(tasks)}] ✓ {run_name}")
+                except BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    results[run_name] = e
+                    logger.warning(f"  ├─ [{done}/{len(tasks)}] ✗ {run_name}: {e}")
+                finally:
+                    del future
+    except Exception as e:
+        logger.warning(f"Run worker pool failed ({e}); {len(tasks) - len(results)} run(s) left for serial processing")
+    return results
 
 
-def visualize_suite(experiment_name: str, specific_runs: list = None, var_selection: str = None):
+def visualize_suite(experiment_name: str, specific_runs: list = None, var_selection: str = None, jobs: int = 1,
+                    fast_reader: bool = False, prefetch: int = 0, snapshot_selection: dict | None = None,
+                    run_workers: int = 1, force: bool = False, phases: list | None = None,
+                    skip_phases: list | None = None, max_memory: int | None = None):
     """Simplified visualization function - redirects to video-only analysis."""
     logger.warning("The --viz flag is deprecated. Use --analyze for video-only analysis instead.")
     logger.info("Redirecting to video-only analysis...")
-    analyze_suite_videos_only(experiment_name)
+    analyze_suite_videos_only(experiment_name, jobs=jobs, fast_reader=fast_reader, prefetch=prefetch,
+                              snapshot_selection=snapshot_selection, run_workers=run_workers, force=force,
+                              phases=phases, skip_phases=skip_phases, max_memory=max_memory)
 
 
 def analyze_suite_comprehensive(experiment_name: str, error_method: str = 'absolute'):
@@ -215,7 +1241,11 @@ def analyze_suite_comprehensive(experiment_name: str, error_method: str = 'absol
     analyze_suite_videos_only(experiment_name, error_method)
 
 
-def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolute', combined_video: bool = False):
+def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolute', combined_video: bool = False,
+                              jobs: int = 1, fast_reader: bool = False, prefetch: int = 0,
+                              snapshot_selection: dict | None = None, run_workers: int = 1, force: bool = False,
+                              phases: list | None = None, skip_phases: list | None = None,
+                              max_memory: int | None = None):
     """Comprehensive analysis: Creates videos, calculates L1/L2 error norms, and generates final report.
     
     Workflow:
@@ -231,6 +1261,28 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
         experiment_name: Name of the experiment suite
         error_method: Error calculation method for spatial errors
         combined_video: If True, generate a combined error evolution video.
+        jobs: Number of worker processes used to load the VAR files of each run.
+        fast_reader: Read VAR files with the native memory-mapped reader.
+        prefetch: Number of runs to load (with their analytical solutions) on a
+            background thread while the current run is rendered. 0 disables prefetching.
+        snapshot_selection: Snapshot selection given on the command line (``var_stride``,
+            ``t_min``, ``t_max``, ``max_snapshots``); overrides the ``error_analysis`` config.
+        run_workers: Number of runs processed in parallel in PHASE 1, each in its own
+            process. Workers read VAR files serially (``jobs`` and ``prefetch`` apply
+            to serial processing only). Phases 2-6 start once all runs are done and see
+            them in manifest order; a failing run is logged and left out.
+        force: Clear all outputs and re-render every run. By default the analysis is
+            incremental: runs whose VAR files, settings and analysis code are unchanged
+            since their last analysis (``run_fingerprint``) are taken from the run
+            store without loading or re-rendering them, and only the cross-run
+            phases are redone.
+        phases: Names of the phases to run (default: all, see ``src.workflows.phases``).
+            Their dependencies are added; a run is only loaded if it lacks a stored
+            result or one of the selected per-run outputs.
+        skip_phases: Names of phases to leave out (still run if a selected phase needs them).
+        max_memory: Bytes of per-run error fields kept in memory for the cross-run phases
+            (None for no limit). Beyond it the fields of the least recently used runs
+            are dropped and read back from the run store on demand.
     """
     # Setup file logging for this analysis run
     setup_file_logging(experiment_name, 'analysis')
@@ -241,16 +1293,22 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
         logger.info("Combined error video generation ENABLED.")
     logger.info(f"=" * 80)
     
+    selected_phases = resolve_phases(phases, skip_phases)
+    logger.info(f"Phases: {', '.join(selected_phases)}")
+    
     plan_file = DIRS.config / experiment_name / DIRS.plan_subdir / FILES.plan
     with open(plan_file, 'r') as f: 
         plan = yaml.safe_load(f)
     
-    # Read error analysis configuration from plan file
-    error_config = plan.get('error_analysis', {})
+    # Read error analysis configuration (analysis_config.yaml, overridden by the plan file)
+    error_config = load_error_analysis_config(experiment_name, plan)
     metrics = error_config.get('metrics', ['l1', 'l2', 'linf'])
     ranking_metric = error_config.get('ranking_metric', None)
     combine_in_videos = error_config.get('combine_in_videos', True)
     analyze_variables = error_config.get('analyze_variables', ['rho', 'ux', 'pp', 'ee'])
+    selection = resolve_snapshot_selection(error_config, snapshot_selection)
+    storage_dtype = resolve_storage_dtype(error_config)
+    roi = resolve_roi(error_config)
     
     # Validate and set ranking metric
     if ranking_metric is None:
@@ -272,6 +1330,8 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     logger.info(f"  ├─ Metrics to calculate: {', '.join([m.upper() for m in metrics])}")
     logger.info(f"  ├─ Ranking metric: {ranking_metric.upper()}")
     logger.info(f"  ├─ Variables: {', '.join(analyze_variables)}")
+    logger.info(f"  ├─ Snapshot selection: {selection or 'all VAR files'}")
+    logger.info(f"  ├─ Error norm region: {roi or 'whole domain'}")
     logger.info(f"  └─ Combine in videos: {combine_in_videos}")
     
     hpc_run_base_dir = Path(plan['hpc']['run_base_dir'])
@@ -296,18 +1356,25 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     error_evo_plotly_dir = error_dir / "evo_plotly"
     error_frames_dir = error_dir / "frames"
 
-    # Clear old visualizations AND cache before creating new ones
-    logger.info("Clearing old visualization directories...")
-    clear_directory(var_evolution_dir)
-    clear_directory(var_evo_plotly_dir)
-    clear_directory(error_evolution_dir)
-    clear_directory(error_evo_plotly_dir)
-    clear_directory(error_frames_dir)
-    
-    # Clear cache directory to force fresh computation
-    cache_dir = error_dir / "cache"
-    logger.info("Clearing cache directory for fresh computation...")
-    clear_directory(cache_dir)
+    if force:
+        # Clear old visualizations AND cache of the selected phases before creating new ones
+        logger.info("Clearing old visualization directories...")
+        if 'var_videos' in selected_phases:
+            clear_directory(var_evolution_dir)
+        if 'plotly' in selected_phases:
+            clear_directory(var_evo_plotly_dir)
+            clear_directory(error_evo_plotly_dir)
+        if 'error_videos' in selected_phases:
+            clear_directory(error_evolution_dir)
+            clear_directory(error_frames_dir)
+        
+        # Clear cache directory to force fresh computation
+        if 'errors' in selected_phases:
+            cache_dir = error_dir / "cache"
+            logger.info("Clearing cache directory for fresh computation...")
+            clear_directory(cache_dir)
+    else:
+        logger.info("Incremental analysis: unchanged runs are reused (--force re-renders all runs)")
 
     with open(manifest_file, 'r') as f: 
         run_names = [line.strip() for line in f if line.strip()]
@@ -346,161 +1413,146 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     logger.info("PHASE 1: Loading data and creating individual videos")
     logger.info("=" * 80)
     
-    loaded_data_cache = {}
-    runs_processed = 0
-    
-    for branch_name, branch_runs in runs_per_branch.items():
-        if not branch_runs:
+    # Var evolution videos plot every variable, so all of them are loaded here.
+    # Runs sharing initial state, grid and times share one analytical solution.
+    # Each run is reduced to its error fields, norms and scores (see _render_run);
+    # only those are kept for the cross-run phases.
+    context = {
+        'hpc_run_base_dir': hpc_run_base_dir,
+        'analysis_dir': analysis_dir,
+        'var_evolution_dir': var_evolution_dir,
+        'var_evo_plotly_dir': var_evo_plotly_dir,
+        'error_evolution_dir': error_evolution_dir,
+        'error_evo_plotly_dir': error_evo_plotly_dir,
+        'metrics': metrics,
+        'norm_metrics': list(dict.fromkeys([*metrics, *DEFAULT_ERROR_NORM_METRICS])),
+        'analyze_variables': analyze_variables,
+        'error_variables': list(dict.fromkeys([*ANALYSIS_VARIABLES, *analyze_variables])),
+        'storage_dtype': storage_dtype,
+        'roi': roi,
+        'combine_in_videos': combine_in_videos,
+        'use_code_units': error_config.get('use_code_units', True),
+        'selection': selection,
+        'fast_reader': fast_reader,
+        'run_phases': tuple(name for name in RUN_PHASES if name in selected_phases),
+    }
+    tasks = [(run_name, branch_name) for branch_name, branch_runs in runs_per_branch.items()
+             for run_name in branch_runs]
+    
+    # Unchanged runs come from the run store, together with the outputs they rendered
+    # last time; a run is only loaded again for selected per-run phases it has not run
+    run_store = RunResultStore(run_store_dir(analysis_dir))
+    render_settings = {key: context[key] for key in RENDER_SETTINGS}
+    input_fingerprints, fingerprints, stored_phases = {}, {}, {}
+    # The error fields of all runs need not fit in memory: beyond max_memory they are
+    # dropped in LRU order and read back from the run store when a later phase needs them
+    loaded_data_cache = RunResultCache(
+        max_memory, load=lambda run_name: run_store.get_result(run_name, fingerprints[run_name]))
+    for run_name, branch_name in tasks:
+        input_files = _run_input_files(hpc_run_base_dir / run_name)
+        input_fingerprints[run_name] = run_fingerprint(input_files)
+        fingerprints[run_name] = run_fingerprint(input_files, render_settings)
+        stored = None if force else run_store.get_result(run_name, fingerprints[run_name])
+        if stored is None:
             continue
+        stored_phases[run_name] = set(stored.get('phases', ()))
+        # Outputs deleted since the last analysis are rendered again
+        missing = _missing_run_phases(run_name, stored_phases[run_name], context)
+        if missing:
+            logger.info(f"{run_name}: outputs of {', '.join(sorted(missing))} are missing and will be re-rendered")
+            stored_phases[run_name] -= missing
+        if set(context['run_phases']) - {'load'} <= stored_phases[run_name]:
+            loaded_data_cache.put(run_name, {**stored, 'branch': branch_name})
+    if loaded_data_cache:
+        logger.info(f"Reusing {len(loaded_data_cache)} unchanged run(s): {', '.join(loaded_data_cache)}")
+    tasks_to_render = [(run_name, branch_name) for run_name, branch_name in tasks
+                       if run_name not in loaded_data_cache]
+    logger.info(f"Runs to analyse: {len(tasks_to_render)} of {len(tasks)}")
+    
+    store_key = store_settings(context['norm_metrics'], ANALYSIS_VARIABLES, selection, roi)
+    
+    def collect(run_name: str, result: dict):
+        # Keep the rendered run for the next analysis, and share its norms with
+        # --error-norms, which then needs no VAR I/O for it. Outputs of earlier
+        # analyses of the unchanged run are still in place.
+        if 'errors' in selected_phases:
+            result['phases'] = sorted(stored_phases.get(run_name, set()) | set(result['phases']))
+            run_store.put_result(run_name, fingerprints[run_name], result)
+            if result['error_norms']:
+                run_store.put(run_name, store_key, {key: result[key] for key in RUN_RECORD_KEYS},
+                              input_fingerprints[run_name])
+        elif run_name in stored_phases:
+            # Without errors there is no result to store, but the stored one can
+            # record the outputs rendered now, so the next analysis skips them
+            stored = run_store.get_result(run_name, fingerprints[run_name])
+            if stored is not None:
+                stored['phases'] = sorted(stored_phases[run_name] | set(result['phases']))
+                run_store.put_result(run_name, fingerprints[run_name], stored)
+        loaded_data_cache.put(run_name, result)
+    
+    outcomes = {}
+    
+    if run_workers > 1 and len(tasks_to_render) > 1:
+        n_workers = min(run_workers, len(tasks_to_render))
+        logger.info(f"Processing {len(tasks_to_render)} runs on {n_workers} worker processes")
+        if prefetch > 0:
+            logger.info("Prefetching is not used with parallel runs")
+        outcomes.update(_process_runs_parallel(tasks_to_render, context, n_workers, collect))
+    
+    remaining = [(run_name, branch_name) for run_name, branch_name in tasks_to_render if run_name not in outcomes]
+    if remaining:
+        # With prefetching, the next runs load in the background while this one renders
+        analytical_cache = AnalyticalCache(analytical_cache_dir(analysis_dir))
+        if prefetch > 0:
+            logger.info(f"Prefetching up to {prefetch} run(s) ahead of rendering")
+        loaded_runs = iter_prefetched(
+            [run_name for run_name, _ in remaining],
+            lambda run_name: _load_run_for_rendering(run_name, context, analytical_cache, jobs),
+            depth=prefetch
+        )
         
-        branch_total = len(branch_runs)
-        logger.info(f"\n📂 Processing branch: {branch_name} ({branch_total} runs)")
-        
-        for branch_idx, run_name in enumerate(branch_runs, 1):
-            runs_processed += 1
-            overall_pct = (runs_processed / total_runs) * 100
+        branch_totals = {branch_name: len(branch_runs) for branch_name, branch_runs in runs_per_branch.items()}
+        branch_counts = dict.fromkeys(branch_totals, 0)
+        for runs_processed, (run_name, branch_name) in enumerate(remaining, 1):
+            branch_counts[branch_name] += 1
+            branch_idx, branch_total = branch_counts[branch_name], branch_totals[branch_name]
+            if branch_idx == 1:
+                logger.info(f"\n📂 Processing branch: {branch_name} ({branch_total} runs)")
+            overall_pct = (runs_processed / len(remaining)) * 100
             branch_pct = (branch_idx / branch_total) * 100
             
-            logger.info(f"  ├─ [{runs_processed}/{total_runs}] ({overall_pct:.1f}%) | "
+            logger.info(f"  ├─ [{runs_processed}/{len(remaining)}] ({overall_pct:.1f}%) | "
                        f"Branch: [{branch_idx}/{branch_total}] ({branch_pct:.1f}%) | "
                        f"Run: {run_name}")
             
-            # --- START: Modified section for combined video ---
-            all_sim_data = load_all_var_files(hpc_run_base_dir / run_name)
-            if not all_sim_data:
-                logger.warning(f"     └─ ✗ Failed to load VAR files")
-                continue
-
-            all_analytical_data = [get_analytical_solution(s['params'], s['x'], s['t']) for s in all_sim_data]
-            if not all(all_analytical_data):
-                logger.warning(f"     └─ ✗ Failed to generate analytical solutions")
-                continue
-            
-            # Always calculate absolute error for caching
-            spatial_errors_abs = calculate_spatial_errors(all_sim_data, all_analytical_data, error_method='absolute')
-
-            # Cache the essential data
-            loaded_data_cache[run_name] = {
-                'sim_data': all_sim_data,
-                'analytical_data': all_analytical_data,
-                'branch': branch_name,
-                'spatial_errors': spatial_errors_abs,
-            }
-            
-            # Get unit length - respect use_code_units flag
-            unit_length = 1.0
-            if all_sim_data and 'params' in all_sim_data[0]:
-                # Check if we should use code units (normalized) or physical units
-                use_code_units = error_config.get('use_code_units', True)
-                
-                if use_code_units:
-                    unit_length = 1.0  # Force code units for normalized calculations
-                    logger.debug(f"     ├─ Using code units (unit_length=1.0) for normalized calculations")
-                else:
-                    unit_length = all_sim_data[0]['params'].unit_length
-                    logger.debug(f"     ├─ Using physical units (unit_length={unit_length:.3e})")
-
-            logger.info(f"     ├─ Creating var evolution video and frames...")
-            create_var_evolution_video(
-                all_sim_data, all_analytical_data, var_evolution_dir, run_name, fps=2, save_frames=True
-            )
-            
-            # Also create interactive plotly version
-            logger.info(f"     ├─ Creating interactive plotly var evolution...")
-            create_var_evolution_plotly(
-                all_sim_data, all_analytical_data, var_evo_plotly_dir, run_name
-            )
-            
-            # Create COMBINED error evolution with all configured metrics by DEFAULT
-            logger.info(f"     ├─ Creating combined error evolution (L1, L2, LINF) video and frames...")
-            if combine_in_videos and len(metrics) > 1:
-                # Calculate spatial errors for each error calculation method
-                spatial_errors_dict = {}
-                
-                # Map metrics to error calculation methods
-                # L1 and LINF use absolute error, L2 uses squared error
-                if 'l1' in metrics or 'linf' in metrics:
-                    spatial_errors_dict['L1/LINF (Absolute)'] = spatial_errors_abs
-                if 'l2' in metrics:
-                    spatial_errors_sq = calculate_spatial_errors(all_sim_data, all_analytical_data, error_method='squared')
-                    spatial_errors_dict['L2 (Squared)'] = spatial_errors_sq
-                
-                # Create combined video showing all metrics together
-                create_combined_error_evolution_video(
-                    spatial_errors_dict, error_evolution_dir, run_name, fps=2, 
-                    unit_length=unit_length, save_frames=True
-                )
-                
-                # Also create interactive plotly version
-                logger.info(f"     ├─ Creating interactive plotly combined error evolution...")
-                create_combined_error_evolution_plotly(
-                    spatial_errors_dict, error_evo_plotly_dir, run_name, unit_length=unit_length
-                )
-                logger.info(f"     └─ ✓ Created combined error evolution with {len(spatial_errors_dict)} error types")
-            else:
-                # Fallback: create single error evolution video
-                logger.info(f"     ├─ Creating single error evolution video and frames...")
-                create_error_evolution_video(
-                    spatial_errors_abs, error_evolution_dir, run_name, fps=2, 
-                    unit_length=unit_length, save_frames=True
-                )
-                
-                # Also create interactive plotly version
-                logger.info(f"     ├─ Creating interactive plotly error evolution...")
-                create_error_evolution_plotly(
-                    spatial_errors_abs, error_evo_plotly_dir, run_name, unit_length=unit_length
-                )
-                logger.info(f"     └─ ✓ Created error evolution video")
-            # --- END: Modified section ---
-            
-            # Calculate normalized spatial-temporal errors (for notebook usage)
-            logger.info(f"     ├─ Calculating normalized spatial-temporal errors...")
-            normalized_errors = calculate_normalized_spatial_errors(
-                all_sim_data,
-                all_analytical_data,
-                variables=analyze_variables,
-                normalize_by_space=False,
-                normalize_by_time=False
-            )
-            
-            # Cache normalized errors for later use (e.g., in notebooks)
-            loaded_data_cache[run_name]['normalized_errors'] = normalized_errors
-            
-            # Save to pickle cache for fast notebook loading
-            cache_dir = analysis_dir / "error" / "cache"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            cache_file = cache_dir / f"{run_name}_normalized_errors.pkl"
-            
+            _, loaded = next(loaded_runs)
             try:
-                import pickle
-                with open(cache_file, 'wb') as f:
-                    pickle.dump(normalized_errors, f, protocol=pickle.HIGHEST_PROTOCOL)
-                logger.info(f"     └─ ✓ Calculated and cached errors for {len(normalized_errors)} variables")
+                collect(run_name, _process_loaded_run(run_name, branch_name, loaded, context))
+                outcomes[run_name] = None
             except Exception as e:
-                logger.warning(f"     └─ ✓ Calculated errors for {len(normalized_errors)} variables (cache save failed: {e})")
-            
-            # Create and cache "mind the gap" spacetime data
-            logger.info(f"     ├─ Creating 'mind the gap' spacetime data...")
-            from src.analysis.data_prep import prepare_spacetime_error_data, export_spacetime_data_to_json
-            
-            mind_gap_dir = analysis_dir / "error" / "mind_the_gap" / run_name
-            mind_gap_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Prepare and save data for each variable
-            for var in analyze_variables:
-                prepared_data = prepare_spacetime_error_data(
-                    normalized_errors,
-                    var,
-                    unit_length,
-                    use_relative=True
-                )
-                if prepared_data:
-                    export_spacetime_data_to_json(prepared_data, mind_gap_dir, run_name, var)
-            
-            logger.info(f"     └─ ✓ Saved spacetime data for interactive visualization")
-            
-            # Store normalized errors for later combined visualization
-            logger.info(f"     └─ ✓ Calculated errors for {len(analyze_variables)} variables")
+                logger.warning(f"     └─ ✗ {e}")
+                outcomes[run_name] = e
+            del loaded
+        
+        loaded_runs.close()
+        logger.info(f"Analytical solutions: {analytical_cache.misses} solved, "
+                    f"{analytical_cache.hits} reused across {len(remaining)} runs")
+    
+    # Runs in manifest order, however the workers finished
+    loaded_data_cache.restrict(run_name for run_name, _ in tasks)
+    failed_runs = [run_name for run_name, _ in tasks if run_name not in loaded_data_cache]
+    if failed_runs:
+        logger.warning(f"{len(failed_runs)} of {len(tasks)} run(s) failed in PHASE 1: {', '.join(failed_runs)}")
+    if max_memory is not None:
+        logger.info(f"Run results: {loaded_data_cache.stats()}")
+    
+    if 'errors' not in selected_phases:
+        # Every cross-run phase needs the errors of the runs
+        logger.success(f"✓ Finished phases {', '.join(selected_phases)} for {len(loaded_data_cache)} runs")
+        return
+    
+    # Code units unless a run says otherwise (set per run below)
+    unit_length = 1.0
     
     # ============================================================
     # PHASE 2: Find best performers and create overlay videos
@@ -512,34 +1564,16 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     # Use the explicitly configured ranking_metric (already validated above)
     logger.info(f"Using configured ranking metric: {ranking_metric.upper()}")
     
-    # Calculate average error for each run using ONLY DENSITY (rho)
+    # Average error of each run using ONLY DENSITY (rho) across all timesteps, as
+    # computed in PHASE 1 (_ranking_errors), so no error field is read back
+    if ranking_metric not in RANKING_METRICS:
+        # Default to L1 if somehow an invalid metric got through
+        logger.warning(f"Unknown ranking metric '{ranking_metric}', using L1")
+    score_metric = ranking_metric if ranking_metric in RANKING_METRICS else 'l1'
     run_scores = {}
-    for run_name, cached in loaded_data_cache.items():
-        spatial_errors = cached['spatial_errors']
-        
-        # Calculate average error for DENSITY ONLY across all timesteps using configured ranking metric
-        total_error = 0
-        count = 0
-        if 'rho' in spatial_errors:
-            for errors in spatial_errors['rho']['errors_per_timestep']:
-                if ranking_metric == 'l1':
-                    # L1 norm: mean absolute error
-                    total_error += np.mean(np.abs(errors))
-                elif ranking_metric == 'l2':
-                    # L2 norm: root mean square error
-                    total_error += np.sqrt(np.mean(errors**2))
-                elif ranking_metric == 'linf':
-                    # L∞ norm: maximum absolute error
-                    total_error += np.max(np.abs(errors))
-                else:
-                    # Default to L1 if somehow an invalid metric got through
-                    logger.warning(f"Unknown ranking metric '{ranking_metric}', using L1")
-                    total_error += np.mean(np.abs(errors))
-                count += 1
-        
-        avg_error = total_error / count if count > 0 else float('inf')
-        run_scores[run_name] = avg_error
-        logger.info(f"  {run_name}: avg {ranking_metric.upper()} error (rho only) = {avg_error:.6e}")
+    for run_name in loaded_data_cache:
+        run_scores[run_name] = loaded_data_cache.light(run_name)['ranking_errors'][score_metric]
+        logger.info(f"  {run_name}: avg {ranking_metric.upper()} error (rho only) = {run_scores[run_name]:.6e}")
     
     # Find best performer in each branch
     logger.info(f"\n🏆 Finding best performers in each branch...")
@@ -554,38 +1588,29 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
             branch_best_performers[branch_name] = best_run
             logger.info(f"  ├─ {branch_name}: {best_run} ({ranking_metric.upper()}={branch_scores[best_run]:.6e})")
     
-    # Create overlay videos for each branch (all runs in branch)
-    logger.info(f"\n🎬 Creating branch overlay videos...")
-    for branch_name, branch_runs in runs_per_branch.items():
-        if not branch_runs or len(branch_runs) < 2:
-            continue
+    if 'error_videos' in selected_phases:
+        # Create overlay videos for each branch (all runs in branch)
+        logger.info(f"\n🎬 Creating branch overlay videos...")
+        for branch_name, branch_runs in runs_per_branch.items():
+            if not branch_runs or len(branch_runs) < 2:
+                continue
         
-        logger.info(f"  ├─ Branch: {branch_name} ({len(branch_runs)} runs)")
+            logger.info(f"  ├─ Branch: {branch_name} ({len(branch_runs)} runs)")
         
-        spatial_errors_list = []
-        for run_name in branch_runs:
-            if run_name in loaded_data_cache:
-                cached = loaded_data_cache[run_name]
-                spatial_errors_list.append((run_name, cached['spatial_errors']))
-        
-        if spatial_errors_list:
-            # Get unit_length from first run - respect use_code_units flag
-            unit_length = 1.0
-            first_run_data = loaded_data_cache[branch_runs[0]]
-            if first_run_data['sim_data'] and 'params' in first_run_data['sim_data'][0]:
-                params = first_run_data['sim_data'][0]['params']
-                use_code_units = error_config.get('use_code_units', True)
-                
-                if use_code_units:
-                    unit_length = 1.0  # Force code units
-                elif hasattr(params, 'unit_length'):
-                    unit_length = params.unit_length
+            spatial_errors_list = []
+            for run_name in branch_runs:
+                if run_name in loaded_data_cache:
+                    spatial_errors_list.append((run_name, loaded_data_cache[run_name]['spatial_errors']))
+        
+            if spatial_errors_list:
+                # unit_length of the first run (respects use_code_units)
+                unit_length = loaded_data_cache.light(spatial_errors_list[0][0])['unit_length']
             
-            output_name = f"{experiment_name}_{branch_name}_overlay"
-            create_overlay_error_evolution_video(
-                spatial_errors_list, error_evolution_dir, output_name, fps=2, unit_length=unit_length
-            )
-            logger.info(f"     └─ ✓ Created overlay for {branch_name}")
+                output_name = f"{experiment_name}_{branch_name}_overlay"
+                create_overlay_error_evolution_video(
+                    spatial_errors_list, error_evolution_dir, output_name, fps=2, unit_length=unit_length
+                )
+                logger.info(f"     └─ ✓ Created overlay for {branch_name}")
     
     # Find top 3 best performers overall
     logger.info(f"\n🏆 Finding top 3 best performers overall...")
@@ -595,260 +1620,265 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     for idx, (run, score) in enumerate(sorted_runs[:3], 1):
         logger.info(f"  ├─ #{idx}: {run} ({ranking_metric.upper()}={score:.6e})")
     
-    # Create overlay video for top 3
-    logger.info(f"\n🎬 Creating top 3 overlay video...")
-    top_3_spatial_errors = []
-    for run_name in top_3_runs:
-        if run_name in loaded_data_cache:
-            cached = loaded_data_cache[run_name]
-            top_3_spatial_errors.append((run_name, cached['spatial_errors']))
-    
-    if top_3_spatial_errors:
-        # Get unit_length from first run - respect use_code_units flag
-        unit_length = 1.0
-        first_run_data = loaded_data_cache[top_3_runs[0]]
-        if first_run_data['sim_data'] and 'params' in first_run_data['sim_data'][0]:
-            params = first_run_data['sim_data'][0]['params']
-            use_code_units = error_config.get('use_code_units', True)
-            
-            if use_code_units:
-                unit_length = 1.0  # Force code units
-            elif hasattr(params, 'unit_length'):
-                unit_length = params.unit_length
-        
-        output_name = f"{experiment_name}_top3_best_performers_overlay"
-        create_overlay_error_evolution_video(
-            top_3_spatial_errors, error_evolution_dir, output_name, fps=2, unit_length=unit_length
-        )
-        logger.info(f"     └─ ✓ Created top 3 overlay video")
+    if 'error_videos' in selected_phases:
+        # Create overlay video for top 3
+        logger.info(f"\n🎬 Creating top 3 overlay video...")
+        top_3_spatial_errors = []
+        for run_name in top_3_runs:
+            if run_name in loaded_data_cache:
+                top_3_spatial_errors.append((run_name, loaded_data_cache[run_name]['spatial_errors']))
     
-    # ============================================================
-    # PHASE 2.5: Create combined error line graphs with all experiments
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("PHASE 2.5: Creating combined error line graphs")
-    logger.info("=" * 80)
+        if top_3_spatial_errors:
+            # unit_length of the best run (respects use_code_units)
+            unit_length = loaded_data_cache.light(top_3_spatial_errors[0][0])['unit_length']
+        
+            output_name = f"{experiment_name}_top3_best_performers_overlay"
+            create_overlay_error_evolution_video(
+                top_3_spatial_errors, error_evolution_dir, output_name, fps=2, unit_length=unit_length
+            )
+            logger.info(f"     └─ ✓ Created top 3 overlay video")
     
-    from datetime import datetime
-    import plotly.express as px
-    import plotly.graph_objects as go
+    if 'plotly' in selected_phases:
+        # ============================================================
+        # PHASE 2.5: Create combined error line graphs with all experiments
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("PHASE 2.5: Creating combined error line graphs")
+        logger.info("=" * 80)
     
-    # Get current timestamp in YYYYMMDD format
-    timestamp = datetime.now().strftime("%Y%m%d")
+        from datetime import datetime
+        import plotly.express as px
+        import plotly.graph_objects as go
+        from src.analysis.data_prep import prepare_spacetime_error_data
     
-    # Create organized structure: error -> evo_time -> <element>
-    evo_time_dir = analysis_dir / "error" / "evo_time"
+        # Get current timestamp in YYYYMMDD format
+        timestamp = datetime.now().strftime("%Y%m%d")
     
-    # Find best performer (lowest score)
-    best_run_name = min(run_scores.items(), key=lambda x: x[1])[0] if run_scores else None
+        # Create organized structure: error -> evo_time -> <element>
+        evo_time_dir = analysis_dir / "error" / "evo_time"
     
-    for var in analyze_variables:
-        element_dir = evo_time_dir / var
-        element_dir.mkdir(parents=True, exist_ok=True)
+        # Find best performer (lowest score)
+        best_run_name = min(run_scores.items(), key=lambda x: x[1])[0] if run_scores else None
+    
+        for var in analyze_variables:
+            element_dir = evo_time_dir / var
+            element_dir.mkdir(parents=True, exist_ok=True)
         
-        logger.info(f"  ├─ Creating combined {var.upper()} graph with all {len(loaded_data_cache)} experiments...")
+            logger.info(f"  ├─ Creating combined {var.upper()} graph with all {len(loaded_data_cache)} experiments...")
         
-        # Collect all data for this variable
-        all_traces = []
-        run_labels = []
-        timesteps_ref = None
+            # Collect all data for this variable
+            all_traces = []
+            run_labels = []
+            timesteps_ref = None
         
-        for run_idx, (run_name, cached) in enumerate(loaded_data_cache.items()):
-            normalized_errors = cached.get('normalized_errors')
-            if not normalized_errors or var not in normalized_errors:
-                continue
+            for run_idx, (run_name, cached) in enumerate(loaded_data_cache.items()):
+                normalized_errors = cached.get('normalized_errors')
+                if not normalized_errors or var not in normalized_errors:
+                    continue
             
-            # Prepare data for this run
-            prepared_data = prepare_spacetime_error_data(
-                normalized_errors,
-                var,
-                unit_length,
-                use_relative=True
-            )
+                # Prepare data for this run
+                prepared_data = prepare_spacetime_error_data(
+                    normalized_errors,
+                    var,
+                    unit_length,
+                    use_relative=True
+                )
             
-            if not prepared_data:
-                continue
+                if not prepared_data:
+                    continue
             
-            x_coords = prepared_data['x_coords']
-            timesteps = prepared_data['timesteps']
-            error_matrix = prepared_data['error_matrix']
+                x_coords = prepared_data['x_coords']
+                timesteps = prepared_data['timesteps']
+                error_matrix = prepared_data['error_matrix']
             
-            if timesteps_ref is None:
-                timesteps_ref = timesteps
+                if timesteps_ref is None:
+                    timesteps_ref = timesteps
             
-            # Determine if this is the best performer
-            is_best = (run_name == best_run_name)
+                # Determine if this is the best performer
+                is_best = (run_name == best_run_name)
             
-            # Create color - use distinct colors from a palette
-            colors = px.colors.qualitative.Set3 + px.colors.qualitative.Pastel + px.colors.qualitative.Set2
-            line_color = colors[run_idx % len(colors)]
+                # Create color - use distinct colors from a palette
+                colors = px.colors.qualitative.Set3 + px.colors.qualitative.Pastel + px.colors.qualitative.Set2
+                line_color = colors[run_idx % len(colors)]
             
-            # Set opacity - 0.5 for non-best, 1.0 for best
-            opacity = 1.0 if is_best else 0.5
-            line_width = 3 if is_best else 1.5
+                # Set opacity - 0.5 for non-best, 1.0 for best
+                opacity = 1.0 if is_best else 0.5
+                line_width = 3 if is_best else 1.5
             
-            # Create frames for this run
-            for t_idx in range(len(timesteps)):
-                trace = go.Scatter(
-                    x=x_coords,
-                    y=error_matrix[t_idx],
-                    mode='lines',
-                    name=run_name,
-                    line=dict(width=line_width, color=line_color),
-                    opacity=opacity,
-                    visible=(t_idx == 0),  # Only first frame visible initially
-                    legendgroup=run_name,
-                    showlegend=(t_idx == 0),  # Only show in legend once
-                    hovertemplate=f'{run_name}<br>x=%{{x:.3f}}<br>error=%{{y:.3e}}<extra></extra>'
-                )
-                all_traces.append((trace, t_idx, run_name, is_best))
+                # Create frames for this run
+                for t_idx in range(len(timesteps)):
+                    trace = go.Scatter(
+                        x=x_coords,
+                        y=error_matrix[t_idx],
+                        mode='lines',
+                        name=run_name,
+                        line=dict(width=line_width, color=line_color),
+                        opacity=opacity,
+                        visible=(t_idx == 0),  # Only first frame visible initially
+                        legendgroup=run_name,
+                        showlegend=(t_idx == 0),  # Only show in legend once
+                        hovertemplate=f'{run_name}<br>x=%{{x:.3f}}<br>error=%{{y:.3e}}<extra></extra>'
+                    )
+                    all_traces.append((trace, t_idx, run_name, is_best))
             
-            run_labels.append((run_name, is_best))
+                run_labels.append((run_name, is_best))
         
-        if not all_traces or timesteps_ref is None:
-            logger.warning(f"     └─ No data available for {var}")
-            continue
+            if not all_traces or timesteps_ref is None:
+                logger.warning(f"     └─ No data available for {var}")
+                continue
+        
+            # Group traces by timestep
+            traces_by_timestep = {}
+            for trace, t_idx, run_name, is_best in all_traces:
+                if t_idx not in traces_by_timestep:
+                    traces_by_timestep[t_idx] = []
+                traces_by_timestep[t_idx].append(trace)
         
-        # Group traces by timestep
-        traces_by_timestep = {}
-        for trace, t_idx, run_name, is_best in all_traces:
-            if t_idx not in traces_by_timestep:
-                traces_by_timestep[t_idx] = []
-            traces_by_timestep[t_idx].append(trace)
-        
-        # Create figure with all traces
-        fig = go.Figure()
-        for trace, _, _, _ in all_traces:
-            fig.add_trace(trace)
-        
-        # Create animation frames
-        n_timesteps = max(traces_by_timestep.keys()) + 1
-        frames = []
-        for t_idx in range(n_timesteps):
-            frame_data = []
-            for trace_idx, (trace, trace_t_idx, _, _) in enumerate(all_traces):
-                # Make trace visible if it matches current timestep
-                visible = (trace_t_idx == t_idx)
-                frame_data.append(go.Scatter(visible=visible))
+            # Create figure with all traces
+            fig = go.Figure()
+            for trace, _, _, _ in all_traces:
+                fig.add_trace(trace)
+        
+            # Create animation frames
+            n_timesteps = max(traces_by_timestep.keys()) + 1
+            frames = []
+            for t_idx in range(n_timesteps):
+                frame_data = []
+                for trace_idx, (trace, trace_t_idx, _, _) in enumerate(all_traces):
+                    # Make trace visible if it matches current timestep
+                    visible = (trace_t_idx == t_idx)
+                    frame_data.append(go.Scatter(visible=visible))
             
-            t_val = timesteps_ref[t_idx] if t_idx < len(timesteps_ref) else 0
-            frames.append(go.Frame(
-                data=frame_data,
-                name=str(t_idx),
-                layout=go.Layout(
-                    title_text=f"{var.upper()} Error Evolution - All Experiments<br>VAR{t_idx} (t={t_val:.3e})"
-                )
-            ))
-        
-        fig.frames = frames
-        
-        # Update layout
-        fig.update_layout(
-            title=dict(
-                text=f"{var.upper()} Error Evolution - All Experiments<br><sub>Best performer: {best_run_name} (highlighted)</sub>",
-                x=0.5,
-                xanchor='center'
-            ),
-            xaxis=dict(
-                title='Position (x) [kpc]',
-                gridcolor='lightgray'
-            ),
-            yaxis=dict(
-                title='Relative Error',
-                gridcolor='lightgray',
-                type='log'
-            ),
-            height=600,
-            width=1400,
-            hovermode='closest',
-            plot_bgcolor='rgba(240, 240, 240, 0.5)',
-            updatemenus=[
-                dict(
-                    type='buttons',
-                    showactive=False,
-                    buttons=[
+                t_val = timesteps_ref[t_idx] if t_idx < len(timesteps_ref) else 0
+                frames.append(go.Frame(
+                    data=frame_data,
+                    name=str(t_idx),
+                    layout=go.Layout(
+                        title_text=f"{var.upper()} Error Evolution - All Experiments<br>VAR{t_idx} (t={t_val:.3e})"
+                    )
+                ))
+        
+            fig.frames = frames
+        
+            # Update layout
+            fig.update_layout(
+                title=dict(
+                    text=f"{var.upper()} Error Evolution - All Experiments<br><sub>Best performer: {best_run_name} (highlighted)</sub>",
+                    x=0.5,
+                    xanchor='center'
+                ),
+                xaxis=dict(
+                    title='Position (x) [kpc]',
+                    gridcolor='lightgray'
+                ),
+                yaxis=dict(
+                    title='Relative Error',
+                    gridcolor='lightgray',
+                    type='log'
+                ),
+                height=600,
+                width=1400,
+                hovermode='closest',
+                plot_bgcolor='rgba(240, 240, 240, 0.5)',
+                updatemenus=[
+                    dict(
+                        type='buttons',
+                        showactive=False,
+                        buttons=[
+                            dict(
+                                label='▶ Play',
+                                method='animate',
+                                args=[None, dict(
+                                    frame=dict(duration=500, redraw=True),
+                                    fromcurrent=True,
+                                    mode='immediate',
+                                    transition=dict(duration=300)
+                                )]
+                            ),
+                            dict(
+                                label='⏸ Pause',
+                                method='animate',
+                                args=[[None], dict(
+                                    frame=dict(duration=0, redraw=False),
+                                    mode='immediate',
+                                    transition=dict(duration=0)
+                                )]
+                            )
+                        ],
+                        x=0.1,
+                        y=1.15,
+                        xanchor='left',
+                        yanchor='top'
+                    )
+                ],
+                sliders=[dict(
+                    active=0,
+                    yanchor='top',
+                    y=-0.15,
+                    xanchor='left',
+                    currentvalue=dict(
+                        prefix='VAR Snapshot: ',
+                        visible=True,
+                        xanchor='center'
+                    ),
+                    pad=dict(b=10, t=50),
+                    len=0.9,
+                    x=0.05,
+                    steps=[
                         dict(
-                            label='▶ Play',
-                            method='animate',
-                            args=[None, dict(
+                            args=[[f.name], dict(
                                 frame=dict(duration=500, redraw=True),
-                                fromcurrent=True,
                                 mode='immediate',
                                 transition=dict(duration=300)
-                            )]
-                        ),
-                        dict(
-                            label='⏸ Pause',
-                            method='animate',
-                            args=[[None], dict(
-                                frame=dict(duration=0, redraw=False),
-                                mode='immediate',
-                                transition=dict(duration=0)
-                            )]
+                            )],
+                            label=f"VAR{i}",
+                            method='animate'
                         )
-                    ],
-                    x=0.1,
-                    y=1.15,
-                    xanchor='left',
-                    yanchor='top'
-                )
-            ],
-            sliders=[dict(
-                active=0,
-                yanchor='top',
-                y=-0.15,
-                xanchor='left',
-                currentvalue=dict(
-                    prefix='VAR Snapshot: ',
-                    visible=True,
-                    xanchor='center'
-                ),
-                pad=dict(b=10, t=50),
-                len=0.9,
-                x=0.05,
-                steps=[
-                    dict(
-                        args=[[f.name], dict(
-                            frame=dict(duration=500, redraw=True),
-                            mode='immediate',
-                            transition=dict(duration=300)
-                        )],
-                        label=f"VAR{i}",
-                        method='animate'
-                    )
-                    for i in range(n_timesteps)
-                ]
-            )]
-        )
+                        for i in range(n_timesteps)
+                    ]
+                )]
+            )
         
-        # Save with timestamp naming
-        output_file = element_dir / f"{timestamp}.html"
-        fig.write_html(str(output_file))
-        logger.info(f"     └─ ✓ Saved combined graph: {output_file.name}")
-    
-    # ============================================================
-    # PHASE 2.6: Create 3D error map with 3-tier dropdowns
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("PHASE 2.6: Creating 3D error map with 3-tier dropdowns")
-    logger.info("=" * 80)
-    
-    from src.visualization.plots_plotly import show_3d_error_map
-    
-    # Create output directory for 3D maps
-    map_3d_dir = analysis_dir / "error" / "3d_maps"
-    
-    try:
-        show_3d_error_map(
-            experiment_name=experiment_name,
-            analysis_dir=analysis_dir,
-            output_dir=map_3d_dir,
-            analyze_variables=analyze_variables
-        )
-    except Exception as e:
-        logger.error(f"Failed to create 3D error map: {e}")
-        import traceback
-        traceback.print_exc()
+            # Save with timestamp naming
+            output_file = element_dir / f"{timestamp}.html"
+            fig.write_html(str(output_file))
+            logger.info(f"     └─ ✓ Saved combined graph: {output_file.name}")
+            # Free this variable's traces before the next variable's are built
+            del fig, all_traces, traces_by_timestep, frames
+    
+    if '3d_map' in selected_phases:
+        # ============================================================
+        # PHASE 2.6: Create 3D error map with 3-tier dropdowns
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("PHASE 2.6: Creating 3D error map with 3-tier dropdowns")
+        logger.info("=" * 80)
+    
+        from src.visualization.plots_plotly import show_3d_error_map
+    
+        # Create output directory for 3D maps
+        map_3d_dir = analysis_dir / "error" / "3d_maps"
+    
+        try:
+            show_3d_error_map(
+                experiment_name=experiment_name,
+                analysis_dir=analysis_dir,
+                output_dir=map_3d_dir,
+                analyze_variables=analyze_variables
+            )
+        except Exception as e:
+            logger.error(f"Failed to create 3D error map: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    # The remaining phases only use the error norms of the runs
+    if max_memory is not None:
+        logger.info(f"Run results: {loaded_data_cache.stats()}")
+    
+    if 'norms' not in selected_phases:
+        # Plots, reports and best performers all need the error norms
+        logger.success(f"✓ Finished phases {', '.join(selected_phases)} for {len(loaded_data_cache)} runs")
+        return
     
     # ============================================================
     # PHASE 3: Calculate L1/L2 error norms (reusing loaded data)
@@ -861,27 +1891,25 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
     error_norms_dir = organizer.error_norms_dir
     plots_dir = error_norms_dir / "plots"
     
-    # Clear old error norm results before creating new ones
+    # Clear the old error norm results that the selected phases recreate
     logger.info("Clearing old error norm directories...")
-    clear_directory(error_norms_dir)
-    clear_directory(plots_dir)
+    if {'plots', 'reports'} <= set(selected_phases):
+        clear_directory(error_norms_dir)
+    if 'plots' in selected_phases:
+        clear_directory(plots_dir)
     
     error_norms_cache = {}
     
-    logger.info(f"Calculating error norms for {len(loaded_data_cache)} runs...")
+    logger.info(f"Collecting error norms ({', '.join([m.upper() for m in metrics])}) of {len(loaded_data_cache)} runs...")
     
-    for run_name, cached in loaded_data_cache.items():
-        all_sim_data = cached['sim_data']
-        all_analytical_data = cached['analytical_data']
-        
-        logger.info(f"  ├─ {run_name}: calculating {', '.join([m.upper() for m in metrics])}...")
-        error_norms = calculate_error_norms(all_sim_data, all_analytical_data, metrics=metrics)
-        
-        if error_norms:
-            error_norms_cache[run_name] = {
-                'branch': cached['branch'],
-                'error_norms': error_norms,
-                'n_timesteps': len(all_sim_data)
+    # The norms were computed with the other errors of each run in PHASE 1
+    for run_name in loaded_data_cache:
+        cached = loaded_data_cache.light(run_name)
+        if cached['error_norms']:
+            error_norms_cache[run_name] = {key: cached[key] for key in RUN_RECORD_KEYS}
+            error_norms_cache[run_name]['error_norms'] = {
+                var: {metric: var_norms[metric] for metric in metrics if metric in var_norms}
+                for var, var_norms in cached['error_norms'].items()
             }
     
     # Calculate combined scores using ONLY DENSITY (rho)
@@ -921,80 +1949,99 @@ def analyze_suite_videos_only(experiment_name: str, error_method: str = 'absolut
             best_run = min(branch_scores.items(), key=lambda x: x[1]['combined'])
             branch_best[branch_name] = best_run
     
-    # ============================================================
-    # PHASE 4: Create error norm visualizations
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("PHASE 4: Creating error norm visualizations")
-    logger.info("=" * 80)
-    
-    logger.info("  ├─ Combined scores comparison...")
-    create_combined_scores_plot(combined_scores, plots_dir, experiment_name)
-    
-    logger.info("  ├─ Per-metric comparisons...")
-    create_per_metric_plots(error_norms_cache, metrics, plots_dir, experiment_name)
-    
-    logger.info("  ├─ Top 5 detailed view...")
-    create_best_performers_plot(sorted_runs[:5], error_norms_cache, metrics, plots_dir, experiment_name)
-    
-    logger.info("  ├─ Branch comparison...")
-    create_branch_comparison_plot(branch_best, runs_per_branch, combined_scores, plots_dir, experiment_name)
-    
-    logger.info("  └─ Error evolution plots...")
-    create_error_evolution_plots(sorted_runs[:3], error_norms_cache, metrics, plots_dir, experiment_name)
-    
-    # ============================================================
-    # PHASE 5: Save reports
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("PHASE 5: Generating reports")
-    logger.info("=" * 80)
-    
-    save_error_norms_summary(sorted_runs, branch_best, error_norms_cache, 
-                            combined_scores, metrics, error_norms_dir, experiment_name)
-    
-    # Generate complete error ranking report with all runs
-    logger.info("\n  ├─ Generating complete error ranking report...")
-    generate_error_ranking_report(experiment_name, combined_scores, metrics, error_norms_dir)
-    
-    # ============================================================
-    # PHASE 6: Populate best performers folders
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("PHASE 6: Populating best performers folders")
-    logger.info("=" * 80)
-    
-    organizer.populate_best_performers(
-        error_norms_cache, combined_scores, top_n=3, metrics=metrics
-    )
-    
-    # ============================================================
-    # FINAL RICH REPORT
-    # ============================================================
-    logger.info("\n" + "=" * 80)
-    logger.info("FINAL SUMMARY")
-    logger.info("=" * 80)
+    if 'plots' in selected_phases:
+        # ============================================================
+        # PHASE 4: Create error norm visualizations
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("PHASE 4: Creating error norm visualizations")
+        logger.info("=" * 80)
+    
+        logger.info("  ├─ Combined scores comparison...")
+        create_combined_scores_plot(combined_scores, plots_dir, experiment_name)
+    
+        logger.info("  ├─ Per-metric comparisons...")
+        create_per_metric_plots(error_norms_cache, metrics, plots_dir, experiment_name)
+    
+        logger.info("  ├─ Top 5 detailed view...")
+        create_best_performers_plot(sorted_runs[:5], error_norms_cache, metrics, plots_dir, experiment_name)
+    
+        logger.info("  ├─ Branch comparison...")
+        create_branch_comparison_plot(branch_best, runs_per_branch, combined_scores, plots_dir, experiment_name)
+    
+        logger.info("  └─ Error evolution plots...")
+        create_error_evolution_plots(sorted_runs[:3], error_norms_cache, metrics, plots_dir, experiment_name)
+    
+    if 'reports' in selected_phases:
+        # ============================================================
+        # PHASE 5: Save reports
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("PHASE 5: Generating reports")
+        logger.info("=" * 80)
+    
+        save_error_norms_summary(sorted_runs, branch_best, error_norms_cache, 
+                                combined_scores, metrics, error_norms_dir, experiment_name,
+                                snapshot_selection=selection, roi=roi)
+    
+        # Generate complete error ranking report with all runs
+        logger.info("\n  ├─ Generating complete error ranking report...")
+        generate_error_ranking_report(experiment_name, combined_scores, metrics, error_norms_dir)
+    
+    if 'best' in selected_phases:
+        # ============================================================
+        # PHASE 6: Populate best performers folders
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("PHASE 6: Populating best performers folders")
+        logger.info("=" * 80)
+    
+        organizer.populate_best_performers(
+            error_norms_cache, combined_scores, top_n=3, metrics=metrics
+        )
     
-    generate_final_rich_report(
-        experiment_name, organizer.error_evolution_dir, organizer.error_norms_dir, 
-        len(loaded_data_cache), sorted_runs[:10], branch_best, 
-        combined_scores, metrics
-    )
+    if 'reports' in selected_phases:
+        # ============================================================
+        # FINAL RICH REPORT
+        # ============================================================
+        logger.info("\n" + "=" * 80)
+        logger.info("FINAL SUMMARY")
+        logger.info("=" * 80)
+    
+        generate_final_rich_report(
+            experiment_name, organizer.error_evolution_dir, organizer.error_norms_dir, 
+            len(loaded_data_cache), sorted_runs[:10], branch_best, 
+            combined_scores, metrics
+        )
 
 
-def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = None):
+def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = None, jobs: int = 1,
+                                   fast_reader: bool = False, snapshot_selection: dict | None = None,
+                                   force: bool = False):
     """
     Comprehensive analysis using L1, L2, and other error norms with combined scoring.
     
-    This creates a NEW subfolder 'error_norms' with:
+    This writes to 'error/norms' (as PHASE 3 of ``analyze_suite_videos_only``):
     - L1/L2 error calculations for all runs
     - Combined scoring from multiple metrics
     - Comparison visualizations
     - Best parameter identification
     
+    The norms of each run are taken from the suite's run store
+    (``src.analysis.run_store``) when an earlier ``--analyze`` or ``--error-norms``
+    computed them under the same settings from unchanged VAR files; only the other
+    runs are loaded, and their norms are stored for the next analysis. The reuse
+    goes one way only: ``--analyze`` needs the error fields of each run, which these
+    records do not hold, so an ``--analyze`` after ``--error-norms`` recomputes every run.
+    
     Args:
         experiment_name: Name of the experiment suite
         metrics: List of error metrics to calculate (default: ['l1', 'l2', 'linf'])
+        jobs: Number of worker processes used to load the VAR files of each run
+        fast_reader: Read VAR files with the native memory-mapped reader
+        snapshot_selection: Snapshot selection given on the command line (``var_stride``,
+            ``t_min``, ``t_max``, ``max_snapshots``); overrides the ``error_analysis`` config.
+        force: Recompute the norms of every run instead of reading stored ones.
     """
     if metrics is None:
         metrics = ['l1', 'l2', 'linf']
@@ -1010,6 +2057,12 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     with open(plan_file, 'r') as f: 
         plan = yaml.safe_load(f)
     
+    # Only the configured variables are read from the VAR files and analysed
+    error_config = load_error_analysis_config(experiment_name, plan)
+    analyze_variables = list(_select_variables(error_config.get('analyze_variables', ANALYSIS_VARIABLES)))
+    selection = resolve_snapshot_selection(error_config, snapshot_selection)
+    roi = resolve_roi(error_config)
+    
     hpc_run_base_dir = Path(plan['hpc']['run_base_dir'])
     local_exp_dir = DIRS.runs / experiment_name
     manifest_file = local_exp_dir / FILES.manifest
@@ -1022,8 +2075,8 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
             logger.error("Cannot proceed with analysis: manifest file could not be created")
             sys.exit(1)
     
-    # Create NEW subfolder for error norm results
-    error_norms_dir = analysis_dir / "error_norms"
+    # Same error norm folder as --analyze
+    error_norms_dir = AnalysisOrganizer(experiment_name, analysis_dir).error_norms_dir
     plots_dir = error_norms_dir / "plots"
     
     # Clear old error norm results before creating new ones
@@ -1037,6 +2090,9 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     total_runs = len(run_names)
     logger.info(f"Total experiments to process: {total_runs}")
     logger.info(f"Error metrics to calculate: {', '.join(metrics)}")
+    logger.info(f"Variables to analyze: {', '.join(analyze_variables)}")
+    logger.info(f"Snapshot selection: {selection or 'all VAR files'}")
+    logger.info(f"Error norm region: {roi or 'whole domain'}")
     
     # Extract branch information
     branches = plan.get('branches', [])
@@ -1044,6 +2100,7 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     
     # Organize runs by branch
     runs_per_branch = {branch: [] for branch in branch_names}
+    runs_per_branch['default'] = []  # Unmatched runs, as in analyze_suite_videos_only
     for run_name in run_names:
         for branch_name in branch_names:
             if branch_name in run_name:
@@ -1061,6 +2118,10 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     
     error_norms_cache = {}
     runs_processed = 0
+    # Materialised runs (jobs > 1) share analytical solutions across the suite
+    analytical_cache = AnalyticalCache(analytical_cache_dir(analysis_dir))
+    run_store = RunResultStore(run_store_dir(analysis_dir))
+    store_key = store_settings(metrics, analyze_variables, selection, roi)
     
     for branch_name, branch_runs in runs_per_branch.items():
         if not branch_runs:
@@ -1078,34 +2139,73 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
                        f"Branch: [{branch_idx}/{branch_total}] ({branch_pct:.1f}%) | "
                        f"Run: {run_name}")
             
-            # Load data
-            all_sim_data = load_all_var_files(hpc_run_base_dir / run_name)
-            if not all_sim_data:
-                logger.warning(f"     └─ ✗ Failed to load VAR files")
-                continue
-            
-            # Generate analytical solutions
-            all_analytical_data = []
-            for sim_data in all_sim_data:
-                analytical_data = get_analytical_solution(sim_data['params'], sim_data['x'], sim_data['t'])
-                if analytical_data:
-                    all_analytical_data.append(analytical_data)
+            run_path = hpc_run_base_dir / run_name
+            store_file = snapshot_store_path(analysis_dir, run_name)
+            var_files = []
+            grid = {}
+            fronts = None
             
-            if len(all_analytical_data) != len(all_sim_data):
-                logger.warning(f"     └─ ✗ Analytical solution mismatch")
+            fingerprint = run_fingerprint(_run_input_files(run_path))
+            record = None if force else run_store.get(run_name, store_key, fingerprint)
+            if record is not None:
+                error_norms_cache[run_name] = {**record, 'branch': branch_name}
+                logger.info(f"     └─ ✓ Read stored error norms of {record['n_timesteps']} timesteps")
                 continue
             
-            # Calculate error norms
             logger.info(f"     ├─ Calculating error norms ({', '.join(metrics)})...")
-            error_norms = calculate_error_norms(all_sim_data, all_analytical_data, metrics=metrics)
+            # Only a missing analytical solution drops a run here; other failures propagate
+            if jobs > 1:
+                # Parallel loading materialises the run; solve all its times at once and
+                # evaluate each metric over all timesteps in one batched call
+                all_sim_data, all_analytical_data = load_run_with_analytical(
+                    run_path, jobs=jobs, store_file=store_file, fast_reader=fast_reader,
+                    variables=analyze_variables, selection=selection,
+                    analytical_cache=analytical_cache
+                )
+                if all_sim_data and all_analytical_data is None:
+                    logger.warning(f"     └─ ✗ Analytical solution mismatch")
+                    continue
+                if all_sim_data:
+                    error_norms = calculate_error_norms(all_sim_data, all_analytical_data,
+                                                        variables=analyze_variables, metrics=metrics,
+                                                        roi=roi)
+                    var_files = [sim_data['var_file'] for sim_data in all_sim_data]
+                    grid = _grid_spacing(all_sim_data[0]['x'])
+                    fronts = track_fronts(all_sim_data, all_analytical_data)
+            else:
+                # Stream one (sim, analytical) pair at a time to keep memory flat
+                accumulator = ErrorNormAccumulator(variables=analyze_variables, metrics=metrics, roi=roi)
+                tracker = FrontTracker()
+                try:
+                    for sim_data, analytical_data in iter_snapshot_pairs(run_path, store_file=store_file,
+                                                                         fast_reader=fast_reader,
+                                                                         variables=analyze_variables,
+                                                                         selection=selection):
+                        accumulator.update(sim_data, analytical_data)
+                        tracker.update(sim_data, analytical_data)
+                        var_files.append(sim_data['var_file'])
+                        grid = grid or _grid_spacing(sim_data['x'])
+                except AnalyticalSolutionError as e:
+                    logger.warning(f"     └─ ✗ Analytical solution mismatch: {e}")
+                    continue
+                error_norms = accumulator.result()
+                fronts = tracker.result()
+            
+            if not var_files:
+                logger.warning(f"     └─ ✗ Failed to load VAR files")
+                continue
             
             if error_norms:
                 error_norms_cache[run_name] = {
                     'branch': branch_name,
                     'error_norms': error_norms,
-                    'n_timesteps': len(all_sim_data)
+                    'n_timesteps': len(var_files),
+                    'var_files': var_files,
+                    'fronts': fronts,
+                    **grid
                 }
-                logger.info(f"     └─ ✓ Calculated {len(metrics)} metrics for {len(all_sim_data)} timesteps")
+                run_store.put(run_name, store_key, error_norms_cache[run_name], fingerprint)
+                logger.info(f"     └─ ✓ Calculated {len(metrics)} metrics for {len(var_files)} timesteps")
             else:
                 logger.warning(f"     └─ ✗ Failed to calculate error norms")
     
@@ -1213,7 +2313,8 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     
     save_error_norms_summary(
         sorted_runs, branch_best, error_norms_cache, 
-        combined_scores, metrics, error_norms_dir, experiment_name
+        combined_scores, metrics, error_norms_dir, experiment_name,
+        snapshot_selection=selection, roi=roi
     )
     
     # ============================================================
@@ -1223,6 +2324,7 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
     logger.success(f"✓ L1/L2 ERROR NORM ANALYSIS COMPLETED")
     logger.success(f"✓ Results saved to: {error_norms_dir}")
     logger.info(f"📊 Runs analyzed: {len(error_norms_cache)}")
+    logger.info(f"📊 Runs read from the run store: {run_store.hits} (computed: {run_store.misses})")
     logger.info(f"📊 Metrics calculated: {len(metrics)}")
     logger.info(f"📊 Plots created: {plots_dir}")
     logger.info(f"🏆 Best overall: {sorted_runs[0][0]}")
@@ -1230,8 +2332,18 @@ def analyze_suite_with_error_norms(experiment_name: str, metrics: List[str] = No
 
 
 def save_error_norms_summary(sorted_runs, branch_best, error_norms_cache, 
-                             combined_scores, metrics, output_dir, experiment_name):
-    """Save comprehensive summary report."""
+                             combined_scores, metrics, output_dir, experiment_name,
+                             snapshot_selection: dict | None = None, roi: dict | None = None):
+    """Save comprehensive summary report.
+    
+    The snapshot selection and the VAR files analysed for each run are recorded
+    under 'snapshot_selection' and in 'detailed_scores'; 'roi' holds the
+    region-of-interest settings of the norms (None for the whole domain). 'detailed_scores' also
+    holds the time-averaged norm of every variable and metric and the grid
+    spacing of each run, which ``analyze_convergence`` reads back, and the
+    tracked wave fronts ('fronts', see ``src.analysis.fronts``) when the run
+    had density, velocity and pressure.
+    """
     import json
     
     # Create summary dict
@@ -1239,6 +2351,8 @@ def save_error_norms_summary(sorted_runs, branch_best, error_norms_cache,
         'experiment': experiment_name,
         'metrics_used': metrics,
         'total_runs_analyzed': len(error_norms_cache),
+        'snapshot_selection': dict(snapshot_selection or {}),
+        'roi': {'half_width': roi['half_width'], 'waves': list(roi['waves'])} if roi else None,
         'top_5_overall': [],
         'best_per_branch': {},
         'detailed_scores': {}
@@ -1267,7 +2381,16 @@ def save_error_norms_summary(sorted_runs, branch_best, error_norms_cache,
         summary['detailed_scores'][run_name] = {
             'combined_score': float(scores['combined']),
             'branch': scores['branch'],
-            'per_metric_scores': {k: float(v) for k, v in scores['per_metric'].items()}
+            'per_metric_scores': {k: float(v) for k, v in scores['per_metric'].items()},
+            'n_snapshots': error_norms_cache[run_name].get('n_timesteps'),
+            'var_files': error_norms_cache[run_name].get('var_files'),
+            'variable_norms': {
+                var: {metric: float(entry['mean']) for metric, entry in var_norms.items()}
+                for var, var_norms in error_norms_cache[run_name]['error_norms'].items()
+            },
+            'dx': error_norms_cache[run_name].get('dx'),
+            'nx': error_norms_cache[run_name].get('nx'),
+            'fronts': error_norms_cache[run_name].get('fronts')
         }
     
     # Save JSON
@@ -1282,6 +2405,11 @@ def save_error_norms_summary(sorted_runs, branch_best, error_norms_cache,
         f.write(f"**Experiment**: {experiment_name}\n\n")
         f.write(f"**Metrics Used**: {', '.join([m.upper() for m in metrics])}\n\n")
         f.write(f"**Total Runs Analyzed**: {len(error_norms_cache)}\n\n")
+        if snapshot_selection:
+            selection_text = ', '.join(f"{k}={v}" for k, v in snapshot_selection.items())
+            f.write(f"**Snapshot Selection**: {selection_text}\n\n")
+        if roi:
+            f.write(f"**Error Norm Region**: {roi['half_width']} cells around {', '.join(roi['waves'])}\n\n")
         
         f.write("## 🥇 Top 5 Overall Performers\n\n")
         for item in summary['top_5_overall']:
@@ -1302,11 +2430,83 @@ def save_error_norms_summary(sorted_runs, branch_best, error_norms_cache,
             for metric, score in data['per_metric_scores'].items():
                 f.write(f"  - {metric.upper()}: {score:.6e}\n")
             f.write("\n")
+        
+        tracked = [item['run_name'] for item in summary['top_5_overall']
+                   if summary['detailed_scores'].get(item['run_name'], {}).get('fronts')]
+        if tracked:
+            f.write("## 🌊 Wave Fronts (Top 5, mean offset from analytical in cells)\n\n")
+            f.write("| Run | Rarefaction head | Rarefaction tail | Contact | Shock | Shock width |\n")
+            f.write("|---|---|---|---|---|---|\n")
+            for run_name in tracked:
+                fronts = summary['detailed_scores'][run_name]['fronts']['summary']
+                cells = [fronts[name]['mean_offset_cells'] for name in
+                         ('rarefaction_head', 'rarefaction_tail', 'contact', 'shock', 'shock_width')]
+                f.write(f"| {run_name} | " + " | ".join(f"{c:+.2f}" if c is not None else "–" for c in cells) + " |\n")
+            f.write("\n")
     
     logger.info(f"       ├─ Saved JSON summary to {json_file.name}")
     logger.info(f"       └─ Saved Markdown report to {md_file.name}")
 
 
+def analyze_convergence(experiment_names: List[str], metrics: List[str] = None,
+                        variables: List[str] = None) -> dict | None:
+    """
+    Convergence study over one or more experiments from their cached error norms.
+    
+    Runs with identical physics parameters (run names that differ only in the
+    ``res<nxgrid>`` token) form a resolution ladder, within one experiment or
+    across several (e.g. ``shocktube_phase1`` and ``shocktube_phase1_highres``).
+    The orders of all ladders, variables and metrics are fitted at once from the
+    error-norm summaries of ``--error-norms``/``--analyze``; no VAR file is read.
+    A table and log-log plots are written to ``analysis/convergence/<name>/``.
+    
+    Args:
+        experiment_names: Experiments whose runs form the resolution ladders
+        metrics: Metrics to fit (default: all recorded in the summaries)
+        variables: Variables to fit (default: all recorded in the summaries)
+    
+    Returns:
+        The study from ``convergence_study``, or None if no ladder was found
+    """
+    name = '_vs_'.join(experiment_names)
+    setup_file_logging(experiment_names[0], 'analysis')
+    
+    logger.info("=" * 80)
+    logger.info(f"STARTING CONVERGENCE STUDY: {', '.join(experiment_names)}")
+    logger.info("=" * 80)
+    
+    records = []
+    for experiment_name in experiment_names:
+        summary_file = find_error_norms_summary(DIRS.root / "analysis" / experiment_name, experiment_name)
+        if summary_file is None:
+            logger.error(f"No error norms cached for '{experiment_name}'. "
+                         f"Run 'python main.py {experiment_name} --error-norms' first.")
+            continue
+        experiment_records = load_norm_records(summary_file, experiment_name)
+        logger.info(f"  ├─ {experiment_name}: {len(experiment_records)} runs from {summary_file.name}")
+        records.extend(experiment_records)
+    
+    study = convergence_study(records, variables=variables, metrics=metrics)
+    if not study['keys']:
+        logger.error("No runs with identical physics parameters at two or more resolutions")
+        return None
+    
+    for k, key in enumerate(study['keys']):
+        n_res = len(study['ladders'][key]['dx'])
+        orders = ', '.join(
+            f"{var}/{metric}={study['rate'][k, v, m]:.2f}"
+            for v, var in enumerate(study['variables']) for m, metric in enumerate(study['metrics'])
+        )
+        logger.info(f"  {key} ({n_res} resolutions): {orders}")
+    
+    output_dir = DIRS.root / "analysis" / "convergence" / name
+    save_convergence_table(study, output_dir, name)
+    create_convergence_plots(study, output_dir / "plots", name)
+    
+    logger.success(f"✓ Convergence study saved to: {output_dir}")
+    return study
+
+
 def generate_error_ranking_report(experiment_name, combined_scores, metrics, output_dir):
     """
     Generate a comprehensive error ranking report with all runs sorted by error.
@@ -0,0 +1,141 @@
+# src/workflows/phases.py
+"""
+Phase graph of ``analyze_suite_videos_only``.
+
+Each phase declares the data products it reads (``inputs``) and writes
+(``outputs``); a phase depends on the phases producing its inputs. Phases marked
+``per_run`` do their work while a run is loaded in PHASE 1 (some also have a
+cross-run part, e.g. the overlay videos of ``error_videos``); the others run
+once over the reduced results of all runs.
+
+    load ─┬─ errors ─┬─ error_videos
+          │          ├─ plotly
+          │          ├─ 3d_map
+          │          └─ norms ─┬─ plots
+          │                    ├─ reports
+          │                    └─ best
+          └─ var_videos
+
+``resolve_phases`` turns a ``--phases``/``--skip-phases`` selection into the
+phases to run, adding the dependencies of every selected phase. Per-run phases
+are recorded with each run's stored result (``src.analysis.run_store``), so
+``load`` and ``errors`` only run for runs that lack a stored result or one of
+the selected per-run outputs.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from loguru import logger
+
+
+# Phases in execution order (each phase only depends on earlier ones)
+ANALYSIS_PHASES: Dict[str, Dict] = {
+    'load': {
+        'inputs': (),
+        'outputs': ('snapshots',),
+        'per_run': True,
+        'description': "VAR files and analytical solutions of each run",
+    },
+    'errors': {
+        'inputs': ('snapshots',),
+        'outputs': ('run_results',),
+        'per_run': True,
+        'description': "Error fields, norms and fronts of each run (run store, error/cache, mind_the_gap)",
+    },
+    'var_videos': {
+        'inputs': ('snapshots',),
+        'outputs': ('var_videos',),
+        'per_run': True,
+        'description': "VAR evolution GIFs and frames of each run",
+    },
+    'error_videos': {
+        'inputs': ('snapshots', 'run_results'),
+        'outputs': ('error_videos',),
+        'per_run': True,
+        'description': "Error evolution GIFs of each run, branch and top-3 overlays",
+    },
+    'plotly': {
+        'inputs': ('snapshots', 'run_results'),
+        'outputs': ('plotly',),
+        'per_run': True,
+        'description': "Interactive var/error evolution of each run, combined error line graphs",
+    },
+    '3d_map': {
+        'inputs': ('run_results',),
+        'outputs': ('3d_map',),
+        'per_run': False,
+        'description': "3D error map with dropdowns",
+    },
+    'norms': {
+        'inputs': ('run_results',),
+        'outputs': ('norms',),
+        'per_run': False,
+        'description': "Error norms and combined scores",
+    },
+    'plots': {
+        'inputs': ('norms',),
+        'outputs': ('norm_plots',),
+        'per_run': False,
+        'description': "Error norm comparison plots",
+    },
+    'reports': {
+        'inputs': ('norms',),
+        'outputs': ('reports',),
+        'per_run': False,
+        'description': "Summary JSON/Markdown, ranking report and final report",
+    },
+    'best': {
+        'inputs': ('norms',),
+        'outputs': ('best',),
+        'per_run': False,
+        'description': "Best performers folders (copies existing error videos)",
+    },
+}
+
+PHASE_NAMES = tuple(ANALYSIS_PHASES)
+
+# Phases with work done while a run is loaded
+RUN_PHASES = tuple(name for name, phase in ANALYSIS_PHASES.items() if phase['per_run'])
+
+
+def phase_dependencies(name: str) -> tuple:
+    """Phases producing the inputs of ``name``, in execution order."""
+    inputs = set(ANALYSIS_PHASES[name]['inputs'])
+    return tuple(other for other, phase in ANALYSIS_PHASES.items()
+                 if other != name and inputs & set(phase['outputs']))
+
+
+def resolve_phases(phases: Optional[Sequence[str]] = None,
+                   skip_phases: Optional[Sequence[str]] = None) -> List[str]:
+    """
+    Phases to run for a ``--phases``/``--skip-phases`` selection.
+
+    Args:
+        phases: Phases to run (None for all)
+        skip_phases: Phases to leave out of the selection
+
+    Returns:
+        Selected phases plus all their dependencies, in execution order. A
+        skipped phase is still run if a selected phase depends on it.
+
+    Raises:
+        ValueError: If a phase name is unknown or nothing is selected
+    """
+    for name in [*(phases or ()), *(skip_phases or ())]:
+        if name not in ANALYSIS_PHASES:
+            raise ValueError(f"Unknown analysis phase '{name}' (choose from {', '.join(PHASE_NAMES)})")
+
+    selected = set(phases or PHASE_NAMES) - set(skip_phases or ())
+    if not selected:
+        raise ValueError("No analysis phase selected")
+
+    # Walk backwards so that dependencies of added phases are added too
+    for name in reversed(PHASE_NAMES):
+        if name not in selected:
+            continue
+        for dependency in phase_dependencies(name):
+            if dependency not in selected:
+                logger.info(f"Adding phase '{dependency}', needed by '{name}'")
+                selected.add(dependency)
+
+    return [name for name in PHASE_NAMES if name in selected]
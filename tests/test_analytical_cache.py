@@ -0,0 +1,124 @@
+"""Tests of the suite-wide analytical solution cache (src/analysis/analytical_cache.py)."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.analysis.analytical_cache import AnalyticalCache, analytical_cache_key
+from src.analysis.riemann import exact_sod
+from src.analysis.snapshot_store import STORE_FIELDS
+from src.analysis.snapshots import SnapshotSeries
+
+
+PARAMS = SimpleNamespace(cp=1.0, gamma=1.4, rho0=1.0, cs0=1.0, xjump_mid=0.0,
+                         rho_left=1.0, rho_right=0.125, ss_left=0.0, ss_right=0.0)
+X = np.linspace(-0.5, 0.5, 65)
+T = np.array([0.02, 0.05, 0.1])
+
+
+class Solver:
+    """Computes exact Sod solutions, counting the calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, params, x, t):
+        def compute():
+            self.calls += 1
+            solution = exact_sod(x, t, params, magic=['ee'])
+            return SnapshotSeries(x=x, t=t, fields={var: getattr(solution, var) for var in STORE_FIELDS})
+        return compute
+
+
+def get(cache: AnalyticalCache, solver: Solver, params=PARAMS, x=X, t=T):
+    return cache.get_or_compute(params, x, t, solver(params, x, t))
+
+
+@pytest.mark.parametrize('changed', [
+    {'params': SimpleNamespace(**{**vars(PARAMS), 'rho_right': 0.1})},
+    {'params': SimpleNamespace(**{**vars(PARAMS), 'gamma': 5 / 3})},
+    {'params': SimpleNamespace(**{**vars(PARAMS), 'xjump_mid': 0.1})},
+    {'x': np.linspace(-0.5, 0.5, 66)},
+    {'x': X + 1e-12},
+    {'t': T[:2]},
+    {'t': T * 1.01},
+])
+def test_key_changes_with_inputs(changed):
+    inputs = {'params': PARAMS, 'x': X, 't': T, **changed}
+    assert analytical_cache_key(**inputs) != analytical_cache_key(PARAMS, X, T)
+
+    solver = Solver()
+    cache = AnalyticalCache()
+    get(cache, solver)
+    get(cache, solver, **changed)
+    assert solver.calls == 2 and len(cache) == 2
+
+
+def test_key_ignores_unrelated_params():
+    # The dissipation coefficients swept by a suite do not enter the solution
+    swept = SimpleNamespace(**vars(PARAMS), nu=1e-3, chi=5e-4)
+    assert analytical_cache_key(swept, X, T) == analytical_cache_key(PARAMS, X, T)
+
+
+def test_hit_returns_same_solution():
+    solver = Solver()
+    cache = AnalyticalCache()
+    first = get(cache, solver)
+    second = get(cache, solver)
+    assert solver.calls == 1 and (cache.hits, cache.misses) == (1, 1)
+    for var in STORE_FIELDS:
+        assert second.fields[var] is first.fields[var]
+        assert not second.fields[var].flags.writeable
+
+
+def test_fresh_instance_memory_maps_persisted_solution(tmp_path):
+    solver = Solver()
+    computed = get(AnalyticalCache(tmp_path), solver)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    cache = AnalyticalCache(tmp_path)
+    reloaded = get(cache, solver)
+    assert solver.calls == 1 and (cache.hits, cache.misses) == (1, 0)
+    for var in STORE_FIELDS:
+        assert isinstance(reloaded.fields[var], np.memmap)
+        np.testing.assert_array_equal(reloaded.fields[var], computed.fields[var])
+
+    # Other times are not served from the persisted solution
+    get(cache, solver, t=T[:2])
+    assert solver.calls == 2
+
+
+def test_lru_bound(tmp_path):
+    solver = Solver()
+    cache = AnalyticalCache(tmp_path, max_solutions=2)
+    times = [T * scale for scale in (1.0, 1.1, 1.2)]
+    for t in times:
+        get(cache, solver, t=t)
+    assert len(cache) == 2 and solver.calls == 3
+
+    # The evicted oldest solution is memory-mapped again, not recomputed
+    get(cache, solver, t=times[0])
+    assert len(cache) == 2 and solver.calls == 3 and cache.hits == 1
+
+    # Without a cache directory an evicted solution is recomputed
+    solver = Solver()
+    cache = AnalyticalCache(max_solutions=1)
+    for t in (times[0], times[1], times[0]):
+        get(cache, solver, t=t)
+    assert len(cache) == 1 and solver.calls == 3
+
+
+def test_failed_solution_is_not_cached(tmp_path):
+    cache = AnalyticalCache(tmp_path)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_compute(PARAMS, X, T, failing) is None
+    assert cache.get_or_compute(PARAMS, X, T, failing) is None
+    assert len(calls) == 2 and len(cache) == 0
+    assert list(tmp_path.iterdir()) == []
+    assert (cache.hits, cache.misses) == (0, 0)
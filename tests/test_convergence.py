@@ -0,0 +1,174 @@
+"""Tests of the convergence study over cached error norms (src/analysis/convergence.py)."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from src.analysis.convergence import (build_ladders, convergence_study, convergence_table, find_error_norms_summary,
+                                      load_norm_records, physics_key, save_convergence_table)
+from src.analysis.metrics import calculate_convergence_rate, calculate_convergence_rates
+
+
+def make_record(run_name: str, nx: int, orders: dict, experiment: str = 'exp', dx=True, scale: float = 1.0) -> dict:
+    """Record of a run whose norm of each metric falls as dx**order."""
+    spacing = 1.0 / nx
+    return {
+        'experiment': experiment,
+        'run_name': run_name,
+        'branch': run_name.split('_')[0],
+        'key': physics_key(run_name),
+        'dx': spacing if dx else None,
+        'nx': nx,
+        'norms': {var: {metric: scale * spacing ** order for metric, order in orders.items()}
+                  for var in ('rho', 'ux')},
+    }
+
+
+ORDERS = {'l2': 2.0, 'l1': 1.0}
+
+
+def test_rates_recover_orders_with_nan_padding():
+    dx = np.array([[0.04, 0.02, 0.01, 0.005], [0.04, 0.02, 0.01, np.nan], [0.1, 0.05, np.nan, np.nan]])
+    errors = np.stack([3.0 * dx[0] ** 2, 0.5 * dx[1], 2.0 * dx[2] ** 2])
+    fits = calculate_convergence_rates(errors, dx)
+    np.testing.assert_allclose(fits['rate'], [2.0, 1.0, 2.0], rtol=1e-12)
+    np.testing.assert_allclose(fits['intercept'], np.log([3.0, 0.5, 2.0]), rtol=1e-12)
+    np.testing.assert_allclose(fits['r_squared'], 1.0, rtol=1e-12)
+    np.testing.assert_array_equal(fits['n_points'], [4, 3, 2])
+    for k in range(3):
+        finite = np.isfinite(dx[k])
+        assert fits['rate'][k] == pytest.approx(calculate_convergence_rate(errors[k][finite], dx[k][finite]))
+
+
+def test_rates_leave_out_unusable_points():
+    dx = [0.04, 0.02, 0.01, 0.005]
+    errors = np.array([
+        [1.6e-3, 4e-4, 0.0, 2.5e-5],        # a zero error is left out
+        [1.6e-3, -1.0, 1e-4, 2.5e-5],       # so is a negative one
+        [1.6e-3, np.nan, np.nan, np.nan],   # a single point is not fitted
+        [np.nan] * 4,
+    ])
+    fits = calculate_convergence_rates(errors, dx)
+    np.testing.assert_allclose(fits['rate'][:2], 2.0, rtol=1e-10)
+    np.testing.assert_array_equal(fits['n_points'], [3, 3, 1, 0])
+    assert np.isnan(fits['rate'][2:]).all() and np.isnan(fits['intercept'][2:]).all()
+    # Two points at the same dx do not define a slope
+    assert np.isnan(calculate_convergence_rates([1e-3, 2e-3], [0.01, 0.01])['rate'])
+
+
+def test_build_ladders_orders_coarse_to_fine():
+    records = [make_record(f'{branch}_res{nx}_nu0.1', nx, ORDERS) for branch in ('a', 'b') for nx in (400, 100, 200)]
+    records.append(make_record('c_res100_nu0.1', 100, ORDERS))
+    ladders = build_ladders(records)
+    # The single-resolution physics is dropped
+    assert sorted(ladders) == ['a_res*_nu0.1', 'b_res*_nu0.1']
+    ladder = ladders['a_res*_nu0.1']
+    assert [record['nx'] for record in ladder['runs']] == [100, 200, 400]
+    assert ladder['dx'] == [0.01, 0.005, 0.0025]
+
+
+def test_ladder_spans_experiments():
+    records = [make_record('a_res100_nu0.1', 100, ORDERS, experiment='phase1'),
+               make_record('a_res200_nu0.1', 200, ORDERS, experiment='phase1'),
+               make_record('a_res800_nu0.1', 800, ORDERS, experiment='highres'),
+               make_record('a_res800_nu0.2', 800, ORDERS, experiment='highres')]
+    ladders = build_ladders(records)
+    assert list(ladders) == ['a_res*_nu0.1']
+    assert [record['experiment'] for record in ladders['a_res*_nu0.1']['runs']] == ['phase1', 'phase1', 'highres']
+
+    study = convergence_study(records)
+    np.testing.assert_allclose(study['rate'], np.broadcast_to([2.0, 1.0], study['rate'].shape), rtol=1e-10)
+    assert convergence_table(study)['runs'][0] == ('phase1/a_res100_nu0.1 | phase1/a_res200_nu0.1 | '
+                                                   'highres/a_res800_nu0.1')
+
+
+def test_later_experiment_overrides_same_dx():
+    records = [make_record('a_res100_nu0.1', 100, ORDERS, experiment='phase1'),
+               make_record('a_res200_nu0.1', 200, ORDERS, experiment='phase1', scale=5.0),
+               make_record('a_res200_nu0.1', 200, ORDERS, experiment='rerun')]
+    ladder = build_ladders(records)['a_res*_nu0.1']
+    assert [(record['experiment'], record['nx']) for record in ladder['runs']] == [('phase1', 100), ('rerun', 200)]
+    # The fit uses the norms of the overriding run
+    assert convergence_study(records)['rate'][0, 0, 0] == pytest.approx(2.0)
+
+
+def test_ladder_without_spacing_falls_back_to_nx():
+    records = [make_record(f'a_res{nx}_nu0.1', nx, ORDERS, dx=False) for nx in (100, 300)]
+    assert build_ladders(records)['a_res*_nu0.1']['dx'] == [0.01, 1.0 / 300]
+    for record in records:
+        record['nx'] = None
+    assert build_ladders(records) == {}
+
+
+def test_study_pads_short_ladders():
+    records = [make_record(f'a_res{nx}_nu0.1', nx, ORDERS) for nx in (100, 200, 400, 800)]
+    records += [make_record(f'b_res{nx}_nu0.1', nx, ORDERS) for nx in (100, 200)]
+    # A norm missing from one run only shortens that fit
+    del records[1]['norms']['ux']['l1']
+    study = convergence_study(records, variables=['rho', 'ux', 'ee'])
+    assert study['keys'] == ['a_res*_nu0.1', 'b_res*_nu0.1']
+    assert study['metrics'] == ['l2', 'l1']
+    assert study['errors'].shape == (2, 3, 2, 4) and study['dx'].shape == (2, 4)
+    assert np.isnan(study['dx'][1, 2:]).all() and np.isnan(study['errors'][1, :, :, 2:]).all()
+
+    np.testing.assert_allclose(study['rate'][:, :2], np.broadcast_to([2.0, 1.0], (2, 2, 2)), rtol=1e-10)
+    assert study['n_points'][0, 1, 1] == 3 and study['n_points'][1, 0, 0] == 2
+    # No run has 'ee'
+    assert np.isnan(study['rate'][:, 2]).all() and (study['n_points'][:, 2] == 0).all()
+
+
+def test_convergence_table(tmp_path):
+    records = [make_record(f'a_res{nx}_nu0.1', nx, ORDERS) for nx in (100, 200, 400)]
+    study = convergence_study(records)
+    table = convergence_table(study)
+    assert len(table) == 1 * 2 * 2
+    assert list(table.columns) == ['physics', 'branch', 'variable', 'metric', 'order', 'r_squared', 'n_points',
+                                   'dx_coarse', 'dx_fine', 'error_coarse', 'error_fine', 'runs']
+    row = table[(table['variable'] == 'ux') & (table['metric'] == 'l2')].iloc[0]
+    assert row['order'] == pytest.approx(2.0) and row['n_points'] == 3 and row['branch'] == 'a'
+    assert (row['dx_coarse'], row['dx_fine']) == (0.01, 0.0025)
+    assert (row['error_coarse'], row['error_fine']) == pytest.approx((1e-4, 0.0025 ** 2))
+
+    paths = save_convergence_table(study, tmp_path / 'out', 'study')
+    assert paths['csv'].read_text().count('\n') == len(table) + 1
+    assert '| a_res*_nu0.1 | 2.00 | 2.00 | 3 |' in paths['markdown'].read_text()
+
+
+def write_summary(path, detailed_scores: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({'experiment': 'exp', 'detailed_scores': detailed_scores}))
+
+
+def test_load_norm_records(tmp_path):
+    summary_file = tmp_path / 'exp_error_norms_summary.json'
+    write_summary(summary_file, {
+        'a_res200_nu0.1': {'branch': 'a', 'per_metric_scores': {'l1': 9.0},
+                           'variable_norms': {'rho': {'l1': 1e-3}, 'ux': {'l1': 2e-3}}, 'dx': 0.005, 'nx': 200},
+        # Summaries from before per-variable norms only hold the density scores
+        'a_res100_nu0.1': {'branch': 'a', 'per_metric_scores': {'l1': 4e-3, 'l2': 5e-3}},
+    })
+    records = {record['run_name']: record for record in load_norm_records(summary_file, 'exp')}
+    assert records['a_res200_nu0.1'] == {'experiment': 'exp', 'run_name': 'a_res200_nu0.1', 'branch': 'a',
+                                         'key': 'a_res*_nu0.1', 'dx': 0.005, 'nx': 200,
+                                         'norms': {'rho': {'l1': 1e-3}, 'ux': {'l1': 2e-3}}}
+    legacy = records['a_res100_nu0.1']
+    assert legacy['norms'] == {'rho': {'l1': 4e-3, 'l2': 5e-3}}
+    assert legacy['dx'] is None and legacy['nx'] == 100
+
+    # The legacy run still joins the ladder, spaced by its resolution token
+    study = convergence_study(list(records.values()), variables=['rho'], metrics=['l1'])
+    assert study['dx'][0].tolist() == [0.01, 0.005]
+    assert study['rate'][0, 0, 0] == pytest.approx(2.0)
+
+
+def test_find_error_norms_summary(tmp_path):
+    assert find_error_norms_summary(tmp_path, 'exp') is None
+    legacy = tmp_path / 'error_norms' / 'exp_error_norms_summary.json'
+    current = tmp_path / 'error' / 'norms' / 'exp_error_norms_summary.json'
+    write_summary(legacy, {})
+    assert find_error_norms_summary(tmp_path, 'exp') == legacy
+    write_summary(current, {})
+    os.utime(legacy, ns=(0, current.stat().st_mtime_ns - 1_000_000_000))
+    assert find_error_norms_summary(tmp_path, 'exp') == current
@@ -0,0 +1,80 @@
+"""Tests of the front detection (src/analysis/fronts.py) on exact Sod profiles."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.analysis.fronts import FRONT_FEATURES, POSITION_FEATURES, WIDTH_FEATURES, detect_fronts, track_fronts
+from src.analysis.riemann import exact_sod, wave_positions
+from src.analysis.snapshots import SnapshotSeries
+
+
+X = np.linspace(-0.5, 0.5, 801)
+DX = X[1] - X[0]
+# The first snapshot is the initial state, without fronts
+T = np.array([0.0, 0.05, 0.1, 0.15])
+
+
+def shock_tube(rho_left: float, rho_right: float) -> SimpleNamespace:
+    return SimpleNamespace(cp=1.0, gamma=1.4, rho0=1.0, cs0=1.0, xjump_mid=0.0,
+                           rho_left=rho_left, rho_right=rho_right, ss_left=0.0, ss_right=0.0)
+
+
+SOD = shock_tube(1.0, 0.125)
+# Same problem with x mirrored: the rarefaction moves right, the shock left
+MIRRORED = shock_tube(0.125, 1.0)
+
+
+def exact_fronts(params) -> dict:
+    exact = exact_sod(X, T, params)
+    return detect_fronts(X, exact.rho, exact.ux, exact.pp)
+
+
+def test_initial_snapshot_has_no_fronts():
+    fronts = exact_fronts(SOD)
+    assert set(fronts) == set(FRONT_FEATURES)
+    for values in fronts.values():
+        assert values.shape == T.shape
+        assert np.isnan(values[0]) and np.isfinite(values[1:]).all()
+
+
+def test_exact_fronts_match_wave_positions():
+    fronts = exact_fronts(SOD)
+    waves = wave_positions(SOD, T)
+    # The fan is linear in the velocity, so the extrapolated head and tail are exact
+    np.testing.assert_allclose(fronts['rarefaction_head'][1:], waves['rarefaction'][0][1:], rtol=0, atol=1e-12)
+    np.testing.assert_allclose(fronts['rarefaction_tail'][1:], waves['rarefaction'][1][1:], rtol=0, atol=1e-12)
+    # Discontinuities fall between two cells and are found within half a cell
+    for name in ('contact', 'shock'):
+        assert np.all(np.abs(fronts[name][1:] - waves[name][0][1:]) <= 0.5 * DX)
+        assert np.all(fronts[f'{name}_width'][1:] < 1.0)
+    np.testing.assert_allclose(fronts['rarefaction_width'][1:],
+                               (waves['rarefaction'][1][1:] - waves['rarefaction'][0][1:]) / DX, rtol=1e-10)
+
+
+def test_mirrored_problem_is_symmetric():
+    fronts, mirrored = exact_fronts(SOD), exact_fronts(MIRRORED)
+    for name in POSITION_FEATURES:
+        np.testing.assert_allclose(mirrored[name][1:], -fronts[name][1:], rtol=0, atol=1e-12)
+    for name in WIDTH_FEATURES:
+        np.testing.assert_allclose(mirrored[name][1:], fronts[name][1:], rtol=1e-10)
+
+
+@pytest.mark.parametrize('params', [SOD, MIRRORED])
+def test_stacked_and_per_snapshot_detection_agree(params):
+    exact = exact_sod(X, T, params)
+    stacked = detect_fronts(X, exact.rho, exact.ux, exact.pp)
+    for i in range(len(T)):
+        single = detect_fronts(X, exact.rho[i], exact.ux[i], exact.pp[i])
+        for name in FRONT_FEATURES:
+            np.testing.assert_array_equal(single[name][()], stacked[name][i])
+
+
+def test_track_fronts_of_exact_run_has_no_offsets():
+    exact = exact_sod(X, T, SOD)
+    series = SnapshotSeries(x=X, t=T, fields={name: getattr(exact, name) for name in ('rho', 'ux', 'pp')})
+    fronts = track_fronts(series, series)
+    assert fronts['timesteps'] == list(T)
+    for name in FRONT_FEATURES:
+        assert fronts['summary'][name]['max_abs_offset_cells'] == 0.0
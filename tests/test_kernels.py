@@ -0,0 +1,113 @@
+"""Bit-for-bit checks of the Numba kernels (src/analysis/kernels.py) against the NumPy path."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from src.analysis import kernels
+from src.analysis.errors import calculate_normalized_spatial_errors
+from src.analysis.metrics import METRIC_REGISTRY
+from src.analysis.snapshots import SnapshotSeries
+from src.analysis.thermodynamics import derive_pressure_energy
+
+
+# Odd lengths on both sides of NumPy's pairwise-summation block (128 terms)
+LENGTHS = (7, 129, 1001, 4097)
+DTYPES = (np.float64, np.float32)
+
+
+@pytest.fixture(autouse=True)
+def small_arrays(monkeypatch):
+    """Let the kernels take arrays of any size, and restore the JIT switch afterwards."""
+    monkeypatch.setattr(kernels, 'JIT_MIN_SIZE', 1)
+    enabled = kernels.jit_enabled()
+    yield
+    kernels.use_jit(enabled)
+
+
+def run_both(func, *args, **kwargs):
+    """Results of ``func`` with the NumPy path and with the kernels."""
+    kernels.use_jit(False)
+    expected = func(*args, **kwargs)
+    kernels.use_jit(True)
+    return expected, func(*args, **kwargs)
+
+
+def error_inputs(n_x: int, dtype, n_t: int = 3, seed: int = 0) -> tuple:
+    """[T, X] simulation and analytical values with zero, tiny and NaN denominators."""
+    rng = np.random.default_rng(seed)
+    ana = rng.uniform(0.1, 2.0, (n_t, n_x))
+    ana[:, ::5] = 0.0
+    ana[:, 1::7] = 1e-12
+    ana[:, 2::11] = -ana[:, 2::11]
+    ana[1, 3] = np.nan
+    sim = ana + rng.normal(0.0, 0.05, (n_t, n_x))
+    sim[:, ::5] = rng.normal(0.0, 0.05, sim[:, ::5].shape)
+    return sim.astype(dtype), ana.astype(dtype)
+
+
+def assert_identical(expected, actual):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            assert_identical(expected[key], actual[key])
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual)
+        for e, a in zip(expected, actual):
+            assert_identical(e, a)
+    elif isinstance(expected, (np.ndarray, np.generic, float)):
+        assert np.shape(expected) == np.shape(actual)
+        assert np.asarray(expected).dtype == np.asarray(actual).dtype
+        assert np.array_equal(expected, actual, equal_nan=True)
+    else:
+        assert expected == actual
+
+
+def test_kernels_are_used_for_float64_only():
+    kernels.use_jit(True)
+    sim, ana = error_inputs(129, np.float64)
+    assert kernels.accelerated(sim, ana)
+    assert not kernels.accelerated(*error_inputs(129, np.float32))
+    assert not kernels.accelerated(sim[:, ::2], ana[:, ::2])
+    kernels.use_jit(False)
+    assert not kernels.accelerated(sim, ana)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('n_x', LENGTHS)
+@pytest.mark.parametrize('metric', sorted(METRIC_REGISTRY.get_metric_names()))
+def test_metrics(metric, n_x, dtype):
+    sim, ana = error_inputs(n_x, dtype)
+    assert_identical(*run_both(METRIC_REGISTRY.calculate, metric, sim, ana))
+    # One snapshot at a time, as the per-snapshot callers do
+    assert_identical(*run_both(METRIC_REGISTRY.calculate, metric, sim[0], ana[0]))
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('n_x', LENGTHS)
+def test_normalized_spatial_errors(n_x, dtype):
+    sim, ana = error_inputs(n_x, dtype)
+    x = np.linspace(0.0, 1.0, n_x)
+    t = [0.0, 0.1, 0.2]
+    sim_series = SnapshotSeries(x=x, t=t, fields={'rho': sim})
+    ana_series = SnapshotSeries(x=x, t=t, fields={'rho': ana})
+    expected, actual = run_both(calculate_normalized_spatial_errors, sim_series, ana_series, ['rho'])
+    assert expected['rho']['error_field'].size == sim.size
+    assert_identical(expected, actual)
+
+
+@pytest.mark.parametrize('dtype', DTYPES)
+@pytest.mark.parametrize('n_x', LENGTHS)
+@pytest.mark.parametrize('density', ['rho', 'lnrho'])
+@pytest.mark.parametrize('energy', [True, False])
+def test_derive_pressure_energy(n_x, dtype, density, energy):
+    rng = np.random.default_rng(1)
+    params = SimpleNamespace(cp=1.0, gamma=5.0 / 3.0, rho0=1.0, cs0=1.0)
+    ss = rng.normal(0.0, 0.5, (3, n_x)).astype(dtype)
+    rho = rng.uniform(0.1, 1.0, (3, n_x)).astype(dtype)
+    rho[1, 2] = np.nan
+    kwargs = {'rho': rho} if density == 'rho' else {'lnrho': np.log(rho)}
+    assert_identical(*run_both(derive_pressure_energy, ss, params, energy=energy, **kwargs))
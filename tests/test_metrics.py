@@ -0,0 +1,134 @@
+"""Tests of the batched evaluation of the error metric registry (src/analysis/metrics.py)."""
+
+import numpy as np
+import pytest
+
+from src.analysis import kernels, metrics
+from src.analysis.metrics import ErrorMetricRegistry, calculate_errors_over_time, register_custom_metric
+
+
+BUILTIN_METRICS = ['l1', 'l2', 'linf', 'relative_l1', 'relative_l2', 'mape']
+N_R, N_T, N_X = 3, 5, 64
+
+
+@pytest.fixture(scope='module')
+def stacked() -> tuple:
+    """Numerical and analytical [R, T, X] arrays; the analytical one has zeros for the zero guards."""
+    rng = np.random.default_rng(7)
+    analytical = rng.normal(1.0, 0.5, (N_R, N_T, N_X))
+    analytical[:, :, ::8] = 0.0
+    numerical = analytical + rng.normal(0.0, 0.01, analytical.shape)
+    return numerical, analytical
+
+
+@pytest.fixture
+def registry(monkeypatch) -> ErrorMetricRegistry:
+    """A fresh global registry, so custom metrics do not leak into other tests."""
+    registry = ErrorMetricRegistry()
+    monkeypatch.setattr(metrics, 'METRIC_REGISTRY', registry)
+    return registry
+
+
+def quartic_error(numerical: np.ndarray, analytical: np.ndarray) -> float:
+    """Scalar-only metric: fails on anything but one 1D snapshot."""
+    if np.ndim(numerical) != 1:
+        raise ValueError("quartic_error takes one snapshot")
+    return float(np.mean((numerical - analytical) ** 4))
+
+
+def per_row(registry: ErrorMetricRegistry, name: str, numerical: np.ndarray, analytical: np.ndarray) -> np.ndarray:
+    """Reference: the metric called on each 1D row."""
+    n_x = numerical.shape[-1]
+    values = [registry.calculate(name, num, ana) for num, ana in
+              zip(numerical.reshape(-1, n_x), analytical.reshape(-1, n_x))]
+    return np.asarray(values, dtype=np.float64).reshape(numerical.shape[:-1])
+
+
+@pytest.mark.parametrize('name', BUILTIN_METRICS)
+@pytest.mark.parametrize('ndim', [2, 3])
+def test_builtin_batch_matches_rows(registry, stacked, name, ndim):
+    numerical, analytical = (a if ndim == 3 else a[0] for a in stacked)
+    assert registry.is_vectorized(name)
+    values = registry.calculate_batch(name, numerical, analytical)
+    assert values.shape == numerical.shape[:-1] and values.dtype == np.float64
+    np.testing.assert_array_equal(values, per_row(registry, name, numerical, analytical))
+
+
+@pytest.mark.parametrize('name', BUILTIN_METRICS)
+def test_builtin_batch_matches_rows_above_jit_size(registry, name):
+    # The stack is large enough for the Numba kernels, its rows are not
+    rng = np.random.default_rng(11)
+    analytical = rng.normal(1.0, 0.5, (8, kernels.JIT_MIN_SIZE // 4))
+    numerical = analytical + rng.normal(0.0, 0.01, analytical.shape)
+    np.testing.assert_array_equal(registry.calculate_batch(name, numerical, analytical),
+                                  per_row(registry, name, numerical, analytical))
+
+
+@pytest.mark.parametrize('ndim', [1, 2, 3])
+def test_scalar_metric_falls_back_to_rows(registry, stacked, ndim):
+    registry.register('quartic', quartic_error, vectorized=False)
+    numerical, analytical = (a[(0,) * (3 - ndim)] for a in stacked)
+    values = registry.calculate_batch('quartic', numerical, analytical)
+    assert values.shape == numerical.shape[:-1]
+    np.testing.assert_array_equal(values, per_row(registry, 'quartic', numerical, analytical))
+
+
+def test_misdeclared_vectorized_metric_raises(registry, stacked):
+    registry.register('quartic', quartic_error, vectorized=True)
+    with pytest.raises(ValueError):
+        registry.calculate_batch('quartic', *stacked)
+    registry.register('total', lambda num, ana: np.sum(np.abs(num - ana)), vectorized=True)
+    with pytest.raises(ValueError, match='returned shape'):
+        registry.calculate_batch('total', *stacked)
+
+
+def test_batch_rejects_bad_input(registry, stacked):
+    numerical, analytical = stacked
+    with pytest.raises(ValueError, match='equal shape'):
+        registry.calculate_batch('l1', numerical, analytical[..., 1:])
+    with pytest.raises(ValueError, match='equal shape'):
+        registry.calculate_batch('l1', np.float64(1.0), np.float64(1.0))
+    with pytest.raises(KeyError, match='rmse'):
+        registry.calculate_batch('rmse', numerical, analytical)
+
+
+@pytest.mark.parametrize('as_list', [False, True])
+@pytest.mark.parametrize('vectorized', [False, True])
+def test_errors_over_time_batched_and_looped_agree(registry, stacked, as_list, vectorized):
+    # A 1D-only custom metric, even when wrongly declared vectorized, gives the
+    # same per-timestep values as the built-ins do
+    register_custom_metric('quartic', quartic_error, 'L4-type norm', vectorized=vectorized)
+    numerical, analytical = (a[0] for a in stacked)
+    if as_list:
+        numerical, analytical = list(numerical), list(analytical)
+    names = BUILTIN_METRICS + ['quartic']
+    errors = calculate_errors_over_time(numerical, analytical, metrics=names)
+    assert list(errors) == names
+    for name in names:
+        assert len(errors[name]) == N_T
+        looped = [registry.calculate(name, num, ana) for num, ana in zip(numerical, analytical)]
+        np.testing.assert_array_equal(errors[name], looped, err_msg=name)
+
+
+def test_errors_over_time_on_changing_grid(registry, stacked):
+    numerical, analytical = stacked[0][0], stacked[1][0]
+    # The third snapshot is on a coarser grid, so nothing can be stacked
+    numerical = [num if i != 2 else num[::2] for i, num in enumerate(numerical)]
+    analytical = [ana if i != 2 else ana[::2] for i, ana in enumerate(analytical)]
+    errors = calculate_errors_over_time(numerical, analytical, metrics=['l2', 'linf'])
+    for name in ('l2', 'linf'):
+        np.testing.assert_array_equal(errors[name], [registry.calculate(name, num, ana)
+                                                     for num, ana in zip(numerical, analytical)])
+
+
+def test_errors_over_time_failing_timestep_is_nan(registry, stacked):
+    def positive_only(num, ana):
+        if np.any(ana < 0):
+            raise ValueError("negative values")
+        return float(np.max(np.abs(num - ana)))
+
+    register_custom_metric('positive_only', positive_only)
+    numerical, analytical = stacked[0][0], np.abs(stacked[1][0])
+    analytical[3, 0] = -1.0
+    errors = calculate_errors_over_time(numerical, analytical, metrics=['positive_only'])['positive_only']
+    assert np.isnan(errors[3]) and np.isfinite(np.delete(errors, 3)).all()
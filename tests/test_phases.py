@@ -0,0 +1,59 @@
+"""Tests of the analysis phase graph (src/workflows/phases.py)."""
+
+import pytest
+
+from src.workflows.phases import ANALYSIS_PHASES, PHASE_NAMES, RUN_PHASES, phase_dependencies, resolve_phases
+
+
+def test_all_phases_by_default():
+    assert resolve_phases() == list(PHASE_NAMES)
+    assert resolve_phases([]) == list(PHASE_NAMES)
+
+
+def test_dependencies_come_earlier():
+    for index, name in enumerate(PHASE_NAMES):
+        assert set(phase_dependencies(name)) <= set(PHASE_NAMES[:index])
+    assert phase_dependencies('load') == ()
+    assert phase_dependencies('plots') == ('norms',)
+    assert phase_dependencies('error_videos') == ('load', 'errors')
+
+
+def test_run_phases():
+    assert RUN_PHASES == ('load', 'errors', 'var_videos', 'error_videos', 'plotly')
+    assert all(ANALYSIS_PHASES[name]['per_run'] for name in RUN_PHASES)
+
+
+@pytest.mark.parametrize('phases, expected', [
+    (['plots'], ['load', 'errors', 'norms', 'plots']),
+    (['var_videos'], ['load', 'var_videos']),
+    (['best', '3d_map'], ['load', 'errors', '3d_map', 'norms', 'best']),
+    (['reports', 'load'], ['load', 'errors', 'norms', 'reports']),
+    (['load'], ['load']),
+])
+def test_dependency_closure(phases, expected):
+    assert resolve_phases(phases) == expected
+
+
+def test_skipped_phases_are_left_out():
+    selected = resolve_phases(skip_phases=['var_videos', '3d_map'])
+    assert selected == [name for name in PHASE_NAMES if name not in ('var_videos', '3d_map')]
+
+
+def test_skipped_dependency_is_still_run():
+    assert resolve_phases(['plots'], skip_phases=['load', 'errors']) == ['load', 'errors', 'norms', 'plots']
+    assert 'load' in resolve_phases(skip_phases=['load'])
+
+
+@pytest.mark.parametrize('phases, skip_phases', [
+    (['plots'], ['plots']),
+    (None, list(PHASE_NAMES)),
+])
+def test_empty_selection_raises(phases, skip_phases):
+    with pytest.raises(ValueError, match='No analysis phase'):
+        resolve_phases(phases, skip_phases)
+
+
+@pytest.mark.parametrize('phases, skip_phases', [(['plot'], None), (None, ['videos'])])
+def test_unknown_phase_raises(phases, skip_phases):
+    with pytest.raises(ValueError, match='Unknown analysis phase'):
+        resolve_phases(phases, skip_phases)
@@ -0,0 +1,117 @@
+"""Tests of the exact and streamed error statistics (src/analysis/quantiles.py)."""
+
+import numpy as np
+import pytest
+
+from src.analysis.data_prep import get_error_statistics
+from src.analysis.quantiles import DEFAULT_PERCENTILES, QuantileSketch, exact_statistics
+
+
+PERCENTILES = [0.5, 1, 5, *DEFAULT_PERCENTILES, 99.9]
+ACCURACY = 0.01
+
+
+def error_matrix(kind: str, seed: int = 5, shape=(200, 400)) -> np.ndarray:
+    """[T, X] error field: absolute errors spanning decades, or signed differences."""
+    rng = np.random.default_rng(seed)
+    errors = rng.lognormal(-8.0, 2.5, shape)
+    # Exact cells (e.g. the undisturbed states) have zero error
+    errors[:, :30] = 0.0
+    if kind == 'difference':
+        errors *= rng.choice([-1.0, 1.0], shape)
+    return errors
+
+
+def assert_within(estimates, exact, relative_accuracy: float):
+    estimates, exact = np.asarray(estimates), np.asarray(exact)
+    assert np.all(np.abs(estimates - exact) <= relative_accuracy * np.abs(exact)), \
+        np.max(np.abs(estimates - exact) / np.where(exact == 0, 1, np.abs(exact)))
+
+
+@pytest.mark.parametrize('kind', ['absolute', 'difference'])
+@pytest.mark.parametrize('relative_accuracy', [0.05, ACCURACY, 0.001])
+def test_sketch_accuracy(kind, relative_accuracy):
+    errors = error_matrix(kind)
+    sketch = QuantileSketch(relative_accuracy)
+    for row in errors:
+        sketch.update(row)
+    estimates = sketch.quantiles(PERCENTILES)
+    # The guarantee holds against the order statistic at the rank
+    assert_within(estimates, np.percentile(errors, PERCENTILES, method='lower'), relative_accuracy)
+    np.testing.assert_array_equal(sketch.quantiles([0, 100]), [errors.min(), errors.max()])
+
+
+@pytest.mark.parametrize('relative_accuracy', [0.05, ACCURACY])
+def test_sketch_matches_interpolated_percentiles(relative_accuracy):
+    # On a field this dense, interpolating between neighbouring values does not
+    # leave the bound (for signed errors it can, where the sign changes)
+    errors = error_matrix('absolute')
+    sketch = QuantileSketch(relative_accuracy).update(errors)
+    assert_within(sketch.quantiles(PERCENTILES), np.percentile(errors, PERCENTILES), relative_accuracy)
+
+
+def test_sketch_moments_are_exact():
+    errors = error_matrix('difference')
+    sketch = QuantileSketch()
+    for block in np.array_split(errors, 7):
+        sketch.update(block)
+    assert len(sketch) == errors.size
+    assert (sketch.min, sketch.max) == (errors.min(), errors.max())
+    assert sketch.mean == pytest.approx(errors.mean(), rel=1e-12, abs=1e-18)
+    assert sketch.std == pytest.approx(errors.std(), rel=1e-12)
+
+
+@pytest.mark.parametrize('kind', ['absolute', 'difference'])
+def test_merge_equals_sketch_of_concatenation(kind):
+    a = error_matrix(kind, seed=1, shape=(50, 300))
+    # A second run with larger errors, extending the bucket range
+    b = 100.0 * error_matrix(kind, seed=2, shape=(80, 300))
+    merged = QuantileSketch().update(a).merge(QuantileSketch().update(b))
+    whole = QuantileSketch().update(np.concatenate([a, b]))
+
+    np.testing.assert_array_equal(merged.quantiles(PERCENTILES), whole.quantiles(PERCENTILES))
+    assert (merged.count, merged.min, merged.max, merged.zero_count) == \
+        (whole.count, whole.min, whole.max, whole.zero_count)
+    assert merged.mean == pytest.approx(whole.mean, rel=1e-12)
+    assert merged.std == pytest.approx(whole.std, rel=1e-12)
+
+    # Merging into an empty sketch, or merging an empty one, changes nothing
+    copy = QuantileSketch().merge(whole).merge(QuantileSketch())
+    np.testing.assert_array_equal(copy.quantiles(PERCENTILES), whole.quantiles(PERCENTILES))
+
+
+def test_merge_rejects_other_accuracy():
+    with pytest.raises(ValueError, match='relative accuracy'):
+        QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+
+@pytest.mark.parametrize('relative_accuracy', [0.0, 1.0, -0.1])
+def test_invalid_accuracy(relative_accuracy):
+    with pytest.raises(ValueError):
+        QuantileSketch(relative_accuracy)
+
+
+def test_non_finite_and_empty_input():
+    sketch = QuantileSketch().update([np.nan, np.inf, -np.inf]).update([])
+    assert len(sketch) == 0 and np.isnan(sketch.quantiles([50])).all()
+    assert sketch.statistics() == exact_statistics(np.array([np.nan]))
+    sketch.update([2.0, np.nan, 4.0])
+    assert len(sketch) == 2 and (sketch.min, sketch.max) == (2.0, 4.0)
+
+
+def test_streamed_statistics_match_exact():
+    errors = error_matrix('absolute')
+    errors[3, 50:60] = np.nan
+    exact = get_error_statistics(errors, PERCENTILES)
+    streamed = get_error_statistics(errors, PERCENTILES, streaming=True, relative_accuracy=ACCURACY)
+
+    valid = errors[np.isfinite(errors)]
+    assert exact['median'] == np.median(valid)
+    np.testing.assert_allclose(list(exact['percentiles'].values()), np.percentile(valid, PERCENTILES), rtol=1e-14)
+
+    assert (streamed['min'], streamed['max']) == (exact['min'], exact['max'])
+    assert streamed['mean'] == pytest.approx(exact['mean'], rel=1e-12, abs=1e-18)
+    assert streamed['std'] == pytest.approx(exact['std'], rel=1e-12)
+    assert list(streamed['percentiles']) == list(exact['percentiles'])
+    assert_within([streamed['median'], *streamed['percentiles'].values()],
+                  [exact['median'], *exact['percentiles'].values()], ACCURACY)
@@ -0,0 +1,131 @@
+"""Tests of the exact Sod solver (src/analysis/riemann.py) against Toro's reference solution."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.analysis.riemann import compare_with_pencil_sod, exact_sod, initial_states, solve_star_state, wave_positions
+from src.analysis.thermodynamics import thermodynamic_constants
+
+
+GAMMA = 1.4
+SOD_LEFT, SOD_RIGHT = (1.0, 0.0, 1.0), (0.125, 0.0, 0.1)
+
+# Toro, "Riemann Solvers and Numerical Methods for Fluid Dynamics", table 4.3 (test 1)
+TORO_STAR = {'p_star': 0.30313, 'u_star': 0.92745, 'rho_star_left': 0.42632, 'rho_star_right': 0.26557}
+
+
+def sod_params(left: tuple = SOD_LEFT, right: tuple = SOD_RIGHT, x0: float = 0.0) -> SimpleNamespace:
+    """Params object with the entropies that give the (rho, u, p) states of a run."""
+    params = SimpleNamespace(cp=1.0, gamma=GAMMA, rho0=1.0, cs0=1.0, xjump_mid=x0)
+    c = thermodynamic_constants(params)
+    for side, (rho, u, p) in (('left', left), ('right', right)):
+        ss = c['cp'] / GAMMA * (np.log(p / (c['cp'] - c['cv'])) - c['lnTT0'] - GAMMA * np.log(rho)
+                                + (GAMMA - 1.0) * c['lnrho0'])
+        setattr(params, f'rho_{side}', rho)
+        setattr(params, f'ss_{side}', ss)
+        setattr(params, f'uu_{side}', u)
+    return params
+
+
+def test_initial_states_recover_pressures():
+    init = initial_states(sod_params(x0=0.25))
+    assert init['left'] == pytest.approx(SOD_LEFT, rel=1e-12)
+    assert init['right'] == pytest.approx(SOD_RIGHT, rel=1e-12)
+    assert init['gamma'] == GAMMA and init['x0'] == 0.25
+
+
+def test_star_state_matches_toro():
+    star = solve_star_state(SOD_LEFT, SOD_RIGHT, GAMMA)
+    for key, value in TORO_STAR.items():
+        assert star[key] == pytest.approx(value, abs=1e-5), key
+    assert star['c_left'] == pytest.approx(np.sqrt(GAMMA))
+
+
+def test_star_state_of_mirrored_problem():
+    star = solve_star_state(SOD_LEFT, SOD_RIGHT, GAMMA)
+    mirrored = solve_star_state(SOD_RIGHT, SOD_LEFT, GAMMA)
+    assert mirrored['p_star'] == pytest.approx(star['p_star'], rel=1e-12)
+    assert mirrored['u_star'] == pytest.approx(-star['u_star'], rel=1e-12)
+    assert mirrored['rho_star_left'] == pytest.approx(star['rho_star_right'], rel=1e-12)
+    assert mirrored['rho_star_right'] == pytest.approx(star['rho_star_left'], rel=1e-12)
+
+
+def test_star_state_rejects_vacuum():
+    with pytest.raises(ValueError):
+        solve_star_state((1.0, -10.0, 0.4), (1.0, 10.0, 0.4), GAMMA)
+
+
+def test_exact_sod_regions():
+    t = 0.25
+    speeds = np.array([-2.0, -0.5, 0.5, 1.3, 2.0])
+    solution = exact_sod(speeds * t, [t], sod_params())
+    star = TORO_STAR
+
+    # Undisturbed left state, rarefaction fan, both star states, undisturbed right state
+    rho_l, u_l, p_l = SOD_LEFT
+    c_l = np.sqrt(GAMMA * p_l / rho_l)
+    base = 2.0 / (GAMMA + 1.0) + (GAMMA - 1.0) / ((GAMMA + 1.0) * c_l) * (u_l - speeds[1])
+    expected_rho = [rho_l, rho_l * base ** (2.0 / (GAMMA - 1.0)), star['rho_star_left'],
+                    star['rho_star_right'], SOD_RIGHT[0]]
+    expected_ux = [0.0, 2.0 / (GAMMA + 1.0) * (c_l + speeds[1]), star['u_star'], star['u_star'], 0.0]
+    expected_pp = [p_l, p_l * base ** (2.0 * GAMMA / (GAMMA - 1.0)), star['p_star'], star['p_star'], SOD_RIGHT[2]]
+
+    assert solution.rho.shape == (1, speeds.size)
+    np.testing.assert_allclose(solution.rho[0], expected_rho, atol=1e-5)
+    np.testing.assert_allclose(solution.ux[0], expected_ux, atol=1e-5)
+    np.testing.assert_allclose(solution.pp[0], expected_pp, atol=1e-5)
+
+
+def test_exact_sod_wave_positions():
+    t = np.array([0.1, 0.2])
+    waves = wave_positions(sod_params(), t)
+    assert set(waves) == {'rarefaction', 'contact', 'shock'}
+    np.testing.assert_allclose(waves['contact'][0], TORO_STAR['u_star'] * t, atol=1e-5)
+    np.testing.assert_allclose(waves['rarefaction'][0], -np.sqrt(GAMMA) * t)
+    # Shock speed from the Rankine-Hugoniot relation (Toro: 1.75216)
+    np.testing.assert_allclose(waves['shock'][0], 1.75216 * t, atol=1e-5)
+
+
+def test_exact_sod_mirrored_problem():
+    # No point on the jump itself, where x = x0 belongs to the right state at t = 0
+    x = np.linspace(-0.5, 0.5, 200)
+    t = [0.0, 0.1, 0.2]
+    solution = exact_sod(x, t, sod_params())
+    mirrored = exact_sod(-x, t, sod_params(left=SOD_RIGHT, right=SOD_LEFT))
+    np.testing.assert_allclose(mirrored.rho, solution.rho, rtol=1e-12)
+    np.testing.assert_allclose(mirrored.pp, solution.pp, rtol=1e-12)
+    np.testing.assert_allclose(mirrored.ux, -solution.ux, rtol=1e-12, atol=1e-15)
+
+
+def test_exact_sod_initial_discontinuity():
+    x = np.array([-0.1, 0.1])
+    solution = exact_sod(x, 0.0, sod_params())
+    assert np.array_equal(solution.rho, [[SOD_LEFT[0], SOD_RIGHT[0]]])
+    assert np.array_equal(solution.ux, [[0.0, 0.0]])
+
+
+def test_exact_sod_magic():
+    x = np.linspace(-0.5, 0.5, 101)
+    params = sod_params()
+    solution = exact_sod(x, [0.1, 0.2], params, magic=['ee'])
+    assert np.array_equal(solution.ee, solution.pp / (solution.rho * (GAMMA - 1.0)))
+    assert not hasattr(solution, 'TT')
+    # In the undisturbed states ee follows from the initial pressure and density
+    assert solution.ee[0, 0] == pytest.approx(SOD_LEFT[2] / (SOD_LEFT[0] * (GAMMA - 1.0)))
+    assert solution.ee[0, -1] == pytest.approx(SOD_RIGHT[2] / (SOD_RIGHT[0] * (GAMMA - 1.0)))
+
+    c = thermodynamic_constants(params)
+    with_tt = exact_sod(x, [0.1], params, magic=['ee', 'TT'])
+    assert np.array_equal(with_tt.TT, with_tt.pp / (with_tt.rho * (c['cp'] - c['cv'])))
+    with pytest.raises(ValueError):
+        exact_sod(x, [0.1], params, magic=['lnrho'])
+
+
+def test_compare_with_pencil_sod():
+    pytest.importorskip("pencil")
+    x = np.linspace(-0.5, 0.5, 401)
+    differences = compare_with_pencil_sod(x, [0.05, 0.1, 0.15], sod_params())
+    assert set(differences) == {'rho', 'ux', 'pp', 'ee'}
+    assert all(difference < 1e-4 for difference in differences.values()), differences
@@ -0,0 +1,153 @@
+"""Tests of the memory-bounded per-run result cache (src/analysis/run_cache.py)."""
+
+import numpy as np
+import pytest
+
+from src.analysis.run_cache import RunResultCache, parse_memory_size, result_nbytes
+
+
+N_X = 16
+# Heavy fields of one run: two float64 [2, N_X] fields
+RUN_NBYTES = 2 * 2 * N_X * 8
+
+
+def make_result(seed: int) -> dict:
+    """Run result with small scalar fields and two heavy error fields."""
+    rng = np.random.default_rng(seed)
+    return {
+        'branch': 'default',
+        'error_norms': {'rho': {'l1': {'mean': float(seed)}}},
+        'spatial_errors': {'rho': {'errors_per_timestep': rng.random((2, N_X))}},
+        'normalized_errors': {'rho': {'relative_errors': rng.random((2, N_X))}},
+    }
+
+
+class FakeStore:
+    """Stands in for the run store: persisted results by run name, counting loads."""
+
+    def __init__(self):
+        self.results = {}
+        self.loads = []
+
+    def load(self, run_name: str):
+        self.loads.append(run_name)
+        return self.results.get(run_name)
+
+
+def filled_cache(n_runs: int, max_bytes) -> tuple:
+    store = FakeStore()
+    cache = RunResultCache(max_bytes, load=store.load)
+    for i in range(n_runs):
+        store.results[f'run{i}'] = make_result(i)
+        cache.put(f'run{i}', store.results[f'run{i}'])
+    return cache, store
+
+
+def test_result_nbytes_counts_nested_arrays():
+    assert result_nbytes(make_result(0)) == RUN_NBYTES
+
+
+def test_unbounded_cache_never_evicts():
+    cache, store = filled_cache(5, None)
+    assert cache.evictions == 0 and cache.nbytes == 5 * RUN_NBYTES
+    for run_name in cache:
+        cache[run_name]
+    assert store.loads == []
+
+
+def test_lru_eviction_within_budget():
+    cache, store = filled_cache(5, 2 * RUN_NBYTES)
+    assert cache.evictions == 3
+    assert cache.nbytes == 2 * RUN_NBYTES
+    assert cache.peak_nbytes == 3 * RUN_NBYTES
+    assert list(cache) == [f'run{i}' for i in range(5)]
+
+    # The two most recent runs are held; touching run3 makes run4 the oldest
+    cache['run3']
+    assert store.loads == []
+    cache['run0']
+    assert store.loads == ['run0'] and cache.reloads == 1
+    cache['run3']
+    assert cache.reloads == 1
+    cache['run4']
+    assert store.loads == ['run0', 'run4'] and cache.reloads == 2
+    assert cache.evictions == 5
+
+
+def test_reload_returns_stored_fields():
+    cache, store = filled_cache(3, RUN_NBYTES)
+    result = cache['run0']
+    expected = store.results['run0']
+    assert result['error_norms'] == expected['error_norms']
+    np.testing.assert_array_equal(result['spatial_errors']['rho']['errors_per_timestep'],
+                                  expected['spatial_errors']['rho']['errors_per_timestep'])
+    np.testing.assert_array_equal(result['normalized_errors']['rho']['relative_errors'],
+                                  expected['normalized_errors']['rho']['relative_errors'])
+
+
+def test_newest_run_always_stays():
+    cache, store = filled_cache(3, 1)
+    assert cache.evictions == 2 and cache.nbytes == RUN_NBYTES
+    cache['run2']
+    assert store.loads == []
+    # A reloaded run becomes the newest and evicts the previous one
+    cache['run0']
+    assert store.loads == ['run0'] and cache.nbytes == RUN_NBYTES
+    cache['run0']
+    assert store.loads == ['run0']
+
+
+def test_light_never_reads_back():
+    cache, store = filled_cache(3, 1)
+    light = cache.light('run0')
+    assert light['error_norms'] == {'rho': {'l1': {'mean': 0.0}}}
+    assert 'spatial_errors' not in light and 'normalized_errors' not in light
+    assert store.loads == []
+
+
+def test_missing_stored_result_raises():
+    cache, store = filled_cache(2, 1)
+    del store.results['run0']
+    with pytest.raises(KeyError, match='run0'):
+        cache['run0']
+
+
+def test_no_eviction_without_load():
+    cache = RunResultCache(1)
+    for i in range(3):
+        cache.put(f'run{i}', make_result(i))
+    assert cache.evictions == 0 and cache.nbytes == 3 * RUN_NBYTES
+
+
+def test_put_replaces_run():
+    cache, _ = filled_cache(2, None)
+    cache.put('run0', {**make_result(7), 'spatial_errors': {}})
+    assert cache.nbytes == 2 * RUN_NBYTES - 2 * N_X * 8
+    assert cache.light('run0')['error_norms']['rho']['l1']['mean'] == 7.0
+    assert list(cache) == ['run0', 'run1']
+
+
+def test_restrict_orders_and_drops_runs():
+    cache, _ = filled_cache(4, None)
+    cache.restrict(['run3', 'missing', 'run1', 'run0'])
+    assert list(cache) == ['run3', 'run1', 'run0']
+    assert len(cache) == 3 and 'run2' not in cache
+    assert cache.nbytes == 3 * RUN_NBYTES
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('512', 512 * 1024 ** 2),
+    ('1.5GB', int(1.5 * 1024 ** 3)),
+    ('8G', 8 * 1024 ** 3),
+    ('64k', 64 * 1024),
+    ('2 MiB', 2 * 1024 ** 2),
+    ('1T', 1024 ** 4),
+])
+def test_parse_memory_size(text, expected):
+    assert parse_memory_size(text) == expected
+
+
+@pytest.mark.parametrize('text', ['0', '0G', '', 'lots', '-1G', '1X'])
+def test_parse_memory_size_rejects(text):
+    with pytest.raises(ValueError):
+        parse_memory_size(text)
@@ -0,0 +1,158 @@
+"""Regression checks of RunErrors (src/analysis/errors.py) against the per-quantity module functions."""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.analysis.errors import (ErrorNormAccumulator, RunErrors, calculate_absolute_deviation_per_var,
+                                 calculate_error_norms, calculate_normalized_spatial_errors, calculate_spatial_errors,
+                                 calculate_std_deviation_across_vars)
+from src.analysis.metrics import calculate_error
+from src.analysis.riemann import exact_sod, wave_positions
+from src.analysis.snapshots import SnapshotSeries
+
+
+VARIABLES = ['rho', 'ux', 'pp', 'ee']
+# Computed up front (float64 shortcut) and requested later (registry on the float64 inputs)
+METRICS = ['l1', 'l2', 'linf', 'relative_l1', 'mape']
+LATE_METRICS = ['relative_l2', 'l1']
+ROIS = (None, {'half_width': 4})
+DTYPES = (np.float64, np.float32)
+
+
+PARAMS = SimpleNamespace(cp=1.0, gamma=1.4, rho0=1.0, cs0=1.0, xjump_mid=0.0,
+                         rho_left=1.0, rho_right=0.125, ss_left=0.0, ss_right=0.0)
+
+
+def noisy_sod(t) -> tuple:
+    """Sod run: exact solution plus noise (ux is zero outside the waves, exercising the zero guards)."""
+    params = PARAMS
+    x = np.linspace(-0.5, 0.5, 201)
+    t = np.asarray(t, dtype=np.float64)
+    exact = exact_sod(x, t, params, magic=['ee'])
+    rng = np.random.default_rng(3)
+    ana_fields = {var: getattr(exact, var) for var in VARIABLES}
+    sim_fields = {var: values + rng.normal(0.0, 0.01, values.shape) for var, values in ana_fields.items()}
+    var_files = [f'VAR{i}' for i in range(len(t))]
+    sim = SnapshotSeries(x=x, t=t, fields=sim_fields, var_files=var_files, params=params)
+    ana = SnapshotSeries(x=x, t=t, fields=ana_fields, var_files=var_files, params=params)
+    return sim, ana
+
+
+@pytest.fixture(scope='module')
+def run():
+    return noisy_sod([0.02, 0.05, 0.1, 0.15])
+
+
+def assert_matches(expected, actual, rtol: float):
+    if isinstance(expected, dict):
+        assert expected.keys() == actual.keys()
+        for key in expected:
+            assert_matches(expected[key], actual[key], rtol)
+    elif isinstance(expected, (list, tuple)):
+        assert len(expected) == len(actual)
+        for e, a in zip(expected, actual):
+            assert_matches(e, a, rtol)
+    elif isinstance(expected, np.ndarray):
+        assert isinstance(actual, np.ndarray) and actual.dtype == expected.dtype
+        np.testing.assert_allclose(actual, expected, rtol=rtol, atol=0.0, equal_nan=True)
+    elif isinstance(expected, str):
+        assert actual == expected
+    else:
+        np.testing.assert_allclose(actual, expected, rtol=rtol, atol=0.0, equal_nan=True)
+
+
+def tolerance(dtype) -> float:
+    return 1e-6 if dtype == np.float32 else 1e-12
+
+
+@pytest.mark.parametrize('roi', ROIS)
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_error_norms_match_module_function(run, dtype, roi):
+    sim, ana = run
+    run_errors = RunErrors(sim, ana, variables=VARIABLES, metrics=METRICS, storage_dtype=dtype, roi=roi)
+    for metrics in (METRICS, LATE_METRICS):
+        expected = calculate_error_norms(sim.to_dicts(), ana.to_dicts(), VARIABLES, metrics, roi=roi)
+        # Norms are computed in float64 whatever the storage dtype
+        assert_matches(expected, run_errors.error_norms(metrics), rtol=1e-12)
+
+
+@pytest.mark.parametrize('roi', ROIS)
+@pytest.mark.parametrize('dtype', DTYPES)
+def test_error_fields_match_module_functions(run, dtype, roi):
+    sim, ana = run
+    sim_dicts, ana_dicts = sim.to_dicts(), ana.to_dicts()
+    run_errors = RunErrors(sim, ana, variables=VARIABLES, metrics=METRICS, storage_dtype=dtype, roi=roi)
+    rtol = tolerance(dtype)
+
+    for method in ('absolute', 'relative', 'difference', 'squared'):
+        expected = calculate_spatial_errors(sim_dicts, ana_dicts, VARIABLES, method)
+        for var_errors in expected.values():
+            var_errors['errors_per_timestep'] = [e.astype(dtype) for e in var_errors['errors_per_timestep']]
+        assert_matches(expected, run_errors.spatial_errors(method), rtol)
+
+    for by_space, by_time in ((False, False), (True, False), (False, True), (True, True)):
+        expected = calculate_normalized_spatial_errors(sim_dicts, ana_dicts, VARIABLES, by_space, by_time,
+                                                       dtype=dtype)
+        assert_matches(expected, run_errors.normalized_errors(VARIABLES, by_space, by_time), rtol)
+
+    assert_matches(calculate_std_deviation_across_vars(sim_dicts, ana_dicts, VARIABLES),
+                   run_errors.std_devs(), rtol=1e-12)
+    assert_matches(calculate_absolute_deviation_per_var(sim_dicts, ana_dicts, VARIABLES),
+                   run_errors.abs_devs(), rtol=1e-12)
+
+
+def test_roi_restricts_norms_only(run):
+    sim, ana = run
+    whole = RunErrors(sim, ana, variables=VARIABLES, metrics=METRICS)
+    roi = RunErrors(sim, ana, variables=VARIABLES, metrics=METRICS, roi={'half_width': 4})
+    assert_matches(whole.spatial_errors(), roi.spatial_errors(), rtol=0.0)
+    assert not np.allclose(whole.error_norms()['rho']['l2']['per_timestep'],
+                           roi.error_norms()['rho']['l2']['per_timestep'])
+
+
+def roi_cells(x: np.ndarray, t: float, half_width: int) -> np.ndarray:
+    """Indices of all cells within ``half_width`` cells of a wave, as an explicit union."""
+    cells = []
+    for lo, hi in wave_positions(PARAMS, [t]).values():
+        start = max(np.searchsorted(x, lo[0], side='left') - half_width, 0)
+        stop = min(np.searchsorted(x, hi[0], side='right') + half_width, x.size)
+        cells.append(np.arange(start, stop))
+    return np.unique(np.concatenate(cells))
+
+
+@pytest.mark.parametrize('half_width', [4, 30])
+def test_roi_norms_match_index_union(half_width):
+    # At t=0 all waves sit at the jump, so their windows coincide; a wide margin
+    # makes the windows of later snapshots overlap too
+    sim, ana = noisy_sod([0.0, 0.02, 0.05, 0.1])
+    roi = {'half_width': half_width}
+    metrics = ['l1', 'l2', 'linf', 'relative_l1', 'relative_l2', 'mape']
+    expected = {
+        var: {metric: [calculate_error(sim.fields[var][i][cells], ana.fields[var][i][cells], metric=metric)
+                       for i, cells in enumerate(roi_cells(sim.x, t, half_width) for t in sim.t)]
+              for metric in metrics}
+        for var in VARIABLES
+    }
+
+    accumulator = ErrorNormAccumulator(variables=VARIABLES, metrics=metrics, roi=roi)
+    for sim_data, ana_data in zip(sim, ana):
+        accumulator.update(sim_data, ana_data)
+    results = (calculate_error_norms(sim, ana, VARIABLES, metrics, roi=roi),
+               calculate_error_norms(sim.to_dicts(), ana.to_dicts(), VARIABLES, metrics, roi=roi),
+               accumulator.result(),
+               RunErrors(sim, ana, variables=VARIABLES, metrics=metrics, roi=roi).error_norms())
+    for error_norms in results:
+        for var in VARIABLES:
+            for metric in metrics:
+                np.testing.assert_allclose(error_norms[var][metric]['per_timestep'], expected[var][metric],
+                                           rtol=1e-12, err_msg=f"{var} {metric}")
+
+
+def test_roi_linf_is_maximum_over_region():
+    sim, ana = noisy_sod([0.05])
+    cells = roi_cells(sim.x, 0.05, 8)
+    error_norms = calculate_error_norms(sim, ana, ['rho'], ['linf'], roi={'half_width': 8})
+    assert error_norms['rho']['linf']['per_timestep'][0] == np.max(np.abs(sim.fields['rho'][0][cells]
+                                                                          - ana.fields['rho'][0][cells]))
@@ -0,0 +1,170 @@
+"""Tests of the per-suite run record store (src/analysis/run_store.py)."""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.analysis import run_store
+from src.analysis.run_store import RunResultStore, run_fingerprint, store_settings
+
+
+METRICS = ['l1', 'l2', 'linf']
+VARIABLES = ['rho', 'ux', 'pp']
+SELECTION = {'start': 0, 'stop': None, 'step': 1, 'max_snapshots': None}
+ROI = {'half_width': 4}
+
+
+def make_record(variables=VARIABLES, metrics=METRICS) -> dict:
+    return {
+        'branch': 'default',
+        'error_norms': {var: {metric: {'per_timestep': [0.1, 0.2], 'mean': 0.15} for metric in metrics}
+                        for var in variables},
+        'fronts': None,
+        'n_timesteps': 2,
+        'var_files': ['VAR0', 'VAR1'],
+        'dx': 0.01,
+        'nx': 100,
+    }
+
+
+@pytest.fixture
+def var_files(tmp_path):
+    files = []
+    for i in range(2):
+        var_file = tmp_path / 'run' / f'VAR{i}'
+        var_file.parent.mkdir(exist_ok=True)
+        var_file.write_bytes(b'\0' * 64)
+        files.append(var_file)
+    return files
+
+
+@pytest.fixture
+def store(tmp_path):
+    return RunResultStore(tmp_path / 'store')
+
+
+def test_round_trip(store, var_files):
+    settings = store_settings(METRICS, VARIABLES, SELECTION, ROI)
+    fingerprint = run_fingerprint(var_files)
+    assert store.get('run', settings, fingerprint) is None
+    store.put('run', settings, make_record(), fingerprint)
+    assert store.get('run', settings, fingerprint) == make_record()
+    assert (store.hits, store.misses) == (1, 1)
+
+
+@pytest.mark.parametrize('change', ['mtime', 'size', 'added', 'removed'])
+def test_changed_var_files_invalidate(store, var_files, change):
+    settings = store_settings(METRICS, VARIABLES, SELECTION, ROI)
+    store.put('run', settings, make_record(), run_fingerprint(var_files))
+    store.put_result('run', run_fingerprint(var_files), {'error_norms': {}})
+
+    if change == 'mtime':
+        stat = var_files[1].stat()
+        os.utime(var_files[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    elif change == 'size':
+        var_files[1].write_bytes(b'\0' * 128)
+    elif change == 'added':
+        extra = var_files[1].with_name('VAR2')
+        extra.write_bytes(b'\0' * 64)
+        var_files = var_files + [extra]
+    else:
+        var_files = var_files[:1]
+
+    fingerprint = run_fingerprint(var_files)
+    assert store.get('run', settings, fingerprint) is None
+    assert store.get_result('run', fingerprint) is None
+
+
+def test_missing_fingerprint_never_matches(store, var_files):
+    settings = store_settings(METRICS, VARIABLES, SELECTION, ROI)
+    store.put('run', settings, make_record(), None)
+    store.put_result('run', None, {})
+    assert store.get('run', settings, None) is None
+    assert store.get_result('run', None) is None
+
+
+def test_rendering_config_enters_fingerprint(var_files):
+    assert run_fingerprint(var_files, {'fps': 10}) != run_fingerprint(var_files, {'fps': 12})
+    assert run_fingerprint(var_files, {'fps': 10}) == run_fingerprint(var_files, {'fps': 10})
+
+
+@pytest.mark.parametrize('selection, roi', [
+    ({**SELECTION, 'step': 2}, ROI),
+    ({**SELECTION, 'max_snapshots': 10}, ROI),
+    (SELECTION, {'half_width': 8}),
+    (SELECTION, None),
+])
+def test_other_selection_or_roi_invalidates(store, var_files, selection, roi):
+    fingerprint = run_fingerprint(var_files)
+    store.put('run', store_settings(METRICS, VARIABLES, SELECTION, ROI), make_record(), fingerprint)
+    assert store.get('run', store_settings(METRICS, VARIABLES, selection, roi), fingerprint) is None
+
+
+def test_numpy_settings_match_plain_ones(store, var_files):
+    fingerprint = run_fingerprint(var_files)
+    store.put('run', store_settings(METRICS, VARIABLES, SELECTION, {'half_width': np.int64(4)}),
+              make_record(), fingerprint)
+    assert store.get('run', store_settings(tuple(METRICS), tuple(VARIABLES), SELECTION, ROI),
+                     fingerprint) is not None
+
+
+def test_superset_is_trimmed(store, var_files):
+    fingerprint = run_fingerprint(var_files)
+    store.put('run', store_settings(METRICS, VARIABLES, SELECTION, ROI), make_record(), fingerprint)
+
+    record = store.get('run', store_settings(['linf', 'l1'], ['pp'], SELECTION, ROI), fingerprint)
+    assert record == {**make_record(), 'error_norms': make_record(['pp'], ['l1', 'linf'])['error_norms']}
+    assert list(record['error_norms']['pp']) == ['linf', 'l1']
+
+
+@pytest.mark.parametrize('metrics, variables', [
+    (METRICS + ['mape'], VARIABLES),
+    (METRICS, VARIABLES + ['ee']),
+])
+def test_missing_metric_or_variable_invalidates(store, var_files, metrics, variables):
+    fingerprint = run_fingerprint(var_files)
+    store.put('run', store_settings(METRICS, VARIABLES, SELECTION, ROI), make_record(), fingerprint)
+    assert store.get('run', store_settings(metrics, variables, SELECTION, ROI), fingerprint) is None
+
+
+def test_version_bump_invalidates(store, var_files, monkeypatch):
+    settings = store_settings(METRICS, VARIABLES, SELECTION, ROI)
+    fingerprint = run_fingerprint(var_files)
+    store.put('run', settings, make_record(), fingerprint)
+    store.put_result('run', fingerprint, {'error_norms': {}})
+    assert store.get_result('run', fingerprint) == {'error_norms': {}}
+
+    monkeypatch.setattr(run_store, 'STORE_VERSION', run_store.STORE_VERSION + 1)
+    assert store.get('run', settings, fingerprint) is None
+    assert store.get_result('run', fingerprint) is None
+
+
+def test_unreadable_files_are_misses(store, var_files):
+    settings = store_settings(METRICS, VARIABLES, SELECTION, ROI)
+    fingerprint = run_fingerprint(var_files)
+    store.store_dir.mkdir(parents=True)
+    (store.store_dir / 'run.json').write_text('{"version": 2, "rec')
+    (store.store_dir / 'run.pkl').write_bytes(b'not a pickle')
+    assert store.get('run', settings, fingerprint) is None
+    assert store.get_result('run', fingerprint) is None
+    assert store.misses == 2
+
+
+@pytest.mark.parametrize('analyze_metrics', [['l2'], ['l1', 'l2', 'linf', 'mape']])
+@pytest.mark.parametrize('error_metrics, error_variables', [
+    (['l1', 'l2', 'linf'], ['rho', 'ux', 'pp', 'ee']),
+    (['linf'], ['rho']),
+])
+def test_analyze_record_serves_error_norms(store, var_files, analyze_metrics, error_metrics, error_variables):
+    from src.workflows.analysis_pipeline import ANALYSIS_VARIABLES, DEFAULT_ERROR_NORM_METRICS, RUN_RECORD_KEYS
+
+    # --analyze stores the default norms of every variable next to its configured metrics
+    norm_metrics = list(dict.fromkeys([*analyze_metrics, *DEFAULT_ERROR_NORM_METRICS]))
+    fingerprint = run_fingerprint(var_files)
+    record = make_record(ANALYSIS_VARIABLES, norm_metrics)
+    assert set(record) == set(RUN_RECORD_KEYS)
+    store.put('run', store_settings(norm_metrics, ANALYSIS_VARIABLES, SELECTION, ROI), record, fingerprint)
+
+    stored = store.get('run', store_settings(error_metrics, error_variables, SELECTION, ROI), fingerprint)
+    assert stored == {**record, 'error_norms': make_record(error_variables, error_metrics)['error_norms']}
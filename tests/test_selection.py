@@ -0,0 +1,174 @@
+"""Tests of the snapshot selection of the error analysis (src/workflows/analysis_pipeline.py)."""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import yaml
+
+from src.analysis.var_reader import NativeVarReader
+from src.workflows import analysis_pipeline
+from src.workflows.analysis_pipeline import _select_var_files, resolve_snapshot_selection
+
+
+NX, NGHOST = 32, 3
+MX, MY, MZ = NX + 2 * NGHOST, 1 + 2 * NGHOST, 1 + 2 * NGHOST
+INDEX = {'ux': 1, 'uy': 2, 'uz': 3, 'lnrho': 4, 'ss': 5}
+N_VAR = 11
+DT = 0.01
+
+
+def _write_record(f, payload: bytes):
+    marker = np.array([len(payload)], dtype='<i4').tobytes()
+    f.write(marker + payload + marker)
+
+
+def write_sod_run(run_path: Path, var_list: bool = True) -> list:
+    """Write a single-processor 1D Sod run of N_VAR VAR files; returns their paths."""
+    data_dir = run_path / "data"
+    proc_dir = data_dir / "proc0"
+    proc_dir.mkdir(parents=True)
+    dims = f"{MX:8d}{MY:8d}{MZ:8d}{len(INDEX):8d}{0:8d}{0:8d}\nD\n{NGHOST:3d}{NGHOST:3d}{NGHOST:3d}\n"
+    (data_dir / "dim.dat").write_text(dims + "  1  1  1\n")
+    (proc_dir / "dim.dat").write_text(dims + "  0  0  0\n")
+    (data_dir / "index.pro").write_text("".join(f"i{name}={position}\n" for name, position in INDEX.items())
+                                        + f"nname={len(INDEX)}\n")
+    (data_dir / "param.nml").write_text("&init_pars\n ldensity_nolog=F,\n/\n"
+                                        "&eos_init_pars\n gamma=1.4, cp=1.0, cs0=1.0, rho0=1.0,\n/\n"
+                                        "&density_init_pars\n rho_left=1.0, rho_right=0.125,\n/\n"
+                                        "&entropy_init_pars\n ss_left=0.0, ss_right=0.0,\n/\n")
+
+    rng = np.random.default_rng(0)
+    dx = 1.0 / NX
+    x = (np.arange(MX) - NGHOST + 0.5) * dx - 0.5
+    var_files = []
+    for n in range(N_VAR):
+        f = 0.1 * rng.standard_normal((len(INDEX), MZ, MY, MX))
+        grid = np.concatenate([[n * DT], x, np.zeros(MY), np.zeros(MZ), [dx, 1.0, 1.0]])
+        with open(proc_dir / f"VAR{n}", 'wb') as out:
+            _write_record(out, f.tobytes())
+            _write_record(out, grid.tobytes())
+        var_files.append(proc_dir / f"VAR{n}")
+    if var_list:
+        (proc_dir / "varN.list").write_text("".join(f"VAR{n}  {n * DT:.6E}\n" for n in range(N_VAR)))
+    return var_files
+
+
+def test_command_line_overrides_config():
+    error_config = {'var_stride': 2, 't_min': 0.1, 'max_snapshots': 5, 'analyze_variables': ['rho']}
+    overrides = {'var_stride': 3, 't_min': None, 't_max': 0.5, 'metrics': ['l1']}
+    assert resolve_snapshot_selection(error_config, overrides) == {'var_stride': 3, 't_min': 0.1, 't_max': 0.5,
+                                                                   'max_snapshots': 5}
+    assert resolve_snapshot_selection(error_config) == {'var_stride': 2, 't_min': 0.1, 'max_snapshots': 5}
+    assert resolve_snapshot_selection({'var_stride': None}, {'t_max': None}) == {}
+
+
+@pytest.mark.parametrize('error_config, overrides', [
+    ({'var_stride': 0}, None),
+    ({'var_stride': 2}, {'var_stride': 0}),
+    ({}, {'max_snapshots': 0}),
+    ({'t_min': 0.5}, {'t_max': 0.2}),
+])
+def test_invalid_selection_raises(error_config, overrides):
+    with pytest.raises(ValueError):
+        resolve_snapshot_selection(error_config, overrides)
+
+
+@pytest.mark.parametrize('max_snapshots', range(2, N_VAR + 2))
+def test_max_snapshots_spreads_evenly(tmp_path, max_snapshots):
+    var_files = [tmp_path / f"VAR{n}" for n in range(N_VAR)]
+    selected = _select_var_files(var_files, tmp_path, {'max_snapshots': max_snapshots})
+    assert len(selected) == min(max_snapshots, N_VAR)
+    assert selected[0] == var_files[0] and selected[-1] == var_files[-1]
+    gaps = np.diff([var_files.index(p) for p in selected])
+    assert gaps.min() >= 1 and gaps.max() - gaps.min() <= 1
+
+
+@pytest.mark.parametrize('var_list', [True, False])
+@pytest.mark.parametrize('selection, expected', [
+    ({}, list(range(N_VAR))),
+    ({'var_stride': 3}, [0, 3, 6, 9]),
+    ({'t_min': 0.025, 't_max': 0.07}, [3, 4, 5, 6, 7]),
+    # The window applies first, then the stride, then max_snapshots
+    ({'t_min': 0.02, 'var_stride': 2, 'max_snapshots': 3}, [2, 6, 10]),
+])
+def test_time_window_and_stride(tmp_path, var_list, selection, expected):
+    var_files = write_sod_run(tmp_path / "run", var_list)
+    selected = _select_var_files(var_files, tmp_path / "run" / "data", selection)
+    assert selected == [var_files[n] for n in expected]
+
+
+@pytest.mark.parametrize('store', [False, True])
+def test_skipped_files_are_never_opened(tmp_path, monkeypatch, store):
+    run_path = tmp_path / "run"
+    var_files = write_sod_run(run_path)
+    selection = {'t_min': 0.02, 'var_stride': 2, 'max_snapshots': 3}
+    expected = ['VAR2', 'VAR6', 'VAR10']
+    # Skipped files are made unreadable; their times come from varN.list
+    for var_file in var_files:
+        if var_file.name not in expected:
+            var_file.write_bytes(b'')
+
+    read = []
+    native_read = NativeVarReader.read
+
+    def spy(self, var_file_name, *args, **kwargs):
+        read.append(var_file_name)
+        return native_read(self, var_file_name, *args, **kwargs)
+
+    monkeypatch.setattr(NativeVarReader, 'read', spy)
+    store_file = tmp_path / "run.snap" if store else None
+    for _ in range(1 + store):
+        series = analysis_pipeline.load_all_var_files(run_path, store_file=store_file, fast_reader=True,
+                                                      selection=selection)
+        assert list(series.var_files) == expected
+        np.testing.assert_allclose(series.t, [0.02, 0.06, 0.1])
+    # The second pass reads the store, which covers the selected files only
+    assert read == expected
+
+
+@pytest.fixture
+def suite(tmp_path, monkeypatch):
+    """A one-run suite laid out under tmp_path, with the project directories redirected there."""
+    name = 'selection_suite'
+    dirs = SimpleNamespace(root=tmp_path, config=tmp_path / "config", runs=tmp_path / "runs", plan_subdir="plan")
+    monkeypatch.setattr(analysis_pipeline, 'DIRS', dirs)
+    monkeypatch.setattr(analysis_pipeline, 'setup_file_logging', lambda *args: None)
+    for plot in ('create_combined_scores_plot', 'create_per_metric_plots', 'create_best_performers_plot',
+                 'create_branch_comparison_plot', 'create_error_evolution_plots'):
+        monkeypatch.setattr(analysis_pipeline, plot, lambda *args, **kwargs: None)
+
+    plan = {'hpc': {'run_base_dir': str(tmp_path / "hpc")},
+            'error_analysis': {'var_stride': 2, 'max_snapshots': 4}}
+    plan_file = dirs.config / name / "plan" / analysis_pipeline.FILES.plan
+    plan_file.parent.mkdir(parents=True)
+    plan_file.write_text(yaml.safe_dump(plan))
+    (dirs.runs / name).mkdir(parents=True)
+    (dirs.runs / name / analysis_pipeline.FILES.manifest).write_text("run_a\n")
+    write_sod_run(tmp_path / "hpc" / "run_a")
+    return name, tmp_path / "analysis" / name
+
+
+def read_summary(analysis_dir: Path, name: str) -> dict:
+    (summary_file,) = analysis_dir.rglob(f"{name}_error_norms_summary.json")
+    return json.loads(summary_file.read_text())
+
+
+@pytest.mark.parametrize('overrides, expected', [
+    (None, ['VAR0', 'VAR4', 'VAR6', 'VAR10']),
+    ({'t_max': 0.065, 'max_snapshots': None}, ['VAR0', 'VAR2', 'VAR4', 'VAR6']),
+    ({'var_stride': 5}, ['VAR0', 'VAR5', 'VAR10']),
+])
+def test_summary_records_analysed_files(suite, overrides, expected):
+    name, analysis_dir = suite
+    for force in (True, False):
+        # The second pass reads the run store and has to record the same files
+        analysis_pipeline.analyze_suite_with_error_norms(name, metrics=['l1', 'l2'], fast_reader=True,
+                                                         snapshot_selection=overrides, force=force)
+        summary = read_summary(analysis_dir, name)
+        assert summary['snapshot_selection'] == resolve_snapshot_selection(
+            {'var_stride': 2, 'max_snapshots': 4}, overrides)
+        scores = summary['detailed_scores']['run_a']
+        assert scores['var_files'] == expected and scores['n_snapshots'] == len(expected)
@@ -0,0 +1,100 @@
+"""Tests of the consolidated VAR snapshot store (src/analysis/snapshot_store.py)."""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.analysis.snapshot_store import STORE_FIELDS, read_snapshot_store, var_file_signature, write_snapshot_store
+
+
+N_X, N_T = 33, 4
+
+
+@pytest.fixture
+def var_files(tmp_path):
+    files = []
+    for i in range(N_T):
+        var_file = tmp_path / 'data' / 'proc0' / f'VAR{i}'
+        var_file.parent.mkdir(parents=True, exist_ok=True)
+        var_file.write_bytes(b'\0' * 128)
+        files.append(var_file)
+    return files
+
+
+def make_snapshots(n_t: int = N_T, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    x = np.linspace(-0.5, 0.5, N_X)
+    return [{'var_file': f'VAR{i}', 't': 0.01 * i, 'x': x, **{name: rng.random(N_X) for name in STORE_FIELDS}}
+            for i in range(n_t)]
+
+
+@pytest.fixture
+def store_file(tmp_path, var_files):
+    store_file = tmp_path / 'store' / 'run.snap'
+    assert write_snapshot_store(store_file, make_snapshots(), var_file_signature(var_files))
+    return store_file
+
+
+def test_round_trip(store_file, var_files):
+    snapshots = make_snapshots()
+    store = read_snapshot_store(store_file, var_file_signature(var_files))
+    assert store['var_files'] == [s['var_file'] for s in snapshots]
+    np.testing.assert_array_equal(store['x'], snapshots[0]['x'])
+    np.testing.assert_array_equal(store['t'], [s['t'] for s in snapshots])
+    assert set(store['fields']) == set(STORE_FIELDS)
+    for name, values in store['fields'].items():
+        assert isinstance(values, np.memmap) and not values.flags.writeable
+        np.testing.assert_array_equal(values, [s[name] for s in snapshots])
+    # Only the finished store is left behind
+    assert os.listdir(store_file.parent) == [store_file.name]
+
+
+def test_only_common_fields_are_stored(tmp_path, var_files):
+    snapshots = make_snapshots()
+    del snapshots[2]['ee']
+    store_file = tmp_path / 'run.snap'
+    assert write_snapshot_store(store_file, snapshots, var_file_signature(var_files))
+    assert set(read_snapshot_store(store_file, var_file_signature(var_files))['fields']) == {'rho', 'ux', 'pp'}
+
+
+def test_grid_change_is_not_written(tmp_path, var_files):
+    snapshots = make_snapshots()
+    snapshots[1]['x'] = np.linspace(-0.5, 0.5, N_X + 1)
+    store_file = tmp_path / 'run.snap'
+    assert not write_snapshot_store(store_file, snapshots, var_file_signature(var_files))
+    assert list(tmp_path.glob('run.snap*')) == []
+
+
+@pytest.mark.parametrize('change', ['size', 'mtime', 'added', 'renamed'])
+def test_changed_var_files_invalidate(store_file, var_files, change):
+    if change == 'size':
+        var_files[2].write_bytes(b'\0' * 256)
+    elif change == 'mtime':
+        stat = var_files[2].stat()
+        os.utime(var_files[2], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    elif change == 'added':
+        extra = var_files[0].with_name(f'VAR{N_T}')
+        extra.write_bytes(b'\0' * 128)
+        var_files = var_files + [extra]
+    else:
+        var_files[2] = var_files[2].rename(var_files[2].with_name('VAR2.bak'))
+    assert read_snapshot_store(store_file, var_file_signature(var_files)) is None
+
+
+def test_missing_store(tmp_path, var_files):
+    assert read_snapshot_store(tmp_path / 'run.snap', var_file_signature(var_files)) is None
+
+
+@pytest.mark.parametrize('size', [4, 12, 100, -8])
+def test_truncated_store(store_file, var_files, size):
+    data = store_file.read_bytes()
+    store_file.write_bytes(data[:size])
+    assert read_snapshot_store(store_file, var_file_signature(var_files)) is None
+
+
+@pytest.mark.parametrize('content', [b'', b'PK\x03\x04' + b'\0' * 200, b'\x93NUMPY' + b'\0' * 200])
+def test_foreign_file(tmp_path, var_files, content):
+    store_file = tmp_path / 'run.snap'
+    store_file.write_bytes(content)
+    assert read_snapshot_store(store_file, var_file_signature(var_files)) is None
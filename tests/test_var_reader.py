@@ -0,0 +1,199 @@
+"""Tests of the native VAR reader (src/analysis/var_reader.py) on synthetic 1D runs."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.analysis.var_reader import (NativeVarReader, read_dim_file, read_index_file, read_param_file, read_var_time,
+                                     read_var_times)
+
+
+NX, NGHOST = 16, 3
+MX, MY, MZ = NX + 2 * NGHOST, 1 + 2 * NGHOST, 1 + 2 * NGHOST
+TIMES = (0.0, 0.0125, 0.025)
+INDEX = {'ux': 1, 'uy': 2, 'uz': 3, 'lnrho': 4, 'ss': 5}
+
+
+def _write_record(f, payload: bytes):
+    marker = np.array([len(payload)], dtype='<i4').tobytes()
+    f.write(marker + payload + marker)
+
+
+def write_run(data_dir: Path, precision: str = 'D', index: dict = INDEX, density_nolog: bool = False,
+              seed: int = 0) -> dict:
+    """
+    Write a single-processor 1D run the way Pencil Code lays it out.
+
+    Returns:
+        Mapping from VAR file name to the expected trimmed arrays ('t', 'x', 'dx'
+        and one [1, 1, NX] array per field in ``index``)
+    """
+    dtype = np.dtype('<f8' if precision == 'D' else '<f4')
+    proc_dir = data_dir / "proc0"
+    proc_dir.mkdir(parents=True)
+    nvar = max(index.values())
+    dims = f"{MX:8d}{MY:8d}{MZ:8d}{nvar:8d}{0:8d}{0:8d}\n{precision}\n{NGHOST:3d}{NGHOST:3d}{NGHOST:3d}\n"
+    (data_dir / "dim.dat").write_text(dims + "  1  1  1\n")
+    (proc_dir / "dim.dat").write_text(dims + "  0  0  0\n")
+    (data_dir / "index.pro").write_text("".join(f"i{name}={position}\n" for name, position in index.items())
+                                        + f"nname={nvar}\n")
+    (data_dir / "param.nml").write_text("&init_pars\n cvsid='synthetic', "
+                                        f"ldensity_nolog={'T' if density_nolog else 'F'},\n/\n"
+                                        "&eos_init_pars\n gamma=1.4, cs0=1.0, rho0=1.0,\n/\n")
+
+    rng = np.random.default_rng(seed)
+    dx = 1.0 / NX
+    x = (np.arange(MX) - NGHOST + 0.5) * dx - 0.5
+    y, z = np.arange(MY) + 10.0, np.arange(MZ) + 20.0
+    expected = {}
+    for n, t in enumerate(TIMES):
+        # f(mx, my, mz, nvar) in Fortran order is [nvar, mz, my, mx] in C order
+        f = rng.standard_normal((nvar, MZ, MY, MX)).astype(dtype)
+        grid = np.concatenate([[t], x, y, z, [dx, 2.0, 3.0]]).astype(dtype)
+        with open(proc_dir / f"VAR{n}", 'wb') as out:
+            _write_record(out, f.tobytes())
+            _write_record(out, grid.tobytes())
+        trimmed = f[:, NGHOST:-NGHOST, NGHOST:-NGHOST, NGHOST:-NGHOST]
+        expected[f"VAR{n}"] = {
+            't': grid[0], 'x': grid[1 + NGHOST:1 + MX - NGHOST], 'dx': grid[1 + MX + MY + MZ],
+            'y': y[NGHOST:-NGHOST].astype(dtype), 'z': z[NGHOST:-NGHOST].astype(dtype),
+            'dy': grid[2 + MX + MY + MZ], 'dz': grid[3 + MX + MY + MZ],
+            **{name: trimmed[position - 1] for name, position in index.items()},
+        }
+    return expected
+
+
+@pytest.fixture(params=['D', 'S'])
+def run(tmp_path, request):
+    data_dir = tmp_path / "data"
+    return data_dir, write_run(data_dir, request.param), np.dtype('<f8' if request.param == 'D' else '<f4')
+
+
+def test_dim_and_index_files(run):
+    data_dir, _, dtype = run
+    dim = read_dim_file(data_dir / "dim.dat")
+    assert (dim['mx'], dim['my'], dim['mz'], dim['precision']) == (MX, MY, MZ, dtype)
+    assert (dim['nprocx'], dim['nprocy'], dim['nprocz']) == (1, 1, 1)
+    assert read_index_file(data_dir / "index.pro") == {name: position - 1 for name, position in INDEX.items()}
+
+
+def test_read_matches_written_arrays(run):
+    data_dir, expected, dtype = run
+    reader = NativeVarReader(data_dir)
+    for var_file, values in expected.items():
+        var = reader.read(var_file)
+        assert var.t == values['t'] and var.dx == values['dx']
+        assert np.array_equal(var.x, values['x']) and var.x.dtype == dtype
+        assert np.array_equal(var.y, values['y']) and np.array_equal(var.z, values['z'])
+        assert (var.dy, var.dz) == (values['dy'], values['dz'])
+        for name in INDEX:
+            field = getattr(var, name)
+            assert field.shape == (1, 1, NX) and field.dtype == dtype
+            assert np.array_equal(field, values[name])
+
+
+def test_read_selected_fields(run):
+    data_dir, expected, _ = run
+    var = NativeVarReader(data_dir).read("VAR1", fields=['lnrho'])
+    assert np.array_equal(var.lnrho, expected["VAR1"]['lnrho'])
+    assert not hasattr(var, 'ux')
+    with pytest.raises(KeyError):
+        NativeVarReader(data_dir).read("VAR1", fields=['bx'])
+
+
+def test_read_rejects_multiprocessor_runs(run):
+    data_dir, _, _ = run
+    lines = (data_dir / "dim.dat").read_text().splitlines()
+    lines[3] = "  2  1  1"
+    (data_dir / "dim.dat").write_text("\n".join(lines) + "\n")
+    with pytest.raises(ValueError):
+        NativeVarReader(data_dir)
+
+
+def test_read_var_time(run):
+    data_dir, expected, dtype = run
+    for var_file, values in expected.items():
+        assert read_var_time(data_dir / "proc0" / var_file, dtype) == float(values['t'])
+
+
+def test_read_var_times_prefers_var_list(run):
+    data_dir, expected, _ = run
+    var_files = [data_dir / "proc0" / name for name in expected]
+    assert read_var_times(data_dir, var_files) == {name: float(values['t']) for name, values in expected.items()}
+
+    # varN.list wins where it lists a file; the others are read from their headers
+    (data_dir / "proc0" / "varN.list").write_text("VAR0  0.0\nVAR1  1.5D-2\n")
+    times = read_var_times(data_dir, var_files)
+    assert times == {"VAR0": 0.0, "VAR1": 0.015, "VAR2": float(expected["VAR2"]['t'])}
+
+
+@pytest.mark.parametrize('fast_reader', [True, False])
+def test_read_var_primitives_matches_pencil(run, fast_reader):
+    pencil = pytest.importorskip("pencil")
+    from src.workflows import analysis_pipeline
+
+    data_dir, expected, _ = run
+    reader = analysis_pipeline._open_var_reader(str(data_dir), fast_reader)
+    assert (reader is not None) == fast_reader
+    for var_file in expected:
+        fields = analysis_pipeline._read_var_primitives(var_file, str(data_dir), reader)
+        var = pencil.read.var(var_file, datadir=str(data_dir), quiet=True, trimall=True)
+        assert fields['t'] == var.t
+        assert np.array_equal(fields['x'], np.squeeze(var.x))
+        for name in ('lnrho', 'ux', 'ss'):
+            assert np.array_equal(fields[name], np.squeeze(getattr(var, name))), name
+
+
+def test_read_var_primitives_native(run):
+    from src.workflows import analysis_pipeline
+
+    data_dir, expected, _ = run
+    reader = NativeVarReader(data_dir)
+    for var_file, values in expected.items():
+        fields = analysis_pipeline._read_var_primitives(var_file, str(data_dir), reader)
+        assert fields['t'] == values['t'] and fields['var_file'] == var_file
+        assert np.array_equal(fields['x'], values['x'])
+        for name in ('lnrho', 'ux', 'ss'):
+            assert np.array_equal(fields[name], np.squeeze(values[name])), name
+
+
+@pytest.mark.parametrize('density_nolog, index, density', [
+    (False, {**INDEX, 'rho': 4}, 'lnrho'),
+    (True, {**INDEX, 'rho': 4}, 'rho'),
+    (True, INDEX, 'rho'),
+    (True, {'ux': 1, 'uy': 2, 'uz': 3, 'rho': 4, 'ss': 5}, 'rho'),
+])
+def test_density_follows_ldensity_nolog(tmp_path, density_nolog, index, density):
+    from src.workflows import analysis_pipeline
+
+    data_dir = tmp_path / "data"
+    expected = write_run(data_dir, index=index, density_nolog=density_nolog)
+    reader = NativeVarReader(data_dir)
+    assert reader.density_field == density
+
+    stored = np.squeeze(expected["VAR1"]['lnrho' if 'lnrho' in index else 'rho'])
+    fields = analysis_pipeline._read_var_primitives("VAR1", str(data_dir), reader)
+    assert set(fields) & {'rho', 'lnrho'} == {density}
+    assert np.array_equal(fields[density], stored)
+
+    derived = analysis_pipeline._derive_variables(fields, None, ['rho'])
+    assert np.array_equal(derived['rho'], stored if density == 'rho' else np.exp(stored))
+
+
+def test_read_param_file_ignores_param2(tmp_path):
+    data_dir = tmp_path / "data"
+    write_run(data_dir)
+    # Run parameters that disagree with the start parameters, as pencil.read.param
+    # only reads them with param2=True
+    (data_dir / "param2.nml").write_text("&run_pars\n cvsid='run', nu=0.01,\n/\n"
+                                         "&eos_run_pars\n gamma=1.6667, ldensity_nolog=T,\n/\n")
+    params = read_param_file(data_dir)
+    assert params.cvsid == 'synthetic' and params.gamma == 1.4 and params.ldensity_nolog is False
+    assert not hasattr(params, 'nu')
+    assert NativeVarReader(data_dir).density_field == 'lnrho'
+
+
+def test_read_param_file_requires_param_nml(tmp_path):
+    with pytest.raises(FileNotFoundError, match='param.nml'):
+        read_param_file(tmp_path)